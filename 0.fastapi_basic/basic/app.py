@@ -36,11 +36,9 @@ def test_read_main():
     # Content-Type이 application/json인지 확인
     assert response.headers["content-type"] == "application/json", f"Expected content-type 'application/json', but got {response.headers['content-type']}"
     
-    # 5. 성능 검증
-    # 응답 시간이 0.5초(500ms) 미만인지 확인
-    assert response.elapsed.total_seconds() < 0.5, f"Response time exceeded 500ms: {response.elapsed.total_seconds()}s"
-    
-    # 6. 테스트 결과 출력
+    # 5. 테스트 결과 출력
+    # 응답 시간은 실행 환경에 따라 달라지므로 여기서 검증하지 않음
+    # (성능 측정은 저장소 루트의 asgi_benchmarks 스위트에서: python -m asgi_benchmarks 0)
     # 상세한 응답 정보를 콘솔에 출력
     print(f"Status Code: {response.status_code}")
     print(f"Response JSON: {response_json}")
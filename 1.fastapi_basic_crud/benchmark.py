@@ -0,0 +1,91 @@
+# 도서 저장소 벤치마크
+# 저장된 도서 수(1천 ~ 1백만)를 늘려가며 각 핸들러의 지연 시간을 측정합니다.
+# 해시 인덱스 기반 저장소라면 도서 수와 관계없이 지연 시간이 일정해야 합니다.
+#
+# 실행: python benchmark.py [--sizes 1000 10000 100000 1000000] [--ops 2000]
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import main
+from main import Book, BookStore
+
+
+def build_store(size: int) -> BookStore:
+    """size권의 도서가 저장된 저장소를 만듭니다 (검증을 생략해 빠르게 채움)."""
+    store = BookStore()
+    for i in range(1, size + 1):
+        store.add(
+            Book.construct(
+                id=i,
+                title=f"Book {i}",
+                author=f"Author {i % 1000}",
+                published_year=2000 + i % 25,
+                isbn=f"isbn-{i}",
+                description=None,
+            )
+        )
+    return store
+
+
+def measure(loop: asyncio.AbstractEventLoop, make_call: Callable, ops: int) -> Dict[str, float]:
+    """핸들러 호출을 ops번 실행하고 지연 시간 통계(마이크로초)를 반환합니다."""
+    samples: List[float] = []
+    for i in range(ops):
+        coro = make_call(i)
+        start = time.perf_counter()
+        loop.run_until_complete(coro)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p99": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def run(size: int, ops: int, loop: asyncio.AbstractEventLoop) -> Dict[str, Dict[str, float]]:
+    main.books = build_store(size)
+    rng = random.Random(size)
+    existing = [rng.randint(1, size) for _ in range(ops)]
+    new_ids = list(range(size + 1, size + ops + 1))
+
+    def new_book(book_id: int) -> Book:
+        return Book(
+            id=book_id,
+            title="Benchmark",
+            author="Bench",
+            published_year=2024,
+            isbn=f"bench-{book_id}",
+        )
+
+    results = {}
+    results["read"] = measure(loop, lambda i: main.read_book(existing[i]), ops)
+    results["create"] = measure(loop, lambda i: main.create_book(new_book(new_ids[i])), ops)
+    results["update"] = measure(
+        loop, lambda i: main.update_book(new_ids[i], new_book(new_ids[i])), ops
+    )
+    results["delete"] = measure(loop, lambda i: main.delete_book(new_ids[i]), ops)
+    return results
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="도서 저장소 핸들러 지연 시간 벤치마크")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--ops", type=int, default=2000, help="크기별 작업당 반복 횟수")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    print(f"{'books':>10} {'op':>7} {'p50(us)':>9} {'p99(us)':>9}")
+    for size in args.sizes:
+        for op, stats in run(size, args.ops, loop).items():
+            print(f"{size:>10} {op:>7} {stats['p50']:>9.1f} {stats['p99']:>9.1f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -1,8 +1,13 @@
 # 필요한 모듈 임포트
 from fastapi import FastAPI, HTTPException  # FastAPI 프레임워크와 예외 처리를 위한 모듈
+from fastapi.concurrency import run_in_threadpool  # 블로킹 호출을 스레드풀에서 실행하기 위한 함수
 from pydantic import BaseModel      # 데이터 검증을 위한 Pydantic 모델
-from typing import List, Optional   # 타입 힌트를 위한 typing 모듈
+from typing import Any, Callable, Dict, Iterator, List, Optional   # 타입 힌트를 위한 typing 모듈
 from datetime import datetime       # 날짜/시간 처리를 위한 datetime 모듈
+from contextlib import contextmanager  # SQLite 트랜잭션 컨텍스트 매니저
+from threading import RLock         # 연결 하나를 여러 스레드가 공유할 때 사용하는 락
+import os                           # 환경변수(BOOK_DB_PATH)를 읽기 위한 모듈
+import sqlite3                      # 여러 프로세스가 공유하는 SQLite 파일 저장소
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI()
@@ -16,8 +21,218 @@ class Book(BaseModel):
     isbn: str                       # ISBN 번호
     description: Optional[str] = None  # 책 설명 (선택적)
 
+# 인메모리 도서 저장소
+# id → Book 해시 인덱스와 ISBN → id 유니크 인덱스를 함께 관리하여
+# 조회/수정/삭제가 도서 수와 관계없이 O(1)에 처리되도록 함
+class BookStore:
+    def __init__(self):
+        self._books: Dict[int, Book] = {}   # id → Book (dict는 삽입 순서 유지)
+        self._isbn_index: Dict[str, int] = {}  # ISBN → id (유니크 인덱스)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def __contains__(self, book_id: int) -> bool:
+        return book_id in self._books
+
+    def all(self) -> List[Book]:
+        """저장된 모든 책을 삽입 순서대로 반환합니다."""
+        return list(self._books.values())
+
+    def get(self, book_id: int) -> Optional[Book]:
+        """ID로 책을 찾습니다. 없으면 None을 반환합니다."""
+        return self._books.get(book_id)
+
+    def get_by_isbn(self, isbn: str) -> Optional[Book]:
+        """ISBN으로 책을 찾습니다. 없으면 None을 반환합니다."""
+        book_id = self._isbn_index.get(isbn)
+        return None if book_id is None else self._books[book_id]
+
+    def add(self, book: Book) -> Book:
+        """
+        새 책을 저장합니다.
+        - raises: 400 Bad Request (ID 또는 ISBN 중복 시)
+        """
+        if book.id in self._books:
+            raise HTTPException(status_code=400, detail="Book ID already exists")
+        if book.isbn in self._isbn_index:
+            raise HTTPException(status_code=400, detail="ISBN already exists")
+        self._books[book.id] = book
+        self._isbn_index[book.isbn] = book.id
+        return book
+
+    def replace(self, book_id: int, book: Book) -> Optional[Book]:
+        """
+        book_id의 책을 새 정보로 교체합니다. 책이 없으면 None을 반환합니다.
+        - raises: 400 Bad Request (변경된 ID 또는 ISBN이 다른 책과 중복될 때)
+        """
+        current = self._books.get(book_id)
+        if current is None:
+            return None
+        if book.id != book_id and book.id in self._books:
+            raise HTTPException(status_code=400, detail="Book ID already exists")
+        owner = self._isbn_index.get(book.isbn)
+        if owner is not None and owner != book_id:
+            raise HTTPException(status_code=400, detail="ISBN already exists")
+        del self._isbn_index[current.isbn]
+        if book.id != book_id:
+            # ID가 바뀌어도 기존 위치(삽입 순서)를 유지하도록 dict를 다시 구성
+            self._books = {
+                (book.id if key == book_id else key): (book if key == book_id else value)
+                for key, value in self._books.items()
+            }
+        else:
+            self._books[book_id] = book
+        self._isbn_index[book.isbn] = book.id
+        return book
+
+    def remove(self, book_id: int) -> Optional[Book]:
+        """책을 삭제하고 삭제된 책을 반환합니다. 없으면 None을 반환합니다."""
+        book = self._books.pop(book_id, None)
+        if book is not None:
+            del self._isbn_index[book.isbn]
+        return book
+
+# SQLite 파일 도서 저장소
+# BookStore와 같은 인터페이스를 제공하며, 데이터를 SQLite 파일에 저장하므로
+# `uvicorn --workers N`으로 띄운 여러 프로세스가 같은 도서 목록을 공유함
+# (인메모리 BookStore는 프로세스마다 따로 존재하여 워커마다 다른 목록을 보게 됨)
+# 다른 프로세스의 쓰기 잠금을 기다릴 수 있으므로 엔드포인트에서는 run_store로 스레드풀에서 호출함
+class SQLiteBookStore:
+    # 조회 컬럼 (Book 필드 순서와 같음)
+    _COLUMNS = ("id", "title", "author", "published_year", "isbn", "description")
+    _SELECT = "SELECT id, title, author, published_year, isbn, description FROM books"
+
+    def __init__(self, path: str, seed: Optional[List[Book]] = None):
+        # 연결 하나를 모든 요청 스레드가 공유하므로 락으로 보호
+        self._lock = RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL: 쓰기 중에도 다른 프로세스가 읽을 수 있음
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # 다른 프로세스가 쓰는 중이면 바로 실패하지 않고 최대 5초 대기
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        with self._transaction():
+            # seq: 삽입 순서 (all()의 정렬 기준), id와 isbn은 유니크 인덱스
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS books ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, id INTEGER NOT NULL UNIQUE, "
+                "title TEXT NOT NULL, author TEXT NOT NULL, published_year INTEGER NOT NULL, "
+                "isbn TEXT NOT NULL UNIQUE, description TEXT)"
+            )
+            # 샘플 데이터는 파일을 처음 만들 때 한 번만 추가 (user_version으로 표시)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+                for book in seed or []:
+                    self._insert(book)
+                self._conn.execute("PRAGMA user_version = 1")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        쓰기 트랜잭션
+        BEGIN IMMEDIATE로 시작 시점에 쓰기 잠금을 잡으므로, 확인과 변경 사이에
+        다른 프로세스의 쓰기가 끼어들지 않음
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @classmethod
+    def _to_book(cls, row: tuple) -> Book:
+        # DB에 저장된 값은 이미 검증된 값이므로 검증 없이 모델 생성
+        return Book.construct(**dict(zip(cls._COLUMNS, row)))
+
+    def _insert(self, book: Book) -> None:
+        """책을 추가합니다. (트랜잭션 안에서 호출)"""
+        self._conn.execute(
+            "INSERT INTO books (id, title, author, published_year, isbn, description) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (book.id, book.title, book.author, book.published_year, book.isbn, book.description),
+        )
+
+    def _exists(self, book_id: int) -> bool:
+        return self._conn.execute("SELECT 1 FROM books WHERE id = ?", (book_id,)).fetchone() is not None
+
+    def _isbn_owner(self, isbn: str) -> Optional[int]:
+        row = self._conn.execute("SELECT id FROM books WHERE isbn = ?", (isbn,)).fetchone()
+        return None if row is None else row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def __contains__(self, book_id: int) -> bool:
+        with self._lock:
+            return self._exists(book_id)
+
+    def all(self) -> List[Book]:
+        """저장된 모든 책을 삽입 순서대로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(f"{self._SELECT} ORDER BY seq").fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def get(self, book_id: int) -> Optional[Book]:
+        """ID로 책을 찾습니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(f"{self._SELECT} WHERE id = ?", (book_id,)).fetchone()
+        return None if row is None else self._to_book(row)
+
+    def get_by_isbn(self, isbn: str) -> Optional[Book]:
+        """ISBN으로 책을 찾습니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(f"{self._SELECT} WHERE isbn = ?", (isbn,)).fetchone()
+        return None if row is None else self._to_book(row)
+
+    def add(self, book: Book) -> Book:
+        """
+        새 책을 저장합니다.
+        - raises: 400 Bad Request (ID 또는 ISBN 중복 시)
+        """
+        with self._transaction():
+            if self._exists(book.id):
+                raise HTTPException(status_code=400, detail="Book ID already exists")
+            if self._isbn_owner(book.isbn) is not None:
+                raise HTTPException(status_code=400, detail="ISBN already exists")
+            self._insert(book)
+        return book
+
+    def replace(self, book_id: int, book: Book) -> Optional[Book]:
+        """
+        book_id의 책을 새 정보로 교체합니다. 책이 없으면 None을 반환합니다.
+        - raises: 400 Bad Request (변경된 ID 또는 ISBN이 다른 책과 중복될 때)
+        """
+        with self._transaction():
+            if not self._exists(book_id):
+                return None
+            if book.id != book_id and self._exists(book.id):
+                raise HTTPException(status_code=400, detail="Book ID already exists")
+            owner = self._isbn_owner(book.isbn)
+            if owner is not None and owner != book_id:
+                raise HTTPException(status_code=400, detail="ISBN already exists")
+            # 기존 위치(seq)를 유지한 채 교체 (BookStore와 같음)
+            self._conn.execute(
+                "UPDATE books SET id = ?, title = ?, author = ?, published_year = ?, "
+                "isbn = ?, description = ? WHERE id = ?",
+                (book.id, book.title, book.author, book.published_year, book.isbn,
+                 book.description, book_id),
+            )
+        return book
+
+    def remove(self, book_id: int) -> Optional[Book]:
+        """책을 삭제하고 삭제된 책을 반환합니다. 없으면 None을 반환합니다."""
+        with self._transaction():
+            row = self._conn.execute(f"{self._SELECT} WHERE id = ?", (book_id,)).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        return None if row is None else self._to_book(row)
+
+
 # 테스트를 위한 샘플 데이터
-books = [
+sample_books = [
     Book(
         id=1,
         title="Python Programming",
@@ -33,9 +248,30 @@ books = [
         published_year=2024,
         isbn="978-0987654321",
         description="Learn FastAPI development"
-    )
+    ),
 ]
 
+# 저장소 선택
+# BOOK_DB_PATH를 지정하면 SQLite 파일 저장소를 사용하여 여러 워커 프로세스가 데이터를 공유함
+#   예) BOOK_DB_PATH=books.db uvicorn main:app --workers 4
+# 지정하지 않으면 인메모리 저장소 (단일 프로세스 전용)
+if os.environ.get("BOOK_DB_PATH"):
+    books = SQLiteBookStore(os.environ["BOOK_DB_PATH"], seed=sample_books)
+else:
+    books = BookStore()
+    for sample_book in sample_books:
+        books.add(sample_book)
+
+async def run_store(method: Callable[..., Any], *args: Any) -> Any:
+    """
+    저장소 메서드를 호출합니다.
+    SQLite 저장소는 다른 프로세스의 쓰기 잠금을 최대 5초까지 기다릴 수 있으므로
+    이벤트 루프가 멈추지 않도록 스레드풀에서 실행하고, 인메모리 저장소는 바로 호출합니다.
+    """
+    if isinstance(getattr(method, "__self__", None), SQLiteBookStore):
+        return await run_in_threadpool(method, *args)
+    return method(*args)
+
 # 1. Create (POST /books/)
 @app.post("/books/", response_model=Book)
 async def create_book(book: Book):
@@ -43,15 +279,10 @@ async def create_book(book: Book):
     새로운 책을 생성합니다.
     - book: 생성할 책의 정보
     - returns: 생성된 책 정보
-    - raises: 400 Bad Request (ID 중복 시)
+    - raises: 400 Bad Request (ID 또는 ISBN 중복 시)
     """
-    # ID 중복 검사
-    for existing_book in books:
-        if existing_book.id == book.id:
-            raise HTTPException(status_code=400, detail="Book ID already exists")
-    # 새 책 추가
-    books.append(book)
-    return book
+    # 중복 검사 후 새 책 추가 (해시 인덱스로 O(1) 검사)
+    return await run_store(books.add, book)
 
 # 2. Read - 모든 책 조회 (GET /books/)
 @app.get("/books/", response_model=List[Book])
@@ -60,7 +291,7 @@ async def read_books():
     모든 책 목록을 반환합니다.
     - returns: 책 목록
     """
-    return books
+    return await run_store(books.all)
 
 # 3. Read - 특정 책 조회 (GET /books/{book_id})
 @app.get("/books/{book_id}", response_model=Book)
@@ -71,9 +302,9 @@ async def read_book(book_id: int):
     - returns: 찾은 책 정보
     - raises: 404 Not Found (책을 찾지 못한 경우)
     """
-    for book in books:
-        if book.id == book_id:
-            return book
+    book = await run_store(books.get, book_id)
+    if book is not None:
+        return book
     raise HTTPException(status_code=404, detail="Book not found")
 
 # 4. Update (PUT /books/{book_id})
@@ -85,11 +316,10 @@ async def update_book(book_id: int, updated_book: Book):
     - updated_book: 새로운 책 정보
     - returns: 업데이트된 책 정보
     - raises: 404 Not Found (책을 찾지 못한 경우)
+    - raises: 400 Bad Request (변경된 ID 또는 ISBN이 중복될 때)
     """
-    for i, book in enumerate(books):
-        if book.id == book_id:
-            books[i] = updated_book
-            return updated_book
+    if await run_store(books.replace, book_id, updated_book) is not None:
+        return updated_book
     raise HTTPException(status_code=404, detail="Book not found")
 
 # 5. Delete (DELETE /books/{book_id})
@@ -101,8 +331,6 @@ async def delete_book(book_id: int):
     - returns: 삭제 성공 메시지
     - raises: 404 Not Found (책을 찾지 못한 경우)
     """
-    for i, book in enumerate(books):
-        if book.id == book_id:
-            books.pop(i)
-            return {"message": "Book deleted successfully"}
+    if await run_store(books.remove, book_id) is not None:
+        return {"message": "Book deleted successfully"}
     raise HTTPException(status_code=404, detail="Book not found")
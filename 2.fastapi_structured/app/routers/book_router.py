@@ -1,7 +1,10 @@
+import os
 from fastapi import APIRouter, Depends
-from typing import List
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, Callable, List, Optional
 from app.models.book import Book
 from app.services.book_service import BookService
+from app.services.sqlite_book_service import SQLiteBookService
 
 # 라우터 생성
 router = APIRouter(
@@ -10,14 +13,48 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def _create_book_service():
+    """저장소 선택
+
+    BOOK_DB_PATH를 지정하면 SQLite 파일에 저장하여 여러 워커 프로세스가 데이터를 공유합니다.
+    (예: BOOK_DB_PATH=books.db uvicorn app.main:app --workers 4)
+    지정하지 않으면 인메모리 저장소를 사용합니다. (단일 프로세스 전용)
+    """
+    path = os.environ.get("BOOK_DB_PATH")
+    return SQLiteBookService(path) if path else BookService()
+
+# 프로세스 전체에서 공유하는 서비스 인스턴스
+# 요청마다 새로 만들면 초기 데이터가 매번 다시 생성되고 쓰기 내용이 사라짐
+_book_service = _create_book_service()
+
 # 서비스 의존성 주입을 위한 함수
 def get_book_service():
-    return BookService()
+    return _book_service
+
+async def run_service(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """서비스 메서드 호출
+
+    SQLite 서비스는 다른 프로세스의 쓰기 잠금을 최대 5초까지 기다릴 수 있으므로
+    이벤트 루프가 멈추지 않도록 스레드풀에서 실행합니다. 인메모리 서비스는 바로 호출합니다.
+    """
+    if isinstance(getattr(method, "__self__", None), SQLiteBookService):
+        return await run_in_threadpool(method, *args, **kwargs)
+    return method(*args, **kwargs)
 
 @router.get("/", response_model=List[Book])
-async def read_books(book_service: BookService = Depends(get_book_service)):
-    """모든 책 목록을 조회합니다."""
-    return book_service.get_all_books()
+async def read_books(
+    author: Optional[str] = None,
+    isbn: Optional[str] = None,
+    published_year: Optional[int] = None,
+    book_service: BookService = Depends(get_book_service)
+):
+    """책 목록을 조회합니다.
+
+    author, isbn, published_year를 지정하면 보조 인덱스로 필터링합니다.
+    """
+    return await run_service(
+        book_service.find_books, author=author, isbn=isbn, published_year=published_year
+    )
 
 @router.get("/{book_id}", response_model=Book)
 async def read_book(
@@ -25,7 +62,7 @@ async def read_book(
     book_service: BookService = Depends(get_book_service)
 ):
     """특정 ID의 책을 조회합니다."""
-    return book_service.get_book_by_id(book_id)
+    return await run_service(book_service.get_book_by_id, book_id)
 
 @router.post("/", response_model=Book)
 async def create_book(
@@ -33,7 +70,7 @@ async def create_book(
     book_service: BookService = Depends(get_book_service)
 ):
     """새로운 책을 생성합니다."""
-    return book_service.create_book(book)
+    return await run_service(book_service.create_book, book)
 
 @router.put("/{book_id}", response_model=Book)
 async def update_book(
@@ -42,7 +79,7 @@ async def update_book(
     book_service: BookService = Depends(get_book_service)
 ):
     """특정 ID의 책을 업데이트합니다."""
-    return book_service.update_book(book_id, book)
+    return await run_service(book_service.update_book, book_id, book)
 
 @router.delete("/{book_id}")
 async def delete_book(
@@ -50,4 +87,4 @@ async def delete_book(
     book_service: BookService = Depends(get_book_service)
 ):
     """특정 ID의 책을 삭제합니다."""
-    return book_service.delete_book(book_id)
+    return await run_service(book_service.delete_book, book_id)
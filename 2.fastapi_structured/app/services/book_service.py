@@ -1,103 +1,194 @@
-from typing import List, Optional
+from threading import RLock
+from typing import Dict, Hashable, List, Optional, Set
 from fastapi import HTTPException
 from app.models.book import Book
 
+# 테스트용 초기 데이터
+SAMPLE_BOOKS = (
+    Book(
+        id=1,
+        title="Python Programming",
+        author="John Doe",
+        published_year=2023,
+        isbn="978-1234567890",
+        description="A comprehensive guide to Python"
+    ),
+    Book(
+        id=2,
+        title="FastAPI Master",
+        author="Jane Smith",
+        published_year=2024,
+        isbn="978-0987654321",
+        description="Learn FastAPI development"
+    ),
+)
+
 class BookService:
-    """책 관련 비즈니스 로직을 처리하는 서비스 클래스"""
-    
+    """책 관련 비즈니스 로직을 처리하는 서비스 클래스
+
+    프로세스 전체에서 하나의 인스턴스를 공유하도록 설계되었습니다.
+    모든 읽기/쓰기는 락으로 보호되며, id 기본 인덱스 외에
+    저자, ISBN, 출판년도 보조 인덱스를 함께 관리합니다.
+    """
+
     def __init__(self):
+        self._lock = RLock()
+        # 기본 인덱스: id → Book (dict는 삽입 순서를 유지)
+        self._books: Dict[int, Book] = {}
+        # 보조 인덱스: 값 → 해당 값을 가진 책 id 집합
+        self._by_author: Dict[str, Set[int]] = {}
+        self._by_isbn: Dict[str, Set[int]] = {}
+        self._by_year: Dict[int, Set[int]] = {}
+
         # 테스트용 초기 데이터
-        self.books: List[Book] = [
-            Book(
-                id=1,
-                title="Python Programming",
-                author="John Doe",
-                published_year=2023,
-                isbn="978-1234567890",
-                description="A comprehensive guide to Python"
-            ),
-            Book(
-                id=2,
-                title="FastAPI Master",
-                author="Jane Smith",
-                published_year=2024,
-                isbn="978-0987654321",
-                description="Learn FastAPI development"
-            )
-        ]
-    
+        for book in SAMPLE_BOOKS:
+            self._insert(book)
+
+    @staticmethod
+    def _index_add(index: Dict[Hashable, Set[int]], key: Hashable, book_id: int) -> None:
+        index.setdefault(key, set()).add(book_id)
+
+    @staticmethod
+    def _index_discard(index: Dict[Hashable, Set[int]], key: Hashable, book_id: int) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(book_id)
+            if not ids:
+                del index[key]
+
+    def _insert(self, book: Book) -> None:
+        """기본 인덱스와 보조 인덱스에 책을 등록합니다. (락을 잡은 상태에서 호출)"""
+        self._books[book.id] = book
+        self._index_add(self._by_author, book.author, book.id)
+        self._index_add(self._by_isbn, book.isbn, book.id)
+        self._index_add(self._by_year, book.published_year, book.id)
+
+    def _remove(self, book_id: int) -> Book:
+        """기본 인덱스와 보조 인덱스에서 책을 제거합니다. (락을 잡은 상태에서 호출)"""
+        book = self._books.pop(book_id)
+        self._index_discard(self._by_author, book.author, book_id)
+        self._index_discard(self._by_isbn, book.isbn, book_id)
+        self._index_discard(self._by_year, book.published_year, book_id)
+        return book
+
     def get_all_books(self) -> List[Book]:
         """모든 책 목록을 반환합니다."""
-        return self.books
-    
+        with self._lock:
+            return list(self._books.values())
+
+    def find_books(
+        self,
+        author: Optional[str] = None,
+        isbn: Optional[str] = None,
+        published_year: Optional[int] = None,
+    ) -> List[Book]:
+        """보조 인덱스를 사용해 조건에 맞는 책 목록을 반환합니다.
+
+        지정된 조건들은 AND로 결합되며, 조건이 없으면 모든 책을 반환합니다.
+
+        Args:
+            author: 저자 이름 (정확히 일치)
+            isbn: ISBN 번호 (정확히 일치)
+            published_year: 출판년도
+
+        Returns:
+            List[Book]: 조건에 맞는 책 목록 (id 순)
+        """
+        with self._lock:
+            candidates = []
+            if author is not None:
+                candidates.append(self._by_author.get(author, set()))
+            if isbn is not None:
+                candidates.append(self._by_isbn.get(isbn, set()))
+            if published_year is not None:
+                candidates.append(self._by_year.get(published_year, set()))
+            if not candidates:
+                # 조건이 없을 때도 삽입 순서가 아닌 id 순으로 반환
+                return [self._books[book_id] for book_id in sorted(self._books)]
+            # 가장 작은 후보 집합을 기준으로 나머지 집합과 교집합을 구함
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            return [self._books[book_id] for book_id in sorted(ids)]
+
     def get_book_by_id(self, book_id: int) -> Book:
         """ID로 특정 책을 찾아 반환합니다.
-        
+
         Args:
             book_id: 찾으려는 책의 ID
-            
+
         Returns:
             Book: 찾은 책 객체
-            
+
         Raises:
             HTTPException: 책을 찾지 못한 경우
         """
-        for book in self.books:
-            if book.id == book_id:
-                return book
-        raise HTTPException(status_code=404, detail="Book not found")
-    
+        with self._lock:
+            book = self._books.get(book_id)
+        if book is None:
+            raise HTTPException(status_code=404, detail="Book not found")
+        return book
+
     def create_book(self, book: Book) -> Book:
         """새로운 책을 생성합니다.
-        
+
         Args:
             book: 생성할 책 정보
-            
+
         Returns:
             Book: 생성된 책 객체
-            
+
         Raises:
             HTTPException: ID가 중복되는 경우
         """
-        for existing_book in self.books:
-            if existing_book.id == book.id:
+        with self._lock:
+            if book.id in self._books:
                 raise HTTPException(status_code=400, detail="Book ID already exists")
-        self.books.append(book)
+            self._insert(book)
         return book
-    
+
     def update_book(self, book_id: int, updated_book: Book) -> Book:
         """책 정보를 업데이트합니다.
-        
+
         Args:
             book_id: 업데이트할 책의 ID
             updated_book: 새로운 책 정보
-            
+
         Returns:
             Book: 업데이트된 책 객체
-            
+
         Raises:
-            HTTPException: 책을 찾지 못한 경우
+            HTTPException: 책을 찾지 못했거나 변경된 ID가 중복되는 경우
         """
-        for i, book in enumerate(self.books):
-            if book.id == book_id:
-                self.books[i] = updated_book
-                return updated_book
-        raise HTTPException(status_code=404, detail="Book not found")
-    
+        with self._lock:
+            if book_id not in self._books:
+                raise HTTPException(status_code=404, detail="Book not found")
+            if updated_book.id != book_id and updated_book.id in self._books:
+                raise HTTPException(status_code=400, detail="Book ID already exists")
+            if updated_book.id == book_id:
+                # 같은 id면 기존 위치를 유지한 채 보조 인덱스만 갱신
+                old = self._books[book_id]
+                self._index_discard(self._by_author, old.author, book_id)
+                self._index_discard(self._by_isbn, old.isbn, book_id)
+                self._index_discard(self._by_year, old.published_year, book_id)
+            else:
+                self._remove(book_id)
+            self._insert(updated_book)
+        return updated_book
+
     def delete_book(self, book_id: int) -> dict:
         """책을 삭제합니다.
-        
+
         Args:
             book_id: 삭제할 책의 ID
-            
+
         Returns:
             dict: 삭제 성공 메시지
-            
+
         Raises:
             HTTPException: 책을 찾지 못한 경우
         """
-        for i, book in enumerate(self.books):
-            if book.id == book_id:
-                self.books.pop(i)
-                return {"message": "Book deleted successfully"}
-        raise HTTPException(status_code=404, detail="Book not found")
+        with self._lock:
+            if book_id not in self._books:
+                raise HTTPException(status_code=404, detail="Book not found")
+            self._remove(book_id)
+        return {"message": "Book deleted successfully"}
@@ -0,0 +1,198 @@
+import sqlite3
+from contextlib import contextmanager
+from threading import RLock
+from typing import Iterator, List, Optional
+from fastapi import HTTPException
+from app.models.book import Book
+from app.services.book_service import SAMPLE_BOOKS
+
+class SQLiteBookService:
+    """SQLite 파일에 책을 저장하는 서비스 클래스
+
+    BookService와 같은 메서드를 제공합니다. 데이터가 프로세스 메모리가 아닌 파일에 있으므로
+    `uvicorn --workers N`으로 띄운 여러 워커 프로세스가 같은 책 목록을 공유합니다.
+    id 기본 인덱스 외에 저자, ISBN, 출판년도 인덱스를 만들어 find_books 조건 검색에 사용합니다.
+    다른 프로세스의 쓰기 잠금을 기다릴 수 있으므로 라우터에서는 스레드풀에서 호출합니다.
+    """
+
+    # 조회 컬럼 (Book 필드 순서와 같음)
+    _COLUMNS = ("id", "title", "author", "published_year", "isbn", "description")
+    _SELECT = "SELECT id, title, author, published_year, isbn, description FROM books"
+
+    def __init__(self, path: str):
+        # 연결 하나를 모든 요청 스레드가 공유하므로 락으로 보호
+        self._lock = RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL: 쓰기 중에도 다른 프로세스가 읽을 수 있음
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # 다른 프로세스가 쓰는 중이면 바로 실패하지 않고 최대 5초 대기
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        with self._transaction():
+            # seq: 삽입 순서 (get_all_books의 정렬 기준)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS books ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, id INTEGER NOT NULL UNIQUE, "
+                "title TEXT NOT NULL, author TEXT NOT NULL, published_year INTEGER NOT NULL, "
+                "isbn TEXT NOT NULL, description TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_books_author ON books (author)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_books_isbn ON books (isbn)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_books_year ON books (published_year)")
+            # 테스트용 초기 데이터는 파일을 처음 만들 때 한 번만 추가 (user_version으로 표시)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+                for book in SAMPLE_BOOKS:
+                    self._insert(book)
+                self._conn.execute("PRAGMA user_version = 1")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """쓰기 트랜잭션
+
+        BEGIN IMMEDIATE로 시작 시점에 쓰기 잠금을 잡으므로, 확인과 변경 사이에
+        다른 프로세스의 쓰기가 끼어들지 않습니다.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @classmethod
+    def _to_book(cls, row: tuple) -> Book:
+        # DB에 저장된 값은 이미 검증된 값이므로 검증 없이 모델 생성
+        return Book.construct(**dict(zip(cls._COLUMNS, row)))
+
+    def _insert(self, book: Book) -> None:
+        """책을 추가합니다. (트랜잭션 안에서 호출)"""
+        self._conn.execute(
+            "INSERT INTO books (id, title, author, published_year, isbn, description) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (book.id, book.title, book.author, book.published_year, book.isbn, book.description),
+        )
+
+    def _exists(self, book_id: int) -> bool:
+        return self._conn.execute("SELECT 1 FROM books WHERE id = ?", (book_id,)).fetchone() is not None
+
+    def get_all_books(self) -> List[Book]:
+        """모든 책 목록을 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(f"{self._SELECT} ORDER BY seq").fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def find_books(
+        self,
+        author: Optional[str] = None,
+        isbn: Optional[str] = None,
+        published_year: Optional[int] = None,
+    ) -> List[Book]:
+        """인덱스를 사용해 조건에 맞는 책 목록을 반환합니다.
+
+        지정된 조건들은 AND로 결합되며, 조건이 없으면 모든 책을 반환합니다.
+
+        Args:
+            author: 저자 이름 (정확히 일치)
+            isbn: ISBN 번호 (정확히 일치)
+            published_year: 출판년도
+
+        Returns:
+            List[Book]: 조건에 맞는 책 목록 (id 순)
+        """
+        conditions = []
+        params = []
+        for column, value in (("author", author), ("isbn", isbn), ("published_year", published_year)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._conn.execute(f"{self._SELECT}{where} ORDER BY id", params).fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def get_book_by_id(self, book_id: int) -> Book:
+        """ID로 특정 책을 찾아 반환합니다.
+
+        Args:
+            book_id: 찾으려는 책의 ID
+
+        Returns:
+            Book: 찾은 책 객체
+
+        Raises:
+            HTTPException: 책을 찾지 못한 경우
+        """
+        with self._lock:
+            row = self._conn.execute(f"{self._SELECT} WHERE id = ?", (book_id,)).fetchone()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Book not found")
+        return self._to_book(row)
+
+    def create_book(self, book: Book) -> Book:
+        """새로운 책을 생성합니다.
+
+        Args:
+            book: 생성할 책 정보
+
+        Returns:
+            Book: 생성된 책 객체
+
+        Raises:
+            HTTPException: ID가 중복되는 경우
+        """
+        with self._transaction():
+            if self._exists(book.id):
+                raise HTTPException(status_code=400, detail="Book ID already exists")
+            self._insert(book)
+        return book
+
+    def update_book(self, book_id: int, updated_book: Book) -> Book:
+        """책 정보를 업데이트합니다.
+
+        Args:
+            book_id: 업데이트할 책의 ID
+            updated_book: 새로운 책 정보
+
+        Returns:
+            Book: 업데이트된 책 객체
+
+        Raises:
+            HTTPException: 책을 찾지 못했거나 변경된 ID가 중복되는 경우
+        """
+        with self._transaction():
+            if not self._exists(book_id):
+                raise HTTPException(status_code=404, detail="Book not found")
+            if updated_book.id != book_id and self._exists(updated_book.id):
+                raise HTTPException(status_code=400, detail="Book ID already exists")
+            if updated_book.id == book_id:
+                # 같은 id면 기존 위치(seq)를 유지
+                self._conn.execute(
+                    "UPDATE books SET title = ?, author = ?, published_year = ?, isbn = ?, "
+                    "description = ? WHERE id = ?",
+                    (updated_book.title, updated_book.author, updated_book.published_year,
+                     updated_book.isbn, updated_book.description, book_id),
+                )
+            else:
+                # id가 바뀌면 BookService와 같이 목록의 끝으로 이동
+                self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+                self._insert(updated_book)
+        return updated_book
+
+    def delete_book(self, book_id: int) -> dict:
+        """책을 삭제합니다.
+
+        Args:
+            book_id: 삭제할 책의 ID
+
+        Returns:
+            dict: 삭제 성공 메시지
+
+        Raises:
+            HTTPException: 책을 찾지 못한 경우
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Book not found")
+        return {"message": "Book deleted successfully"}
@@ -8,7 +8,8 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 # Pydantic 데이터 검증 오류
 from pydantic import ValidationError
-# SQLAlchemy 데이터베이스 세션
+# SQLAlchemy 데이터베이스 세션 (동기/비동기)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # 애플리케이션 내부 모듈
@@ -16,14 +17,17 @@ from sqlalchemy.orm import Session
 from app.core import security
 # 환경 설정
 from app.core.config import settings
+# 요청별 처리 시간 측정 (Server-Timing의 auth 구간)
+from app.core.timing import timed
 # 데이터베이스 연결 관리
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 # 사용자 데이터베이스 모델
 from app.db.models.user import User
 # JWT 토큰 페이로드 스키마
 from app.schemas.token import TokenPayload
-# 사용자 CRUD 작업
+# 사용자 CRUD 작업 (동기/비동기)
 from app.crud import user as crud_user
+from app.crud.aio import user as crud_user_async
 
 # OAuth2 인증 처리기 인스턴스 생성
 # tokenUrl: 토큰을 발급하는 엔드포인트 URL 지정
@@ -31,14 +35,12 @@ reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
-# 현재 인증된 사용자 정보를 가져오는 의존성 함수
-def get_current_user(
-    # 데이터베이스 세션 의존성
-    db: Session = Depends(get_db),
-    # OAuth2 인증 토큰 의존성 (헤더에서 추출)
-    token: str = Depends(reusable_oauth2)
-) -> User:
-    """현재 인증된 사용자 가져오기"""
+def decode_token(token: str) -> TokenPayload:
+    """JWT 토큰을 검증하고 페이로드를 반환합니다.
+
+    Raises:
+        HTTPException: 토큰 서명이나 형식이 올바르지 않은 경우 (403)
+    """
     try:
         # JWT 토큰 복호화 (서명 검증)
         payload = jwt.decode(
@@ -52,8 +54,22 @@ def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    # 토큰에서 추출한 사용자 ID로 사용자 정보 조회
-    user = crud_user.get_user(db, user_id=token_data.sub)
+    return token_data
+
+# 현재 인증된 사용자 정보를 가져오는 의존성 함수
+def get_current_user(
+    # 데이터베이스 세션 의존성
+    db: Session = Depends(get_db),
+    # OAuth2 인증 토큰 의존성 (헤더에서 추출)
+    token: str = Depends(reusable_oauth2)
+) -> User:
+    """현재 인증된 사용자 가져오기"""
+    # 토큰 검증과 사용자 조회 시간을 auth 구간으로 기록
+    with timed("auth"):
+        token_data = decode_token(token)
+        # 토큰에서 추출한 사용자 ID로 사용자 정보 조회
+        # 캐시에 있으면 DB 조회 없이 스냅샷을 사용
+        user = crud_user.get_user_cached(db, user_id=token_data.sub)
     if not user:
         # 사용자가 존재하지 않는 경우 404 오류 발생
         raise HTTPException(status_code=404, detail="User not found")
@@ -82,3 +98,29 @@ def get_current_active_superuser(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+# 비동기 DB 모드(ASYNC_DB)에서 사용하는 의존성 함수들
+# 동작은 위의 동기 버전과 같으며 AsyncSession으로 사용자를 조회함
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(reusable_oauth2)
+) -> User:
+    """현재 인증된 사용자 가져오기 (비동기)"""
+    with timed("auth"):
+        token_data = decode_token(token)
+        user = await crud_user_async.get_user_cached(db, user_id=token_data.sub)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """현재 활성화된 사용자 가져오기 (비동기)"""
+    return get_current_active_user(current_user)
+
+async def get_current_active_superuser_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """현재 활성화된 관리자 사용자 가져오기 (비동기)"""
+    return get_current_active_superuser(current_user)
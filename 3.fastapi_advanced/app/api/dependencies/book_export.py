@@ -0,0 +1,66 @@
+# 도서 내보내기(GET /books/export) 응답 인코딩
+# 행 묶음을 받는 즉시 NDJSON 또는 CSV 바이트로 인코딩하여 StreamingResponse로 보냅니다.
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
+
+from app.crud.book import EXPORT_COLUMNS
+
+# 내보내는 필드 이름 (CSV 헤더와 NDJSON 키)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+class ExportFormat(str, Enum):
+    """내보내기 형식"""
+    ndjson = "ndjson"
+    csv = "csv"
+
+# 형식별 Content-Type
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode()
+
+def _encode_csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+def _header(fmt: ExportFormat) -> List[bytes]:
+    """본문 앞에 보낼 내용 (CSV는 헤더 행)"""
+    return [_encode_csv([EXPORT_FIELDS])] if fmt == ExportFormat.csv else []
+
+def encode_batches(batches: Iterable[Sequence[Row]], fmt: ExportFormat) -> Iterator[bytes]:
+    """행 묶음을 하나씩 인코딩합니다. 묶음 하나가 응답 청크 하나가 됩니다."""
+    encode = _encode_csv if fmt == ExportFormat.csv else _encode_ndjson
+    yield from _header(fmt)
+    for rows in batches:
+        yield encode(rows)
+
+async def encode_batches_async(
+    batches: AsyncIterable[Sequence[Row]], fmt: ExportFormat
+) -> AsyncIterator[bytes]:
+    """encode_batches의 비동기 버전"""
+    encode = _encode_csv if fmt == ExportFormat.csv else _encode_ndjson
+    for chunk in _header(fmt):
+        yield chunk
+    async for rows in batches:
+        yield encode(rows)
+
+def export_response(content, fmt: ExportFormat) -> StreamingResponse:
+    """인코딩된 청크를 파일 다운로드 응답으로 스트리밍합니다."""
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="books.{fmt.value}"'},
+    )
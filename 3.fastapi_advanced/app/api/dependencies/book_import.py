@@ -0,0 +1,106 @@
+# 도서 대량 등록(POST /books/bulk) 요청 본문 처리
+# JSON 배열 또는 NDJSON(한 줄에 JSON 객체 하나) 본문을 읽어
+# batch_size개씩 검증된 행 묶음으로 돌려줍니다.
+import json
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Request
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.schemas.book import BookCreate, BookImportError
+
+# NDJSON으로 인식할 Content-Type
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+# (검증된 (행 위치, 책 정보) 목록, 검증에 실패한 행 목록)
+ImportChunk = Tuple[List[Tuple[int, BookCreate]], List[BookImportError]]
+
+def get_import_batch_size(
+    # 한 번에 검증하고 한 트랜잭션으로 저장할 행 수 (생략하면 BOOK_IMPORT_BATCH_SIZE)
+    batch_size: Optional[int] = Query(None, ge=1, le=5000),
+) -> int:
+    """대량 등록 배치 크기 의존성"""
+    return batch_size or settings.BOOK_IMPORT_BATCH_SIZE
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[Any]:
+    """NDJSON 본문을 스트리밍으로 읽어 줄마다 파싱한 값을 돌려줍니다.
+
+    본문 전체를 메모리에 올리지 않으며, 파싱할 수 없는 줄은 ValueError 객체로 돌려줍니다.
+    """
+    buffer = b""
+    async for data in request.stream():
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _parse_line(line)
+    if buffer.strip():
+        yield _parse_line(buffer)
+
+def _parse_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return exc
+
+async def _iter_json_array(request: Request) -> AsyncIterator[Any]:
+    """JSON 배열 본문의 각 항목을 돌려줍니다.
+
+    Raises:
+        HTTPException: 본문이 올바른 JSON 배열이 아닌 경우
+    """
+    try:
+        rows = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array or NDJSON body")
+    for row in rows:
+        yield row
+
+def _validate(index: int, row: Any) -> Tuple[Optional[BookCreate], Optional[BookImportError]]:
+    """한 행을 BookCreate로 검증합니다."""
+    if isinstance(row, ValueError):
+        return None, BookImportError(index=index, detail=f"Invalid JSON: {row}")
+    isbn = row.get("isbn") if isinstance(row, dict) else None
+    isbn = isbn if isinstance(isbn, str) else None
+    try:
+        return BookCreate.parse_obj(row), None
+    except ValidationError as exc:
+        detail = "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            for error in exc.errors()
+        )
+        return None, BookImportError(index=index, isbn=isbn, detail=detail)
+
+async def read_import_chunks(request: Request, batch_size: int) -> AsyncIterator[ImportChunk]:
+    """요청 본문을 batch_size개씩 검증하여 돌려줍니다.
+
+    Content-Type이 NDJSON이면 스트리밍으로 읽고, 그 외에는 JSON 배열로 읽습니다.
+
+    Args:
+        request: 대량 등록 요청
+        batch_size: 묶음당 행 수
+
+    Returns:
+        AsyncIterator[ImportChunk]: (검증된 행 목록, 검증 오류 목록) 묶음
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    rows = _iter_ndjson(request) if content_type in NDJSON_MEDIA_TYPES else _iter_json_array(request)
+
+    books: List[Tuple[int, BookCreate]] = []
+    errors: List[BookImportError] = []
+    index = 0
+    async for row in rows:
+        book, error = _validate(index, row)
+        if book is not None:
+            books.append((index, book))
+        else:
+            errors.append(error)
+        index += 1
+        if len(books) + len(errors) >= batch_size:
+            yield books, errors
+            books, errors = [], []
+    if books or errors:
+        yield books, errors
@@ -0,0 +1,69 @@
+# 조건부 GET (ETag / Last-Modified) 처리
+# 행 버전으로 강한 ETag를 만들고, 클라이언트가 가진 버전과 같으면
+# 응답 모델을 직렬화하지 않고 304 Not Modified를 돌려줍니다.
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from app.db.base_class import VersionedMixin
+
+def make_etag(obj: VersionedMixin) -> str:
+    """행 ID와 버전으로 강한 ETag를 만듭니다. (예: "12-3")"""
+    return f'"{obj.id}-{obj.version}"'
+
+def _last_modified(obj: VersionedMixin) -> datetime:
+    # HTTP 날짜는 초 단위이므로 마이크로초를 버림
+    return obj.updated_at.replace(microsecond=0, tzinfo=timezone.utc)
+
+def validator_headers(obj: VersionedMixin) -> Dict[str, str]:
+    """ETag와 Last-Modified 응답 헤더"""
+    return {
+        "ETag": make_etag(obj),
+        "Last-Modified": format_datetime(_last_modified(obj), usegmt=True),
+    }
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 값에 etag가 있는지 확인합니다. (약한 비교, '*'는 모두 일치)"""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates
+    )
+
+def _not_modified_since(if_modified_since: str, obj: VersionedMixin) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _last_modified(obj) <= since
+
+def conditional_response(
+    request: Request, response: Response, obj: VersionedMixin
+) -> Optional[Response]:
+    """조건부 GET을 처리합니다.
+
+    응답에 ETag와 Last-Modified 헤더를 설정하고, 요청의 If-None-Match
+    (없으면 If-Modified-Since)가 현재 버전과 일치하면 304 응답을 돌려줍니다.
+
+    Args:
+        request: 현재 요청
+        response: 200 응답에 헤더를 설정할 응답 객체
+        obj: version과 updated_at 열이 있는 ORM 객체
+
+    Returns:
+        Optional[Response]: 변경되지 않았으면 304 응답, 아니면 None
+    """
+    headers = validator_headers(obj)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = if_modified_since is not None and _not_modified_since(if_modified_since, obj)
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
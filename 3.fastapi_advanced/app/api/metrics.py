@@ -0,0 +1,114 @@
+# 런타임 지표 엔드포인트 (GET /metrics, Prometheus 텍스트 형식)
+# 요청 수/지연 시간/해싱 시간은 기록 시점에 app/core/metrics.py의 지표에 쌓이고,
+# 연결 풀, 캐시, 해싱 풀, 스레드풀 상태는 여기서 조회할 때마다 현재 값을 읽습니다.
+import asyncio
+from typing import Iterator, List, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+# 지표 레지스트리와 조회 시점 지표 생성 함수
+from app.core.metrics import REGISTRY, metric_family
+# 응답 캐시
+from app.core.cache import book_list_cache, user_cache
+# 비밀번호 해싱 프로세스 풀
+from app.core.hashing import password_hasher
+# 동기/비동기, 쓰기/읽기 엔진
+from app.db.base import async_engine, async_read_engine, engine, read_engine
+
+# Prometheus 텍스트 형식 버전
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+def _pools() -> Iterator[Tuple[str, object]]:
+    """(pool 레이블, 연결 풀) 목록 - 읽기 엔진이 쓰기 엔진과 같으면 한 번만 반환"""
+    seen = set()
+    for name, pool in (
+        ("write", engine.pool),
+        ("read", read_engine.pool),
+        ("async_write", async_engine.sync_engine.pool),
+        ("async_read", async_read_engine.sync_engine.pool),
+    ):
+        # SQLite 메모리 DB 등 크기 개념이 없는 풀(StaticPool, NullPool)은 제외
+        if id(pool) in seen or not hasattr(pool, "checkedout"):
+            continue
+        seen.add(id(pool))
+        yield name, pool
+
+def collect_pools() -> List[str]:
+    """SQLAlchemy 연결 풀 크기, 사용 중인 연결 수, 초과(overflow) 연결 수"""
+    pools = list(_pools())
+    labels = ("pool",)
+    return (
+        metric_family("db_pool_size", "gauge", "Configured size of the connection pool.",
+                      labels, [((name,), pool.size()) for name, pool in pools])
+        + metric_family("db_pool_checked_out", "gauge", "Connections currently checked out.",
+                        labels, [((name,), pool.checkedout()) for name, pool in pools])
+        + metric_family("db_pool_checked_in", "gauge", "Idle connections held by the pool.",
+                        labels, [((name,), pool.checkedin()) for name, pool in pools])
+        # QueuePool.overflow()는 아직 만들지 않은 기본 연결이 있으면 음수이므로 0으로 표시
+        + metric_family("db_pool_overflow", "gauge", "Connections open beyond the pool size.",
+                        labels, [((name,), max(pool.overflow(), 0)) for name, pool in pools])
+    )
+
+def collect_caches() -> List[str]:
+    """사용자 캐시와 도서 목록 캐시의 적중/미스 횟수와 적중률"""
+    stats = [(("user",), user_cache.stats()), (("book_list",), book_list_cache.stats())]
+    labels = ("cache",)
+    return (
+        metric_family("cache_hits_total", "counter", "Cache lookups that found an entry.",
+                      labels, [(name, s["hits"]) for name, s in stats])
+        + metric_family("cache_misses_total", "counter", "Cache lookups that found no entry.",
+                        labels, [(name, s["misses"]) for name, s in stats])
+        + metric_family("cache_hit_ratio", "gauge", "Hits divided by lookups since start.",
+                        labels, [(name, s["hit_ratio"]) for name, s in stats])
+        + metric_family("cache_entries", "gauge", "Entries currently cached.",
+                        labels, [(name, s["size"]) for name, s in stats])
+    )
+
+def collect_password_hasher() -> List[str]:
+    """해싱 풀의 프로세스 수, 대기열 깊이, 거절된 요청 수"""
+    stats = password_hasher.stats()
+    return (
+        metric_family("password_hash_workers", "gauge", "Password hashing worker processes.",
+                      (), [((), stats["workers"])])
+        + metric_family("password_hash_in_flight", "gauge", "Password hash jobs running or queued.",
+                        (), [((), stats["in_flight"])])
+        + metric_family("password_hash_rejected_total", "counter",
+                        "Password hash jobs rejected with 503 because the queue was full.",
+                        (), [((), stats["rejected"])])
+    )
+
+def collect_threadpool() -> List[str]:
+    """동기 엔드포인트/의존성을 실행하는 이벤트 루프 기본 스레드풀 상태
+
+    asyncio가 공개하지 않는 속성(_default_executor, _threads, _work_queue)을 읽으므로,
+    아직 스레드풀이 만들어지지 않았거나 구현이 다르면 지표를 생략합니다.
+    """
+    try:
+        executor = asyncio.get_running_loop()._default_executor
+        samples = [
+            ("threadpool_max_workers", "Maximum threads in the default executor.", executor._max_workers),
+            ("threadpool_threads", "Threads started by the default executor.", len(executor._threads)),
+            ("threadpool_queued_tasks", "Tasks waiting for a free thread.", executor._work_queue.qsize()),
+        ]
+    except (AttributeError, RuntimeError):
+        return []
+    lines: List[str] = []
+    for name, help_text, value in samples:
+        lines += metric_family(name, "gauge", help_text, (), [((), value)])
+    return lines
+
+for _collector in (collect_pools, collect_caches, collect_password_hasher, collect_threadpool):
+    REGISTRY.add_collector(_collector)
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """런타임 지표를 Prometheus 텍스트 형식으로 반환합니다.
+
+    Returns:
+        PlainTextResponse: 요청/지연 시간 히스토그램, 연결 풀, 캐시, 해싱 풀, 스레드풀 지표
+    """
+    # 스레드풀 지표가 이벤트 루프를 읽어야 하므로 async def로 정의
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
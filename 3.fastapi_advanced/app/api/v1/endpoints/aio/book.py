@@ -0,0 +1,192 @@
+# 비동기 DB 모드(ASYNC_DB)용 도서 엔드포인트
+# app.api.v1.endpoints.book과 같은 API를 async def + AsyncSession으로 제공하여
+# DB 응답을 기다리는 동안 스레드풀 워커를 점유하지 않음
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import (
+    get_current_active_superuser_async, get_current_active_user_async,
+)
+from app.api.dependencies.conditional import conditional_response
+from app.api.dependencies.book_export import ExportFormat, encode_batches_async, export_response
+from app.api.dependencies.book_import import get_import_batch_size, read_import_chunks
+from app.core.cache import ALL_BOOKS_SCOPE, book_list_cache
+from app.core.config import settings
+from app.core.timing import TimedRoute, timed
+from app.db.base import get_async_db, get_async_read_db
+from app.schemas import book as book_schema
+from app.crud.aio import book as crud_book
+from app.db.models.user import User
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.get("/", response_model=List[book_schema.Book], response_model_exclude_unset=True)
+async def read_books(
+    db: AsyncSession = Depends(get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """
+    모든 책 조회.
+    일반 사용자는 자신의 책만 조회 가능.
+    관리자는 모든 책 조회 가능.
+    """
+    scope = ALL_BOOKS_SCOPE if current_user.is_superuser else current_user.id
+    body = book_list_cache.get(scope, (skip, limit))
+    if body is None:
+        version = book_list_cache.version(scope)
+        user_id = None if current_user.is_superuser else current_user.id
+        if settings.FAST_JSON_RESPONSES:
+            encoder = book_schema.book_encoder
+            rows = await crud_book.get_book_rows(
+                db, encoder.names, skip=skip, limit=limit, user_id=user_id
+            )
+            with timed("serialize"):
+                body = encoder.encode(rows)
+        else:
+            books = await crud_book.get_books(db, skip=skip, limit=limit, user_id=user_id)
+            with timed("serialize"):
+                body = book_schema.dump_books(books)
+        book_list_cache.set(scope, (skip, limit), version, body)
+    return Response(content=body, media_type="application/json")
+
+@router.get("/page", response_model=book_schema.BookPage)
+async def read_books_page(
+    db: AsyncSession = Depends(get_async_read_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """커서 기반으로 책 목록 조회."""
+    user_id = None if current_user.is_superuser else current_user.id
+    try:
+        books, next_cursor = await crud_book.get_books_keyset(
+            db, limit=limit, user_id=user_id, cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"items": books, "next_cursor": next_cursor}
+
+@router.get("/search", response_model=List[book_schema.Book], response_model_exclude_unset=True)
+async def search_books(
+    db: AsyncSession = Depends(get_async_read_db),
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """제목, 저자, 설명에서 단어로 책 검색 (bm25 관련도 순)."""
+    user_id = None if current_user.is_superuser else current_user.id
+    return await crud_book.search_books(db, q=q, skip=skip, limit=limit, user_id=user_id)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_books(
+    db: AsyncSession = Depends(get_async_read_db),
+    format: ExportFormat = ExportFormat.ndjson,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """책 목록 전체를 NDJSON 또는 CSV 파일로 스트리밍 내보내기."""
+    user_id = None if current_user.is_superuser else current_user.id
+    batches = crud_book.iter_book_batches(
+        db, user_id=user_id, batch_size=settings.BOOK_EXPORT_BATCH_SIZE
+    )
+    return export_response(encode_batches_async(batches, format), format)
+
+@router.get("/admin", response_model=List[book_schema.BookWithOwner])
+async def read_books_with_owner(
+    db: AsyncSession = Depends(get_async_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_active_superuser_async),
+) -> Any:
+    """모든 책을 소유자 이메일과 함께 조회 (관리자 전용, 소유자는 JOIN으로 함께 로딩)."""
+    return await crud_book.get_books(db, skip=skip, limit=limit, options=crud_book.WITH_OWNER)
+
+@router.post("/", response_model=book_schema.Book, response_model_exclude_unset=True)
+async def create_book(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    book_in: book_schema.BookCreate,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """새 책 생성"""
+    book = await crud_book.create_book(db=db, book=book_in, user_id=current_user.id)
+    return book
+
+@router.post("/bulk", response_model=book_schema.BookImportResult)
+async def create_books_bulk(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    batch_size: int = Depends(get_import_batch_size),
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """여러 책을 한 번에 생성 (JSON 배열 또는 NDJSON)."""
+    result = book_schema.BookImportResult()
+    async for books, errors in read_import_chunks(request, batch_size):
+        result.errors.extend(errors)
+        if not books:
+            continue
+        inserted, conflicts = await crud_book.create_books_bulk(db, books, current_user.id)
+        result.inserted += inserted
+        result.errors.extend(
+            book_schema.BookImportError(index=index, isbn=isbn, detail="ISBN already exists")
+            for index, isbn in conflicts
+        )
+    result.errors.sort(key=lambda error: error.index)
+    return result
+
+@router.get("/{book_id}", response_model=book_schema.Book, response_model_exclude_unset=True)
+async def read_book(
+    *,
+    db: AsyncSession = Depends(get_async_read_db),
+    book_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """특정 책 조회 (ETag / Last-Modified 조건부 GET 지원)"""
+    book = await crud_book.get_book(db=db, book_id=book_id)
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    if not current_user.is_superuser and (book.user_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    not_modified = conditional_response(request, response, book)
+    if not_modified is not None:
+        return not_modified
+    return book
+
+@router.put("/{book_id}", response_model=book_schema.Book)
+async def update_book(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    book_id: int,
+    book_in: book_schema.BookUpdate,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """책 정보 업데이트"""
+    book = await crud_book.get_book(db=db, book_id=book_id)
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    if not current_user.is_superuser and (book.user_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    book = await crud_book.update_book(db=db, db_book=book, book_in=book_in)
+    return book
+
+@router.delete("/{book_id}", response_model=book_schema.Book)
+async def delete_book(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    book_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """책 삭제"""
+    book = await crud_book.get_book(db=db, book_id=book_id)
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    if not current_user.is_superuser and (book.user_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    book = await crud_book.delete_book(db=db, book_id=book_id)
+    return book
@@ -0,0 +1,57 @@
+# 비동기 DB 모드(ASYNC_DB)용 로그인 엔드포인트
+from datetime import timedelta
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import get_current_user_async
+from app.core import security
+from app.core.config import settings
+from app.core.timing import TimedRoute
+from app.db.base import get_async_db
+from app.schemas.token import Token
+from app.crud.aio import user as crud_user
+from app.schemas import user as user_schema
+from app.db.models.user import User
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.post("/access-token", response_model=Token, response_model_exclude_unset=True)
+async def login_access_token(
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
+) -> Any:
+    """사용자 로그인을 처리하고 JWT 토큰을 발급합니다. (비동기)"""
+    user = await crud_user.authenticate(
+        db,
+        email=form_data.username,
+        password=form_data.password,
+        # 오래된 해시는 응답을 보낸 뒤 백그라운드에서 다시 해시
+        background_tasks=background_tasks,
+    )
+    if not user:
+        raise HTTPException(
+            status_code=400,
+            detail="Incorrect email or password"
+        )
+    elif not user.is_active:
+        raise HTTPException(
+            status_code=400,
+            detail="Inactive user"
+        )
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return {
+        "access_token": security.create_access_token(
+            user.id,
+            expires_delta=access_token_expires
+        ),
+        "token_type": "bearer",
+    }
+
+@router.post("/test-token", response_model=user_schema.User, response_model_exclude_unset=True)
+async def test_token(current_user: User = Depends(get_current_user_async)) -> Any:
+    """토큰의 유효성을 테스트하고 현재 사용자 정보를 반환합니다. (비동기)"""
+    return current_user
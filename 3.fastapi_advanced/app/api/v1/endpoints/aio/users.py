@@ -0,0 +1,110 @@
+# 비동기 DB 모드(ASYNC_DB)용 사용자 엔드포인트
+from typing import Any, List
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import (
+    get_current_active_superuser_async,
+    get_current_active_user_async,
+)
+from app.api.dependencies.conditional import conditional_response
+from app.core.config import settings
+from app.core.timing import TimedRoute, timed
+from app.db.base import get_async_db
+from app.schemas import user as user_schema
+from app.crud.aio import user as crud_user
+from app.db.models.user import User
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.get("/", response_model=List[user_schema.User], response_model_exclude_unset=True)
+async def read_users(
+    db: AsyncSession = Depends(get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_active_superuser_async),
+) -> Any:
+    """모든 사용자 조회 (관리자 전용)"""
+    if settings.FAST_JSON_RESPONSES:
+        encoder = user_schema.user_encoder
+        rows = await crud_user.get_user_rows(db, encoder.names, skip=skip, limit=limit)
+        with timed("serialize"):
+            body = encoder.encode(rows)
+        return Response(content=body, media_type="application/json")
+    users = await crud_user.get_users(db, skip=skip, limit=limit)
+    return users
+
+@router.post("/", response_model=user_schema.User, response_model_exclude_unset=True)
+async def create_user(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_in: user_schema.UserCreate,
+    current_user: User = Depends(get_current_active_superuser_async),
+) -> Any:
+    """새 사용자 생성 (관리자 전용)"""
+    user = await crud_user.get_user_by_email(db, email=user_in.email)
+    if user:
+        raise HTTPException(
+            status_code=400,
+            detail="The user with this username already exists in the system.",
+        )
+    user = await crud_user.create_user(db, user_in)
+    return user
+
+@router.get("/me", response_model=user_schema.User, response_model_exclude_unset=True)
+async def read_user_me(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """현재 사용자 정보 조회 (ETag / Last-Modified 조건부 GET 지원)"""
+    not_modified = conditional_response(request, response, current_user)
+    if not_modified is not None:
+        return not_modified
+    return current_user
+
+@router.put("/me", response_model=user_schema.User)
+async def update_user_me(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    password: str = Body(None),
+    current_user: User = Depends(get_current_active_user_async),
+) -> Any:
+    """현재 사용자 정보 업데이트 (지정한 값만 변경, 바뀐 값이 없으면 저장 생략)"""
+    update_data = {} if password is None else {"password": password}
+    user = await crud_user.update_user(db, db_user=current_user, user_in=update_data)
+    return user
+
+@router.get("/{user_id}", response_model=user_schema.User)
+async def read_user_by_id(
+    user_id: int,
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> Any:
+    """특정 사용자 정보 조회"""
+    user = await crud_user.get_user(db, user_id=user_id)
+    if user == current_user:
+        return user
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=400, detail="The user doesn't have enough privileges"
+        )
+    return user
+
+@router.put("/{user_id}", response_model=user_schema.User)
+async def update_user(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: int,
+    user_in: user_schema.UserUpdate,
+    current_user: User = Depends(get_current_active_superuser_async),
+) -> Any:
+    """특정 사용자 정보 수정 (관리자 전용, 계정 비활성화 포함)"""
+    user = await crud_user.get_user(db, user_id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail="The user with this username does not exist in the system",
+        )
+    user = await crud_user.update_user(db, db_user=user, user_in=user_in)
+    return user
@@ -1,14 +1,29 @@
 # 파이썬 기본 타입 힌트 기능
-from typing import Any, List
+from typing import Any, List, Optional
 # FastAPI 핵심 기능들
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+# 동기 함수를 스레드풀에서 실행하기 위한 유틸리티
+from starlette.concurrency import run_in_threadpool
 # SQLAlchemy 세션 관리
 from sqlalchemy.orm import Session
 
 # 사용자 인증 관련 의존성
-from app.api.dependencies.auth import get_current_active_user
+from app.api.dependencies.auth import get_current_active_superuser, get_current_active_user
+# 대량 등록 요청 본문 처리
+from app.api.dependencies.book_import import get_import_batch_size, read_import_chunks
+# 조건부 GET (ETag / Last-Modified) 처리
+from app.api.dependencies.conditional import conditional_response
+# 내보내기 응답 인코딩
+from app.api.dependencies.book_export import ExportFormat, encode_batches, export_response
+# 환경 설정
+from app.core.config import settings
+# 도서 목록 응답 캐시
+from app.core.cache import ALL_BOOKS_SCOPE, book_list_cache
+# 요청별 처리 시간 측정 (Server-Timing)
+from app.core.timing import TimedRoute, timed
 # 데이터베이스 연결 관리
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
 # 책 관련 Pydantic 모델 (요청/응답 데이터 검증)
 from app.schemas import book as book_schema
 # 책 관련 데이터베이스 CRUD 작업
@@ -17,7 +32,8 @@ from app.crud import book as crud_book
 from app.db.models.user import User
 
 # API 라우터 인스턴스 생성
-router = APIRouter()
+# TimedRoute: 응답 직렬화 시간을 Server-Timing의 serialize 구간으로 기록
+router = APIRouter(route_class=TimedRoute)
 
 # GET 메서드로 '/' 경로에 대한 요청 처리
 # response_model: 응답 데이터의 형식을 Book 모델의 리스트로 지정
@@ -25,7 +41,7 @@ router = APIRouter()
 @router.get("/", response_model=List[book_schema.Book], response_model_exclude_unset=True)
 def read_books(
     # 데이터베이스 세션 의존성 주입
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # 페이지네이션을 위한 건너뛸 항목 수 (기본값: 0)
     skip: int = 0,
     # 한 번에 가져올 최대 항목 수 (기본값: 100)
@@ -37,16 +53,111 @@ def read_books(
     모든 책 조회.
     일반 사용자는 자신의 책만 조회 가능.
     관리자는 모든 책 조회 가능.
+    직렬화된 응답은 사용자별로 캐시되며, 책이 생성/수정/삭제되면 무효화됨.
+    """
+    # 캐시 범위: 관리자는 모든 책, 일반 사용자는 자신의 책
+    scope = ALL_BOOKS_SCOPE if current_user.is_superuser else current_user.id
+    # 캐시된 응답 바이트가 있으면 조회와 직렬화 없이 바로 반환
+    body = book_list_cache.get(scope, (skip, limit))
+    if body is None:
+        # 조회 전에 버전을 읽어 두어야 조회 중에 바뀐 결과가 캐시되지 않음
+        version = book_list_cache.version(scope)
+        # 관리자는 모든 책, 일반 사용자는 자신의 책만 조회 가능
+        user_id = None if current_user.is_superuser else current_user.id
+        if settings.FAST_JSON_RESPONSES:
+            # ORM 객체 생성과 응답 모델 검증 없이 응답 스키마의 열만 조회해 바로 인코딩
+            encoder = book_schema.book_encoder
+            rows = crud_book.get_book_rows(
+                db, encoder.names, skip=skip, limit=limit, user_id=user_id
+            )
+            with timed("serialize"):
+                body = encoder.encode(rows)
+        else:
+            books = crud_book.get_books(db, skip=skip, limit=limit, user_id=user_id)
+            with timed("serialize"):
+                body = book_schema.dump_books(books)
+        book_list_cache.set(scope, (skip, limit), version, body)
+    return Response(content=body, media_type="application/json")
+
+# GET 메서드로 '/page' 경로에 대한 요청 처리 (커서 기반 페이지네이션)
+# '/{book_id}' 보다 먼저 등록해야 'page'가 book_id로 해석되지 않음
+@router.get("/page", response_model=book_schema.BookPage)
+def read_books_page(
+    db: Session = Depends(get_read_db),
+    # 이전 응답의 next_cursor (첫 페이지는 생략)
+    cursor: Optional[str] = None,
+    # 한 번에 가져올 최대 항목 수 (1 ~ 1000)
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    커서 기반으로 책 목록 조회.
+    OFFSET 대신 마지막 항목의 키 다음부터 조회하므로 깊은 페이지도 일정한 속도로 조회됨.
+    권한 규칙은 목록 조회와 동일함.
     """
-    # 관리자인 경우 모든 책 조회 가능
-    if current_user.is_superuser:
-        books = crud_book.get_books(db, skip=skip, limit=limit)
-    # 일반 사용자인 경우 자신의 책만 조회 가능
-    else:
-        books = crud_book.get_books(
-            db, skip=skip, limit=limit, user_id=current_user.id
+    user_id = None if current_user.is_superuser else current_user.id
+    try:
+        books, next_cursor = crud_book.get_books_keyset(
+            db, limit=limit, user_id=user_id, cursor=cursor
         )
-    return books
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"items": books, "next_cursor": next_cursor}
+
+# GET 메서드로 '/search' 경로에 대한 요청 처리 (전문 검색)
+# '/{book_id}' 보다 먼저 등록해야 'search'가 book_id로 해석되지 않음
+@router.get("/search", response_model=List[book_schema.Book], response_model_exclude_unset=True)
+def search_books(
+    db: Session = Depends(get_read_db),
+    # 검색어 - 단어 뒤에 '*'를 붙이면 접두사 검색 (예: "pyth*")
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    제목, 저자, 설명에서 단어로 책 검색.
+    결과는 관련도(bm25) 순이며, 권한 규칙은 목록 조회와 동일함.
+    """
+    user_id = None if current_user.is_superuser else current_user.id
+    return crud_book.search_books(db, q=q, skip=skip, limit=limit, user_id=user_id)
+
+# GET 메서드로 '/export' 경로에 대한 요청 처리 (전체 목록 스트리밍 내보내기)
+# '/{book_id}' 보다 먼저 등록해야 'export'가 book_id로 해석되지 않음
+@router.get("/export", response_class=StreamingResponse)
+def export_books(
+    db: Session = Depends(get_read_db),
+    # 내보내기 형식 (ndjson 또는 csv)
+    format: ExportFormat = ExportFormat.ndjson,
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    책 목록 전체를 NDJSON 또는 CSV 파일로 내보내기.
+    BOOK_EXPORT_BATCH_SIZE행씩 읽어 바로 인코딩하여 보내므로
+    테이블 크기와 관계없이 메모리 사용량이 일정함.
+    권한 규칙은 목록 조회와 동일함.
+    """
+    user_id = None if current_user.is_superuser else current_user.id
+    batches = crud_book.iter_book_batches(
+        db, user_id=user_id, batch_size=settings.BOOK_EXPORT_BATCH_SIZE
+    )
+    return export_response(encode_batches(batches, format), format)
+
+# GET 메서드로 '/admin' 경로에 대한 요청 처리 (관리자용 소유자 포함 목록)
+# '/{book_id}' 보다 먼저 등록해야 'admin'이 book_id로 해석되지 않음
+@router.get("/admin", response_model=List[book_schema.BookWithOwner])
+def read_books_with_owner(
+    db: Session = Depends(get_read_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    # 관리자만 접근 가능
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    모든 책을 소유자 이메일과 함께 조회 (관리자 전용).
+    소유자를 같은 SELECT에서 JOIN으로 읽으므로 책 수와 관계없이 쿼리 한 번으로 조회됨.
+    """
+    return crud_book.get_books(db, skip=skip, limit=limit, options=crud_book.WITH_OWNER)
 
 # POST 메서드로 '/' 경로에 대한 요청 처리 (새 책 생성)
 # response_model: 응답 데이터의 형식을 Book 모델로 지정
@@ -67,19 +178,62 @@ def create_book(
     book = crud_book.create_book(db=db, book=book_in, user_id=current_user.id)
     return book
 
+# POST 메서드로 '/bulk' 경로에 대한 요청 처리 (여러 책을 한 번에 생성)
+@router.post("/bulk", response_model=book_schema.BookImportResult)
+async def create_books_bulk(
+    request: Request,
+    db: Session = Depends(get_db),
+    # 한 번에 검증하고 한 트랜잭션으로 저장할 행 수
+    batch_size: int = Depends(get_import_batch_size),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    여러 책을 한 번에 생성.
+    본문은 JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson)이며,
+    NDJSON은 본문을 스트리밍으로 읽어 batch_size개씩 검증하고 저장함.
+    검증에 실패하거나 ISBN이 중복되는 행은 건너뛰고 errors로 보고함.
+    """
+    result = book_schema.BookImportResult()
+    async for books, errors in read_import_chunks(request, batch_size):
+        result.errors.extend(errors)
+        if not books:
+            continue
+        # 동기 세션을 사용하므로 이벤트 루프를 막지 않도록 스레드풀에서 저장
+        inserted, conflicts = await run_in_threadpool(
+            crud_book.create_books_bulk, db, books, current_user.id
+        )
+        result.inserted += inserted
+        result.errors.extend(
+            book_schema.BookImportError(index=index, isbn=isbn, detail="ISBN already exists")
+            for index, isbn in conflicts
+        )
+    # 행 위치 순으로 정렬하여 보고
+    result.errors.sort(key=lambda error: error.index)
+    return result
+
 @router.get("/{book_id}", response_model=book_schema.Book, response_model_exclude_unset=True)
 def read_book(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     book_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
-    """특정 책 조회"""
+    """
+    특정 책 조회.
+    ETag / Last-Modified 헤더를 보내며, If-None-Match 또는 If-Modified-Since가
+    현재 버전과 일치하면 본문 없이 304를 반환함.
+    """
     book = crud_book.get_book(db=db, book_id=book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if not current_user.is_superuser and (book.user_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
+    # 변경되지 않았으면 응답 모델 직렬화 없이 304 반환
+    not_modified = conditional_response(request, response, book)
+    if not_modified is not None:
+        return not_modified
     return book
 
 @router.put("/{book_id}", response_model=book_schema.Book)
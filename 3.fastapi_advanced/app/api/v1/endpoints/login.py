@@ -4,7 +4,7 @@ from datetime import timedelta
 from typing import Any
 
 # FastAPI 관련 모듈
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 # OAuth2 인증 관련 모듈
 from fastapi.security import OAuth2PasswordRequestForm
 # SQLAlchemy 세션 관리를 위한 모듈
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.api.dependencies.auth import get_current_user  # 현재 사용자 가져오기
 from app.core import security  # 보안 관련 함수들
 from app.core.config import settings  # 환경변수와 설정값들
+from app.core.timing import TimedRoute  # 응답 직렬화 시간 측정 라우트
 from app.db.base import get_db  # 데이터베이스 세션 가져오기
 from app.schemas.token import Token  # 토큰 스키마
 from app.crud import user as crud_user  # 사용자 CRUD 작업
@@ -21,12 +22,15 @@ from app.schemas import user as user_schema  # 사용자 스키마
 from app.db.models.user import User  # 사용자 데이터베이스 모델
 
 # 로그인 관련 라우터 생성
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
+# async def - 비밀번호 검증(bcrypt)을 기다리는 동안 스레드풀의 스레드를 점유하지 않음
+# (동기 def이면 로그인이 몰릴 때 대기 중인 검증이 스레드풀을 모두 차지해 다른 동기 엔드포인트가 멈춤)
 @router.post("/access-token", response_model=Token, response_model_exclude_unset=True)
-def login_access_token(
+async def login_access_token(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    form_data: OAuth2PasswordRequestForm = Depends()
+    form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """사용자 로그인을 처리하고 JWT 토큰을 발급합니다.
     
@@ -42,11 +46,13 @@ def login_access_token(
     Raises:
         HTTPException: 이메일/비밀번호가 잘못되었거나 비활성화된 사용자인 경우
     """
-    # 사용자 인증 시도
-    user = crud_user.authenticate(
+    # 사용자 인증 시도 (조회는 스레드풀, 검증은 해싱 프로세스 풀에서 실행)
+    user = await crud_user.authenticate_async(
         db,
         email=form_data.username,  # OAuth2에서는 이메일을 username으로 전달
-        password=form_data.password
+        password=form_data.password,
+        # 오래된 해시는 응답을 보낸 뒤 백그라운드에서 다시 해시
+        background_tasks=background_tasks,
     )
     
     # 인증 실패 처리
@@ -1,18 +1,20 @@
 from typing import Any, List
-from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.api.dependencies.auth import (
     get_current_active_superuser,
     get_current_active_user,
 )
+from app.api.dependencies.conditional import conditional_response
+from app.core.config import settings
+from app.core.timing import TimedRoute, timed
 from app.db.base import get_db
 from app.schemas import user as user_schema
 from app.crud import user as crud_user
 from app.db.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.get("/", response_model=List[user_schema.User], response_model_exclude_unset=True)
 def read_users(
@@ -22,6 +24,13 @@ def read_users(
     current_user: User = Depends(get_current_active_superuser),
 ) -> Any:
     """모든 사용자 조회 (관리자 전용)"""
+    if settings.FAST_JSON_RESPONSES:
+        # 응답 모델 검증 없이 응답 스키마의 열만 조회해 바로 인코딩 (같은 JSON 바이트)
+        encoder = user_schema.user_encoder
+        rows = crud_user.get_user_rows(db, encoder.names, skip=skip, limit=limit)
+        with timed("serialize"):
+            body = encoder.encode(rows)
+        return Response(content=body, media_type="application/json")
     users = crud_user.get_users(db, skip=skip, limit=limit)
     return users
 
@@ -44,9 +53,14 @@ def create_user(
 
 @router.get("/me", response_model=user_schema.User, response_model_exclude_unset=True)
 def read_user_me(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
-    """현재 사용자 정보 조회"""
+    """현재 사용자 정보 조회 (ETag / Last-Modified 조건부 GET 지원)"""
+    not_modified = conditional_response(request, response, current_user)
+    if not_modified is not None:
+        return not_modified
     return current_user
 
 @router.put("/me", response_model=user_schema.User)
@@ -56,12 +70,9 @@ def update_user_me(
     password: str = Body(None),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
-    """현재 사용자 정보 업데이트"""
-    current_user_data = jsonable_encoder(current_user)
-    user_in = user_schema.UserUpdate(**current_user_data)
-    if password is not None:
-        user_in.password = password
-    user = crud_user.update_user(db, db_user=current_user, user_in=user_in)
+    """현재 사용자 정보 업데이트 (지정한 값만 변경, 바뀐 값이 없으면 저장 생략)"""
+    update_data = {} if password is None else {"password": password}
+    user = crud_user.update_user(db, db_user=current_user, user_in=update_data)
     return user
 
 @router.get("/{user_id}", response_model=user_schema.User)
@@ -79,3 +90,21 @@ def read_user_by_id(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return user
+
+@router.put("/{user_id}", response_model=user_schema.User)
+def update_user(
+    *,
+    db: Session = Depends(get_db),
+    user_id: int,
+    user_in: user_schema.UserUpdate,
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """특정 사용자 정보 수정 (관리자 전용, 계정 비활성화 포함)"""
+    user = crud_user.get_user(db, user_id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail="The user with this username does not exist in the system",
+        )
+    user = crud_user.update_user(db, db_user=user, user_in=user_in)
+    return user
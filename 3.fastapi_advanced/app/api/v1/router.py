@@ -1,21 +1,26 @@
-from fastapi import APIRouter
-from app.api.v1.endpoints import book, login, users
+from typing import Union
+from fastapi import APIRouter, FastAPI
 
-api_router = APIRouter()
+def include_api_routes(target: Union[FastAPI, APIRouter], async_db: bool = False, prefix: str = "") -> None:
+    """API v1 엔드포인트 라우터들을 target에 등록합니다.
 
-# 각 엔드포인트 라우터 포함
-api_router.include_router(
-    login.router,
-    prefix="/login",
-    tags=["login"],
-)
-api_router.include_router(
-    users.router,
-    prefix="/users",
-    tags=["users"],
-)
-api_router.include_router(
-    book.router,
-    prefix="/books",
-    tags=["books"],
-)
+    include_router는 등록할 때마다 모든 라우트와 응답 모델 필드를 다시 만들므로,
+    애플리케이션에는 중간 라우터를 거치지 않고 엔드포인트 라우터를 바로 등록합니다.
+
+    Args:
+        target: 라우트를 등록할 애플리케이션 또는 라우터
+        async_db: True이면 AsyncSession을 사용하는 async def 엔드포인트로 구성
+        prefix: 모든 경로 앞에 붙일 접두사 (예: /api/v1)
+    """
+    # 사용하는 모드의 엔드포인트 모듈만 임포트
+    # 엔드포인트 모듈은 임포트할 때 라우트와 응답 모델 검증기를 만들므로,
+    # 쓰지 않는 모드까지 임포트하면 시작 시간이 그만큼 늘어남
+    if async_db:
+        from app.api.v1.endpoints.aio import book, login, users
+    else:
+        from app.api.v1.endpoints import book, login, users
+
+    # 각 엔드포인트 라우터 포함
+    target.include_router(login.router, prefix=f"{prefix}/login", tags=["login"])
+    target.include_router(users.router, prefix=f"{prefix}/users", tags=["users"])
+    target.include_router(book.router, prefix=f"{prefix}/books", tags=["books"])
@@ -0,0 +1,76 @@
+# bcrypt 비용(BCRYPT_ROUNDS) 보정 명령
+# 현재 호스트에서 rounds 값별 해싱 시간을 측정하고,
+# 목표 지연 시간 안에 들어오는 가장 높은 rounds 값을 추천합니다.
+#
+# 실행: python -m app.calibrate_hashing [--target-ms 250] [--samples 5]
+# 출력된 BCRYPT_ROUNDS=N 을 .env에 추가하면 이후 로그인 시 기존 해시가 새 비용으로 다시 해시됩니다.
+import argparse
+import statistics
+import time
+from typing import Dict
+
+from passlib.hash import bcrypt
+
+# OWASP 권장 최소값보다 낮은 비용은 추천하지 않음
+MIN_ROUNDS = 10
+# bcrypt가 허용하는 최대 비용
+MAX_ROUNDS = 31
+
+
+def measure(rounds: int, samples: int) -> float:
+    """주어진 rounds로 해싱 1회에 걸리는 시간의 중앙값(밀리초)을 반환합니다."""
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int, min_rounds: int = MIN_ROUNDS) -> Dict[int, float]:
+    """min_rounds부터 비용을 1씩 올리며 목표 시간을 넘을 때까지 측정합니다.
+
+    rounds가 1 늘 때마다 해싱 시간이 약 2배가 되므로,
+    목표 시간을 넘는 첫 값에서 측정을 멈춥니다.
+
+    Args:
+        target_ms: 해싱 1회의 목표 지연 시간(밀리초)
+        samples: rounds 값별 측정 횟수
+        min_rounds: 측정을 시작할 rounds 값
+
+    Returns:
+        Dict[int, float]: rounds 값 → 해싱 시간 중앙값(밀리초)
+    """
+    results: Dict[int, float] = {}
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        results[rounds] = measure(rounds, samples)
+        if results[rounds] > target_ms:
+            break
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="호스트에 맞는 bcrypt 비용(BCRYPT_ROUNDS) 측정")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="해싱 1회의 목표 지연 시간(밀리초)")
+    parser.add_argument("--samples", type=int, default=5, help="rounds 값별 측정 횟수")
+    parser.add_argument("--min-rounds", type=int, default=MIN_ROUNDS, help="추천할 최소 rounds 값")
+    args = parser.parse_args()
+
+    results = calibrate(args.target_ms, args.samples, args.min_rounds)
+    print(f"{'rounds':>6} {'median(ms)':>11}")
+    for rounds, elapsed in results.items():
+        print(f"{rounds:>6} {elapsed:>11.1f}")
+
+    within = [rounds for rounds, elapsed in results.items() if elapsed <= args.target_ms]
+    if within:
+        chosen = max(within)
+    else:
+        # 최소 비용도 목표를 넘는 느린 호스트 - 보안을 위해 최소값을 유지
+        chosen = args.min_rounds
+        print(f"# 경고: rounds={chosen}도 목표 {args.target_ms:.0f}ms를 넘습니다")
+    print(f"BCRYPT_ROUNDS={chosen}")
+
+
+if __name__ == "__main__":
+    main()
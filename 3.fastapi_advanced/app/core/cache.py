@@ -0,0 +1,212 @@
+# 시간 측정과 동기화를 위한 표준 라이브러리
+import time
+from collections import OrderedDict
+from threading import Lock
+# 파이썬 타입 힌트를 위한 모듈
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# 환경변수와 설정값들을 가져오기 위한 모듈
+from app.core.config import settings
+
+
+class TTLCache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 스레드 안전 캐시
+
+    maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    ttl초가 지난 항목은 조회 시 만료 처리합니다.
+    maxsize나 ttl이 0 이하이면 캐시를 사용하지 않습니다.
+
+    Attributes:
+        hits (int): 캐시 적중 횟수
+        misses (int): 캐시 미스 횟수 (만료 포함)
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            # 최근 사용 항목으로 이동 (LRU)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장합니다. 크기 제한을 넘으면 가장 오래된 항목을 제거합니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목을 캐시에서 제거합니다."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목을 제거하고 통계를 초기화합니다."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 횟수와 적중률 등 캐시 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+class VersionedResponseCache:
+    """범위(scope)별 버전으로 무효화하는 응답 바이트 캐시
+
+    키는 (범위, 범위의 현재 버전, 요청 파라미터)이며, 데이터가 바뀌면 bump()로
+    범위의 버전만 올립니다. 이전 버전의 항목은 더 이상 조회되지 않고 LRU로 밀려납니다.
+    저장된 바이트 합계가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    다른 프로세스의 변경은 감지할 수 없으므로 ttl초가 지난 항목은 만료 처리합니다.
+    max_bytes나 ttl이 0 이하이면 캐시를 사용하지 않습니다.
+
+    Attributes:
+        hits (int): 캐시 적중 횟수
+        misses (int): 캐시 미스 횟수 (만료 포함)
+        evictions (int): 메모리 한도 때문에 제거된 항목 수
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._versions: Dict[Hashable, int] = {}
+        self._data: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def version(self, scope: Hashable) -> int:
+        """범위의 현재 버전을 반환합니다.
+
+        조회 전에 읽은 버전을 set()에 넘기면, 조회 중에 데이터가 바뀐 경우
+        오래된 결과가 새 버전으로 저장되지 않습니다.
+        """
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def bump(self, *scopes: Hashable) -> None:
+        """범위들의 버전을 올려 해당 범위의 캐시 항목을 모두 무효화합니다."""
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def get(self, scope: Hashable, params: Hashable) -> Optional[bytes]:
+        """범위의 현재 버전으로 캐시된 응답 바이트를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            key = (scope, self._versions.get(scope, 0), params)
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, body = item
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, scope: Hashable, params: Hashable, version: int, body: bytes) -> None:
+        """조회 전에 읽은 version으로 응답 바이트를 저장합니다.
+
+        메모리 한도를 넘으면 가장 오래된 항목부터 제거하며, 한도보다 큰 응답은 저장하지 않습니다.
+        """
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if self._versions.get(scope, 0) != version:
+                # 조회하는 동안 데이터가 바뀜
+                return
+            key = (scope, version, params)
+            self._pop(key)
+            self._data[key] = (time.monotonic() + self.ttl, body)
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def _pop(self, key: Hashable) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._bytes -= len(item[1])
+
+    def clear(self) -> None:
+        """모든 항목을 제거하고 통계를 초기화합니다. (버전은 유지)"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 횟수, 적중률, 사용 중인 메모리 등 캐시 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# 인증된 사용자 캐시: 토큰 주체(사용자 ID) → 사용자 스냅샷
+# 인증이 필요한 모든 요청에서 사용자 행을 다시 읽는 SQL 왕복을 줄이기 위해 사용
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# 도서 목록 응답 캐시: (사용자 ID 또는 "all", 버전, (skip, limit)) → 직렬화된 JSON 바이트
+# 책이 생성/수정/삭제되면 소유자 범위와 "all"(관리자 목록) 범위의 버전이 올라감
+book_list_cache = VersionedResponseCache(
+    max_bytes=settings.BOOK_LIST_CACHE_MAX_BYTES, ttl=settings.BOOK_LIST_CACHE_TTL_SECONDS
+)
+
+# 관리자 목록(모든 책)의 캐시 범위
+ALL_BOOKS_SCOPE = "all"
@@ -1,3 +1,5 @@
+# 키 파일을 다루기 위한 모듈
+import os
 # 안전한 랜덤 토큰 생성을 위한 모듈
 import secrets
 # 파이썬 타입 힌트를 위한 모듈
@@ -6,6 +8,55 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import AnyHttpUrl, BaseSettings, EmailStr, HttpUrl, PostgresDsn, validator
 
 
+def to_async_url(url: str) -> str:
+    """드라이버가 지정되지 않은 데이터베이스 URL에 비동기 드라이버를 붙입니다.
+
+    Args:
+        url: 데이터베이스 URL (예: sqlite:///./sql_app.db)
+
+    Returns:
+        str: 비동기 드라이버 URL (예: sqlite+aiosqlite:///./sql_app.db)
+    """
+    scheme, sep, rest = url.partition("://")
+    async_drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    return async_drivers.get(scheme, scheme) + sep + rest
+
+
+def load_or_create_secret_key(path: str) -> str:
+    """키 파일에서 서명 키를 읽고, 파일이 없으면 새 키를 만들어 저장합니다.
+
+    여러 프로세스가 동시에 시작해도 모두 같은 키를 사용하도록, 새 키는 임시 파일에 쓴 뒤
+    os.link로 원자적으로 게시합니다. 먼저 게시한 프로세스의 키가 사용되며 나머지는 그 키를 읽습니다.
+
+    Args:
+        path: 키 파일 경로
+
+    Returns:
+        str: 서명 키
+
+    Raises:
+        ValueError: 키 파일이 비어 있는 경우
+    """
+    if not os.path.exists(path):
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        # 소유자만 읽을 수 있도록 생성
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(secrets.token_urlsafe(32))
+            os.link(temp_path, path)
+        except FileExistsError:
+            # 다른 프로세스가 먼저 만듦
+            pass
+        finally:
+            os.unlink(temp_path)
+    with open(path) as f:
+        key = f.read().strip()
+    if not key:
+        raise ValueError(f"Secret key file {path} is empty")
+    return key
+
+
 class Settings(BaseSettings):
     """애플리케이션의 환경변수와 설정값들을 관리하는 클래스
     
@@ -15,14 +66,80 @@ class Settings(BaseSettings):
     # API 버전 경로 (기본값: /api/v1)
     API_V1_STR: str = "/api/v1"
     
+    # JWT 토큰 서명 키 파일 경로 (SECRET_KEY를 지정하지 않은 경우에 사용)
+    # 파일이 없으면 처음 시작한 프로세스가 키를 만들어 저장하고, 다른 워커 프로세스는 같은 키를 읽음
+    SECRET_KEY_FILE: Optional[str] = None
+
     # JWT 토큰 생성에 사용될 비밀키
-    # 기본값: 32바이트 랜덤 URL-safe 토큰
-    SECRET_KEY: str = secrets.token_urlsafe(32)
+    # 지정하지 않으면 SECRET_KEY_FILE에서 읽고, 그것도 없으면 프로세스마다 32바이트 랜덤 키를 생성
+    # (랜덤 키는 단일 프로세스 전용 - 워커마다 키가 달라 다른 워커가 발급한 토큰을 검증할 수 없음)
+    SECRET_KEY: str = ""
+
+    @validator("SECRET_KEY", pre=True, always=True)
+    def resolve_secret_key(cls, v: Optional[str], values: Dict[str, Any]) -> str:
+        """서명 키를 결정합니다. (SECRET_KEY → SECRET_KEY_FILE → 프로세스별 랜덤 키)"""
+        if v:
+            return v
+        if values.get("SECRET_KEY_FILE"):
+            return load_or_create_secret_key(values["SECRET_KEY_FILE"])
+        return secrets.token_urlsafe(32)
     
     # JWT 토큰 만료 시간 (8일)
     # 60분 * 24시간 * 8일 = 11,520분
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     
+    # 인증된 사용자 캐시 설정
+    # 최대 캐시 항목 수 (0이면 캐시 사용 안 함)
+    USER_CACHE_MAXSIZE: int = 1024
+    # 캐시 항목 유지 시간(초) - 다른 프로세스에서 변경된 사용자 정보가 반영되는 최대 지연 시간
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # 도서 목록(GET /books/) 응답 캐시 설정
+    # 캐시된 응답 바이트의 최대 합계 (0이면 캐시 사용 안 함, 기본값 64MiB)
+    BOOK_LIST_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # 캐시 항목 유지 시간(초) - 다른 프로세스에서 변경된 책이 반영되는 최대 지연 시간
+    BOOK_LIST_CACHE_TTL_SECONDS: float = 60.0
+
+    # bcrypt 비용(rounds) - 해싱 1회 시간이 2^rounds에 비례
+    # 지정하지 않으면 passlib 기본값(12)을 사용하고 기존 해시를 다시 해시하지 않음
+    # 지정하면 다른 비용으로 저장된 해시는 로그인 시 백그라운드에서 다시 해시됨
+    # 호스트에 맞는 값은 `python -m app.calibrate_hashing`으로 측정
+    BCRYPT_ROUNDS: Optional[int] = None
+
+    # 비밀번호 해싱 프로세스 풀 설정
+    # 프로세스 수 (지정하지 않으면 CPU 코어 수, 0이면 요청 처리 스레드에서 직접 실행)
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # 동시에 실행/대기할 수 있는 최대 해싱 작업 수 (초과 시 503 응답)
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    # 503 응답의 Retry-After 헤더 값(초)
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # 요청별 처리 시간 측정 (app/core/timing.py)
+    # True이면 응답에 Server-Timing 헤더(db 시간/쿼리 수, auth, serialize, total)를 붙이고
+    # 요청마다 "app.timing" 로거로 INFO 로그 한 줄을 남김
+    SERVER_TIMING: bool = True
+
+    # 애플리케이션 시작(startup 이벤트) 시 테이블 생성과 관리자 계정 생성 여부 (app/initial_data.py)
+    # 기본값 False - 배포할 때 `python -m app.initial_data`로 한 번만 실행하여
+    # 워커가 시작될 때마다 DDL과 관리자 조회 쿼리를 반복하지 않음 (개발 환경에서는 True로 두면 편리)
+    INIT_DB_ON_STARTUP: bool = False
+
+    # 런타임 지표 (app/core/metrics.py, app/api/metrics.py)
+    # True이면 라우트별 요청 수/지연 시간을 기록하고 GET /metrics로
+    # 연결 풀, 캐시 적중률, 해싱 시간 등과 함께 Prometheus 텍스트 형식으로 제공
+    METRICS_ENABLED: bool = True
+
+    # 목록 응답(GET /books/, GET /users/) 빠른 직렬화 모드
+    # True이면 ORM 객체와 응답 모델 검증 없이, 응답 스키마의 열만 SELECT한 행에서 바로 JSON을 만듦
+    # (출력은 기존 방식과 바이트 단위로 같음 - app/schemas/encoder.py 참고)
+    FAST_JSON_RESPONSES: bool = False
+
+    # 도서 대량 등록(POST /books/bulk) 설정
+    # 한 번에 검증하고 한 트랜잭션으로 저장할 행 수 (요청의 batch_size 파라미터로 변경 가능)
+    BOOK_IMPORT_BATCH_SIZE: int = 1000
+    # 도서 내보내기(GET /books/export)에서 한 번에 읽고 인코딩할 행 수
+    BOOK_EXPORT_BATCH_SIZE: int = 1000
+
     # CORS 설정: 허용된 원본(Origin) 목록
     # JSON 형식의 URL 목록으로 지정
     # 예: '["http://localhost", "http://localhost:4200"]'
@@ -56,6 +173,73 @@ class Settings(BaseSettings):
     # 예: sqlite:///./sql_app.db
     DATABASE_URL: str
 
+    # 비동기 데이터베이스 모드 사용 여부 (기본값: 사용 안 함)
+    # True이면 async def 엔드포인트와 AsyncSession을 사용하여
+    # 요청이 스레드풀 워커를 점유하지 않고 DB 응답을 기다림
+    ASYNC_DB: bool = False
+
+    # 비동기 드라이버용 데이터베이스 URL
+    # 지정하지 않으면 DATABASE_URL에서 자동으로 만듦
+    # 예: sqlite:///./sql_app.db → sqlite+aiosqlite:///./sql_app.db
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    @validator("ASYNC_DATABASE_URL", pre=True, always=True)
+    def assemble_async_db_url(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
+        """DATABASE_URL에 대응하는 비동기 드라이버 URL을 만듭니다.
+
+        Args:
+            v: 직접 지정한 비동기 URL
+            values: 앞서 검증된 설정값들
+
+        Returns:
+            Optional[str]: 비동기 드라이버 URL
+        """
+        if v:
+            return v
+        url = values.get("DATABASE_URL")
+        return to_async_url(url) if url else None
+
+    # 데이터베이스 연결 풀 설정
+    # 쓰기(기본) 연결 풀 크기와 풀이 가득 찼을 때 추가로 열 수 있는 연결 수
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # 풀에서 연결을 기다리는 최대 시간(초)
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # 서버 측 유휴 연결 종료에 대비해 이 시간(초)이 지난 연결은 다시 연결 (SQLite 제외)
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # 풀에서 꺼낼 때 연결이 살아 있는지 확인 (SQLite 제외)
+    DB_POOL_PRE_PING: bool = True
+    # 실행되는 SQL을 로그로 출력
+    DB_ECHO: bool = False
+
+    # 읽기 전용 연결 풀 크기 - 조회 엔드포인트가 쓰기 풀과 분리된 연결을 사용 (0이면 사용 안 함)
+    DB_READ_POOL_SIZE: int = 5
+    # 읽기 전용 연결에 사용할 URL (지정하지 않으면 DATABASE_URL)
+    # 복제본을 지정하면 복제 지연만큼 조회 결과가 늦게 반영될 수 있음
+    DATABASE_READ_URL: Optional[str] = None
+    # 읽기 전용 연결의 비동기 드라이버 URL (지정하지 않으면 DATABASE_READ_URL에서 자동으로 만듦)
+    ASYNC_DATABASE_READ_URL: Optional[str] = None
+
+    @validator("ASYNC_DATABASE_READ_URL", pre=True, always=True)
+    def assemble_async_read_db_url(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
+        """DATABASE_READ_URL에 대응하는 비동기 드라이버 URL을 만듭니다."""
+        if v:
+            return v
+        url = values.get("DATABASE_READ_URL")
+        return to_async_url(url) if url else None
+
+    # SQLite 연결 설정 (연결마다 PRAGMA로 적용)
+    # 저널 모드 - WAL이면 읽기와 쓰기가 서로를 막지 않음 (빈 값이면 변경하지 않음)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    # WAL 모드에서 NORMAL은 커밋마다 fsync하지 않아 쓰기가 빠르고, 전원 장애 시에만 마지막 커밋이 유실될 수 있음
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    # 연결별 페이지 캐시 크기(KiB)
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    # 메모리 맵으로 읽을 데이터베이스 파일 크기(바이트, 0이면 사용 안 함)
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    # 다른 연결이 쓰기 락을 잡고 있을 때 기다리는 최대 시간(밀리초)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
     # 초기 관리자 계정 설정
     FIRST_SUPERUSER: EmailStr  # 관리자 이메일
     FIRST_SUPERUSER_PASSWORD: str  # 관리자 비밀번호
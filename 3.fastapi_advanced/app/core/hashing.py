@@ -0,0 +1,171 @@
+# 비밀번호 해싱 전용 프로세스 풀
+# bcrypt는 CPU를 오래 사용하는 작업이라 요청 처리 스레드에서 직접 실행하면
+# 로그인 요청이 몰릴 때 스레드풀과 GIL을 점유하여 다른 API까지 느려집니다.
+# 해싱/검증을 별도 프로세스 풀에서 실행하고, 대기 중인 작업 수를 제한하여
+# 한도를 넘는 요청은 503 (Retry-After)으로 즉시 거절합니다.
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+# 파이썬 타입 힌트를 위한 모듈
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+# 비밀번호 해시화와 검증을 위한 라이브러리
+from passlib.context import CryptContext
+
+# 환경변수와 설정값들을 가져오기 위한 모듈
+from app.core.config import settings
+# 해싱 소요 시간 분포 지표 (/metrics)
+from app.core.metrics import password_hash_duration_seconds
+
+# 비밀번호 해시화에 사용될 컨텍스트 설정
+# bcrypt 알고리즘을 사용하며, 내부적으로 자동 마이그레이션 지원
+# BCRYPT_ROUNDS를 지정하면 그 비용으로 해시하고, 다른 비용의 해시는 needs_update로 감지됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    **({"bcrypt__rounds": settings.BCRYPT_ROUNDS} if settings.BCRYPT_ROUNDS else {}),
+)
+
+
+# 프로세스 풀의 워커에서 실행되는 함수들 (피클링을 위해 모듈 최상위에 정의)
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashBusy(HTTPException):
+    """해싱 대기열이 가득 차서 요청을 받을 수 없을 때 발생 (503 + Retry-After)"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=503,
+            detail="Too many password hashing requests, try again later",
+            headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+        )
+
+
+class PasswordHasher:
+    """비밀번호 해싱/검증을 프로세스 풀에서 실행하고 동시 작업 수를 제한하는 클래스
+
+    Args:
+        workers: 프로세스 수 (None이면 CPU 코어 수, 0이면 프로세스 풀 없이 호출 스레드에서 실행)
+        max_pending: 동시에 실행/대기할 수 있는 최대 작업 수 (초과 시 PasswordHashBusy)
+
+    Attributes:
+        in_flight (int): 현재 실행/대기 중인 작업 수 (대기열 깊이)
+        rejected (int): 대기열이 가득 차서 거절된 요청 수
+        count (int): 완료된 작업 수
+        total_seconds (float): 완료된 작업의 누적 소요 시간 (대기 시간 포함)
+        max_seconds (float): 가장 오래 걸린 작업의 소요 시간
+    """
+
+    def __init__(self, workers: Optional[int], max_pending: int):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.rejected = 0
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 멀티스레드 서버 프로세스를 fork하지 않도록 spawn 방식 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _admit(self) -> float:
+        """대기열에 자리가 있으면 작업을 등록하고 시작 시각을 반환합니다."""
+        with self._lock:
+            if self.in_flight >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHashBusy()
+            self.in_flight += 1
+        return time.perf_counter()
+
+    def _release(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        password_hash_duration_seconds.observe(elapsed)
+        with self._lock:
+            self.in_flight -= 1
+            self.count += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def _submit(self, fn: Callable, *args: Any) -> "Future[Any]":
+        started = self._admit()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release(started)
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def _run(self, fn: Callable, *args: Any) -> Any:
+        if self.workers == 0:
+            started = self._admit()
+            try:
+                return fn(*args)
+            finally:
+                self._release(started)
+        return self._submit(fn, *args).result()
+
+    async def _run_async(self, fn: Callable, *args: Any) -> Any:
+        if self.workers == 0:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._run, fn, *args)
+        # 프로세스 풀의 결과를 기다리는 동안 스레드를 점유하지 않음
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run_async(_verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료합니다. 이후 요청이 오면 다시 생성됩니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 깊이와 해싱 소요 시간 등 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "rejected": self.rejected,
+                "count": self.count,
+                "total_seconds": self.total_seconds,
+                "avg_seconds": self.total_seconds / self.count if self.count else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+
+# 애플리케이션 전역에서 공유하는 해싱 풀
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,232 @@
+# 런타임 지표 (Prometheus 텍스트 형식)
+# 요청 수/지연 시간 같은 누적 지표는 기록 경로에서 락을 잡지 않도록 스레드별 조각(shard)에 기록하고,
+# /metrics 조회 시 모든 조각을 합칩니다. 락은 스레드가 처음 기록할 때 조각을 등록하는 순간에만 사용합니다.
+# 연결 풀 상태나 캐시 적중률처럼 현재 값을 읽으면 되는 지표는 조회 시점에 콜백으로 계산합니다.
+from bisect import bisect_left
+from threading import Lock, local
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Labels = Tuple[str, ...]
+
+# 기본 지연 시간 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """레이블을 {a="1",b="2"} 형식으로 만듭니다. (레이블이 없으면 빈 문자열)"""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def metric_family(name: str, metric_type: str, help_text: str, label_names: Sequence[str],
+                  samples: Iterable[Tuple[Sequence[str], float]]) -> List[str]:
+    """조회 시점에 계산한 값으로 gauge/counter 지표 줄들을 만듭니다."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines += [f"{name}{format_labels(label_names, labels)} {_format_value(value)}"
+              for labels, value in samples]
+    return lines
+
+class _ShardedMetric:
+    """스레드별 조각에 기록하고 조회 시 합치는 지표의 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._local = local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._lock = Lock()
+
+    def _shard(self) -> Dict[Labels, Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[Labels, Any] = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _snapshot(self) -> List[Tuple[Labels, Any]]:
+        with self._lock:
+            shards = list(self._shards)
+        # 다른 스레드가 기록 중인 조각도 복사해서 읽음 (직후의 기록은 다음 조회에 반영됨)
+        return [item for shard in shards for item in list(shard.items())]
+
+    def collect(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+
+class Counter(_ShardedMetric):
+    """증가만 하는 누적 값"""
+
+    type_name = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Labels, float]:
+        totals: Dict[Labels, float] = {}
+        for labels, value in self._snapshot():
+            totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def collect(self) -> List[str]:
+        return super().collect() + [
+            f"{self.name}{format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+class Gauge(Counter):
+    """증가/감소하는 현재 값 (예: 처리 중인 요청 수)
+
+    스레드별 조각에는 증감량이 기록되며, 합계가 현재 값입니다.
+    """
+
+    type_name = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+class Histogram(_ShardedMetric):
+    """값의 분포 (구간별 개수, 합계, 개수)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # [구간별 개수 (마지막은 +Inf), 합계]
+            state = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def values(self) -> Dict[Labels, Tuple[List[int], float]]:
+        """레이블별 (누적 구간 개수, 합계)를 반환합니다."""
+        merged: Dict[Labels, Tuple[List[int], float]] = {}
+        for labels, (counts, total) in self._snapshot():
+            current = merged.get(labels)
+            if current is None:
+                merged[labels] = (list(counts), total)
+            else:
+                merged[labels] = ([a + b for a, b in zip(current[0], counts)], current[1] + total)
+        for labels, (counts, total) in merged.items():
+            running = 0
+            for index, count in enumerate(counts):
+                running += count
+                counts[index] = running
+        return merged
+
+    def collect(self) -> List[str]:
+        lines = super().collect()
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        names = self.label_names + ("le",)
+        for labels, (counts, total) in sorted(self.values().items()):
+            lines += [f"{self.name}_bucket{format_labels(names, labels + (bound,))} {count}"
+                      for bound, count in zip(bounds, counts)]
+            label_text = format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {total!r}")
+            lines.append(f"{self.name}_count{label_text} {counts[-1]}")
+        return lines
+
+M = TypeVar("M", bound=_ShardedMetric)
+
+class Registry:
+    """지표와 조회 시점 콜백을 모아 Prometheus 텍스트로 출력합니다."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_ShardedMetric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        """조회할 때마다 호출되어 지표 줄들을 반환하는 콜백을 등록합니다."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines += metric.collect()
+        for collector in self._collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+http_requests_total = REGISTRY.register(Counter(
+    "http_requests_total", "Total HTTP requests by method, route and status.",
+    ("method", "route", "status"),
+))
+http_request_duration_seconds = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds by method and route.",
+    ("method", "route"),
+))
+http_requests_in_progress = REGISTRY.register(Gauge(
+    "http_requests_in_progress", "HTTP requests currently being processed.",
+))
+password_hash_duration_seconds = REGISTRY.register(Histogram(
+    "password_hash_duration_seconds",
+    "Password hash/verify duration in seconds, including time queued for the pool.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+))
+
+# 라우트 템플릿을 알 수 없는 요청(404 등)의 route 레이블 - 임의의 경로로 레이블이 늘어나지 않도록 함
+UNMATCHED_ROUTE = "<unmatched>"
+
+def route_label(scope: Scope) -> str:
+    """지표의 route 레이블 (경로 매개변수를 값 대신 템플릿으로 표시, 예: /api/v1/books/{book_id})
+
+    API 라우트(TimedRoute)는 매칭될 때 scope에 route_path를 남기고,
+    그 외 라우트(문서, /metrics)는 경로 매개변수가 없으므로 요청 경로를 그대로 사용합니다.
+    """
+    route = scope.get("route_path")
+    if route is not None:
+        return route
+    return scope["path"] if "endpoint" in scope else UNMATCHED_ROUTE
+
+class MetricsMiddleware:
+    """요청 수(상태 코드별), 라우트별 지연 시간, 처리 중인 요청 수를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec()
+            route = route_label(scope)
+            http_request_duration_seconds.observe(perf_counter() - start, (scope["method"], route))
+            http_requests_total.inc((scope["method"], route, str(status)))
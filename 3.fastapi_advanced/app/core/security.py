@@ -4,14 +4,10 @@ from datetime import datetime, timedelta
 from typing import Any, Union
 # JWT(인증 토큰) 처리를 위한 PyJWT 라이브러리
 from jose import jwt
-# 비밀번호 해시화와 검증을 위한 라이브러리
-from passlib.context import CryptContext
 # 환경변수와 설정값들을 가져오기 위한 모듈
 from app.core.config import settings
-
-# 비밀번호 해시화에 사용될 컨텍스트 설정
-# bcrypt 알고리즘을 사용하며, 내부적으로 자동 마이그레이션 지원
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱 프로세스 풀 (pwd_context는 기존 임포트 경로 호환을 위해 함께 노출)
+from app.core.hashing import password_hasher, pwd_context
 
 # JWT 토큰 생성에 사용될 알고리즘
 # HS256: HMAC + SHA256 알고리즘
@@ -63,9 +59,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     Returns:
         bool: 비밀번호가 일치하면 True, 아니면 False
+
+    Raises:
+        PasswordHashBusy: 해싱 대기열이 가득 찬 경우 (503)
     """
-    # passlib의 verify 함수를 사용하여 비밀번호 검증
-    return pwd_context.verify(plain_password, hashed_password)
+    # 해싱 프로세스 풀에서 passlib의 verify 함수로 비밀번호 검증
+    return password_hasher.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """입력된 비밀번호를 안전하게 해시화합니다.
@@ -75,6 +74,30 @@ def get_password_hash(password: str) -> str:
     
     Returns:
         str: bcrypt로 해시화된 비밀번호
+
+    Raises:
+        PasswordHashBusy: 해싱 대기열이 가득 찬 경우 (503)
     """
-    # passlib의 hash 함수를 사용하여 비밀번호 해시화
-    return pwd_context.hash(password)
+    # 해싱 프로세스 풀에서 passlib의 hash 함수로 비밀번호 해시화
+    return password_hasher.hash(password)
+
+def password_needs_update(hashed_password: str) -> bool:
+    """저장된 해시가 현재 해시 설정(BCRYPT_ROUNDS 등)과 다른지 확인합니다.
+
+    해시 문자열만 검사하므로 bcrypt 연산 없이 빠르게 실행됩니다.
+
+    Args:
+        hashed_password: 데이터베이스에 저장된 해시화된 비밀번호
+
+    Returns:
+        bool: 현재 설정으로 다시 해시해야 하면 True
+    """
+    return pwd_context.needs_update(hashed_password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password의 비동기 버전 - 결과를 기다리는 동안 스레드를 점유하지 않습니다."""
+    return await password_hasher.verify_async(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash의 비동기 버전 - 결과를 기다리는 동안 스레드를 점유하지 않습니다."""
+    return await password_hasher.hash_async(password)
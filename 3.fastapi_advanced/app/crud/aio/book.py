@@ -0,0 +1,264 @@
+# 파이썬 타입 힌트를 위한 모듈
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+# SQLAlchemy 쿼리 생성 함수와 비동기 세션
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
+
+# 데이터베이스 모델과 스키마 임포트
+# 커서 인코딩, 대량 등록 행 분류, 내보내기/검색 쿼리, 관계 로딩 옵션은 동기 버전과 공유
+# (AsyncSession에서는 지연 로딩이 동작하지 않으므로 관계가 필요하면 반드시 options로 함께 로딩)
+from app.crud.book import (
+    WITH_OWNER, book_rows_query, decode_cursor, encode_cursor, export_query,
+    invalidate_book_lists, search_query, split_import_rows,
+)
+from app.db.models.book import Book  # SQLAlchemy 모델
+from app.schemas.book import BookCreate, BookUpdate  # Pydantic 모델
+
+async def get_book(
+    db: AsyncSession, book_id: int, options: Sequence[LoaderOption] = ()
+) -> Optional[Book]:
+    """특정 ID의 책을 조회합니다. (app.crud.book.get_book의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        book_id (int): 조회할 책의 ID
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        Optional[Book]: 책이 존재하면 Book 객체를, 없으면 None을 반환
+    """
+    result = await db.execute(select(Book).options(*options).where(Book.id == book_id))
+    return result.scalars().first()
+
+async def get_books(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None,
+    options: Sequence[LoaderOption] = ()
+) -> List[Book]:
+    """책 목록을 조회합니다. (app.crud.book.get_books의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        skip (int): 건너뛸 항목 수 (기본값: 0)
+        limit (int): 가져올 최대 항목 수 (기본값: 100)
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        List[Book]: 책 목록
+    """
+    query = select(Book).options(*options)
+    if user_id:
+        query = query.where(Book.user_id == user_id)
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_book_rows(
+    db: AsyncSession,
+    columns: Sequence[str],
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None
+) -> List[Row]:
+    """책 목록을 지정한 열의 행으로 조회합니다. (app.crud.book.get_book_rows의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        columns (Sequence[str]): 조회할 Book 속성 이름
+        skip (int): 건너뛸 항목 수 (기본값: 0)
+        limit (int): 가져올 최대 항목 수 (기본값: 100)
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+
+    Returns:
+        List[Row]: columns 순서의 값으로 이루어진 행 목록
+    """
+    result = await db.execute(book_rows_query(columns, skip=skip, limit=limit, user_id=user_id))
+    return result.all()
+
+async def search_books(
+    db: AsyncSession,
+    q: str,
+    skip: int = 0,
+    limit: int = 20,
+    user_id: Optional[int] = None,
+    options: Sequence[LoaderOption] = ()
+) -> List[Book]:
+    """제목, 저자, 설명에서 단어로 책을 검색합니다. (app.crud.book.search_books의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        q (str): 사용자 검색어 (예: "fast pyth*")
+        skip (int): 건너뛸 항목 수 (기본값: 0)
+        limit (int): 가져올 최대 항목 수 (기본값: 20)
+        user_id (Optional[int]): 특정 사용자의 책만 검색하려면 해당 사용자 ID 지정
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        List[Book]: bm25 관련도 순으로 정렬된 책 목록
+    """
+    query = search_query(q, skip=skip, limit=limit, user_id=user_id)
+    if query is None:
+        return []
+    result = await db.execute(query.options(*options))
+    return result.scalars().all()
+
+async def get_books_keyset(
+    db: AsyncSession,
+    limit: int = 100,
+    user_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    options: Sequence[LoaderOption] = ()
+) -> Tuple[List[Book], Optional[str]]:
+    """커서(키셋) 방식으로 책 목록을 조회합니다. (app.crud.book.get_books_keyset의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        limit (int): 가져올 최대 항목 수 (기본값: 100)
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+        cursor (Optional[str]): 이전 페이지 응답의 next_cursor (첫 페이지는 None)
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        Tuple[List[Book], Optional[str]]: 책 목록과 다음 페이지 커서 (마지막 페이지면 None)
+
+    Raises:
+        ValueError: 커서가 올바르지 않거나 다른 조회 범위의 커서인 경우
+    """
+    query = select(Book).options(*options)
+    if user_id is not None:
+        query = query.where(Book.user_id == user_id)
+        if cursor is not None:
+            cursor_user_id, last_id = decode_cursor(cursor, 2)
+            if cursor_user_id != user_id:
+                raise ValueError("Invalid cursor")
+            query = query.where(Book.id > last_id)
+        query = query.order_by(Book.user_id, Book.id)
+    else:
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, 1)
+            query = query.where(Book.id > last_id)
+        query = query.order_by(Book.id)
+
+    result = await db.execute(query.limit(limit + 1))
+    books = result.scalars().all()
+    if len(books) <= limit:
+        return books, None
+    books = books[:limit]
+    last = books[-1]
+    key = (last.user_id, last.id) if user_id is not None else (last.id,)
+    return books, encode_cursor(key)
+
+async def iter_book_batches(
+    db: AsyncSession,
+    user_id: Optional[int] = None,
+    batch_size: int = 1000
+) -> AsyncIterator[List[Row]]:
+    """책 행을 batch_size개씩 스트리밍으로 읽어 돌려줍니다. (app.crud.book.iter_book_batches의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        user_id (Optional[int]): 특정 사용자의 책만 읽으려면 해당 사용자 ID 지정
+        batch_size (int): 한 번에 읽을 행 수
+
+    Returns:
+        AsyncIterator[List[Row]]: 행 묶음
+    """
+    result = await db.stream(export_query(user_id).execution_options(yield_per=batch_size))
+    async for rows in result.partitions(batch_size):
+        yield rows
+
+async def create_book(db: AsyncSession, book: BookCreate, user_id: int) -> Book:
+    """새로운 책을 생성합니다. (app.crud.book.create_book의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        book (BookCreate): 생성할 책 정보
+        user_id (int): 책의 소유자 ID
+
+    Returns:
+        Book: 생성된 책 객체
+    """
+    db_book = Book(**book.dict(), user_id=user_id)
+    db.add(db_book)
+    await db.commit()
+    invalidate_book_lists(user_id)
+    return db_book
+
+async def create_books_bulk(
+    db: AsyncSession,
+    books: Sequence[Tuple[int, BookCreate]],
+    user_id: int
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """여러 권의 책을 한 트랜잭션에서 저장합니다. (app.crud.book.create_books_bulk의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        books (Sequence[Tuple[int, BookCreate]]): (요청 내 행 위치, 책 정보) 목록
+        user_id (int): 책의 소유자 ID
+
+    Returns:
+        Tuple[int, List[Tuple[int, str]]]: 저장된 책 수와 (행 위치, ISBN) 중복 목록
+    """
+    isbns = {book.isbn for _, book in books}
+    retried = False
+    while True:
+        result = await db.execute(select(Book.isbn).where(Book.isbn.in_(isbns)))
+        rows, conflicts = split_import_rows(books, set(result.scalars()), user_id)
+        try:
+            if rows:
+                await db.execute(insert(Book), rows)
+            await db.commit()
+            if rows:
+                invalidate_book_lists(user_id)
+            return len(rows), conflicts
+        except IntegrityError:
+            await db.rollback()
+            if retried:
+                raise
+            retried = True
+
+async def update_book(
+    db: AsyncSession,
+    db_book: Book,
+    book_in: BookUpdate
+) -> Book:
+    """기존 책 정보를 업데이트합니다. (app.crud.book.update_book의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        db_book (Book): 업데이트할 기존 책 객체
+        book_in (BookUpdate): 업데이트할 내용
+
+    Returns:
+        Book: 업데이트된 책 객체
+    """
+    update_data = book_in.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_book, field, value)
+    db.add(db_book)
+    await db.commit()
+    invalidate_book_lists(db_book.user_id)
+    return db_book
+
+async def delete_book(db: AsyncSession, book_id: int) -> Optional[Book]:
+    """특정 ID의 책을 삭제합니다. (app.crud.book.delete_book의 비동기 버전)
+
+    Args:
+        db (AsyncSession): 비동기 데이터베이스 세션
+        book_id (int): 삭제할 책의 ID
+
+    Returns:
+        Book: 삭제된 책 객체 (없으면 None)
+    """
+    book = await db.get(Book, book_id)
+    if book:
+        owner_id = book.user_id
+        await db.delete(book)
+        await db.commit()
+        invalidate_book_lists(owner_id)
+    return book
@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+from fastapi import BackgroundTasks
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.exc import StaleDataError
+from app.core.cache import user_cache
+from app.core.security import (
+    get_password_hash_async,
+    password_needs_update,
+    verify_password_async,
+)
+from app.crud.user import (
+    WITH_BOOKS, changed_values, snapshot_user, split_password, user_rows_query,
+)
+from app.db.base import AsyncSessionLocal
+from app.db.models.user import User
+from app.schemas.user import UserCreate, UserUpdate
+
+# bcrypt 해싱/검증은 CPU를 오래 쓰므로 이벤트 루프를 막지 않도록 해싱 프로세스 풀에서 실행
+
+async def get_user(
+    db: AsyncSession, user_id: int, options: Sequence[LoaderOption] = ()
+) -> Optional[User]:
+    """사용자 조회 (비동기, options: 관계 로딩 옵션 - 예: WITH_BOOKS)"""
+    result = await db.execute(select(User).options(*options).where(User.id == user_id))
+    return result.scalars().first()
+
+async def get_user_cached(db: AsyncSession, user_id: int) -> Optional[User]:
+    """캐시를 거쳐 사용자 조회 (비동기, app.crud.user.get_user_cached 참고)"""
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return await db.merge(snapshot, load=False)
+    user = await get_user(db, user_id=user_id)
+    if user is not None:
+        user_cache.set(user_id, snapshot_user(user))
+    return user
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    """이메일로 사용자 조회 (비동기)"""
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+async def get_users(
+    db: AsyncSession, skip: int = 0, limit: int = 100, options: Sequence[LoaderOption] = ()
+) -> List[User]:
+    """사용자 목록 조회 (비동기, options: 관계 로딩 옵션 - 예: WITH_BOOKS)"""
+    result = await db.execute(select(User).options(*options).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_user_rows(
+    db: AsyncSession, columns: Sequence[str], skip: int = 0, limit: int = 100
+) -> List[Row]:
+    """사용자 목록을 지정한 열의 행으로 조회 (비동기)"""
+    result = await db.execute(user_rows_query(columns, skip=skip, limit=limit))
+    return result.all()
+
+async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
+    """사용자 생성 (비동기)"""
+    db_user = User(
+        email=user_in.email,
+        hashed_password=await get_password_hash_async(user_in.password),
+        is_superuser=user_in.is_superuser,
+    )
+    db.add(db_user)
+    await db.commit()
+    return db_user
+
+async def update_user(
+    db: AsyncSession, db_user: User, user_in: Union[UserUpdate, Dict[str, Any]]
+) -> User:
+    """사용자 정보 업데이트 (비동기, app.crud.user.update_user 참고)"""
+    update_data, password = split_password(user_in)
+    update_data = changed_values(db_user, update_data)
+    if password:
+        update_data["hashed_password"] = await get_password_hash_async(password)
+    if not update_data:
+        return db_user
+    user_id = db_user.id
+    for field, value in update_data.items():
+        setattr(db_user, field, value)
+    db.add(db_user)
+    try:
+        await db.commit()
+    except StaleDataError:
+        await db.rollback()
+        user_cache.invalidate(user_id)
+        raise
+    user_cache.invalidate(user_id)
+    return db_user
+
+async def authenticate(
+    db: AsyncSession,
+    email: str,
+    password: str,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Optional[User]:
+    """사용자 인증 (비동기, 오래된 해시는 백그라운드에서 다시 해시)"""
+    user = await get_user_by_email(db, email=email)
+    if not user:
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    if background_tasks is not None and password_needs_update(user.hashed_password):
+        background_tasks.add_task(rehash_password, user.id, user.hashed_password, password)
+    return user
+
+async def rehash_password(user_id: int, old_hash: str, password: str) -> None:
+    """현재 해시 설정으로 비밀번호를 다시 해시하여 저장 (비동기 백그라운드 작업)"""
+    new_hash = await get_password_hash_async(password)
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+    user_cache.invalidate(user_id)
@@ -1,30 +1,50 @@
+# 커서 인코딩을 위한 표준 라이브러리
+import base64
+import json
 # 파이썬 타입 힌트를 위한 모듈
-from typing import List, Optional
-# SQLAlchemy 세션 관리를 위한 클래스
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+# SQLAlchemy 쿼리 생성 함수와 예외
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import IntegrityError
+# SQLAlchemy 세션 관리를 위한 클래스와 관계 로딩 옵션
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+# 도서 목록 응답 캐시
+from app.core.cache import ALL_BOOKS_SCOPE, book_list_cache
 # 데이터베이스 모델과 스키마 임포트
 from app.db.models.book import Book  # SQLAlchemy 모델
+from app.db.search import books_fts, build_match_query, match, rank  # 전문 검색 인덱스
 from app.schemas.book import BookCreate, BookUpdate  # Pydantic 모델
 
-def get_book(db: Session, book_id: int) -> Optional[Book]:
+# 관계 로딩 옵션
+# Book.user는 기본적으로 지연 로딩되어, 목록의 각 책에서 소유자에 접근하면 책마다 SELECT가 한 번씩 실행됨(N+1)
+# 소유자 정보가 필요한 엔드포인트는 조회 함수에 options=WITH_OWNER를 넘겨 같은 SELECT에서 JOIN으로 읽음
+# (다대일 관계라 JOIN해도 행 수가 늘지 않으므로 LIMIT/OFFSET과 함께 써도 안전)
+WITH_OWNER: Tuple[LoaderOption, ...] = (joinedload(Book.user),)
+
+def get_book(db: Session, book_id: int, options: Sequence[LoaderOption] = ()) -> Optional[Book]:
     """특정 ID의 책을 조회합니다.
     
     Args:
         db (Session): 데이터베이스 세션
         book_id (int): 조회할 책의 ID
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
     
     Returns:
         Optional[Book]: 책이 존재하면 Book 객체를, 없으면 None을 반환
     """
     # 해당 ID의 책을 찾아서 반환 (없으면 None 반환)
-    return db.query(Book).filter(Book.id == book_id).first()
+    return db.query(Book).options(*options).filter(Book.id == book_id).first()
 
 def get_books(
     db: Session,
     skip: int = 0,
     limit: int = 100,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    options: Sequence[LoaderOption] = ()
 ) -> List[Book]:
     """책 목록을 조회합니다.
     
@@ -33,12 +53,13 @@ def get_books(
         skip (int): 건너뛸 항목 수 (기본값: 0)
         limit (int): 가져올 최대 항목 수 (기본값: 100)
         user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
     
     Returns:
         List[Book]: 책 목록
     """
     # 기본 쿼리 생성
-    query = db.query(Book)
+    query = db.query(Book).options(*options)
     
     # 특정 사용자의 책만 필터링
     if user_id:
@@ -47,6 +68,250 @@ def get_books(
     # 페이지네이션 적용 후 결과 반환
     return query.offset(skip).limit(limit).all()
 
+def book_rows_query(
+    columns: Sequence[str],
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None
+) -> Select:
+    """get_books와 같은 책 목록에서 지정한 열만 SELECT하는 문을 만듭니다.
+
+    Args:
+        columns (Sequence[str]): 조회할 Book 속성 이름 (예: 응답 인코더의 names)
+        skip (int): 건너뛸 항목 수
+        limit (int): 가져올 최대 항목 수
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+
+    Returns:
+        Select: 열 목록 SELECT 문
+    """
+    query = select(*(getattr(Book, name) for name in columns))
+    if user_id:
+        query = query.where(Book.user_id == user_id)
+    return query.offset(skip).limit(limit)
+
+def get_book_rows(
+    db: Session,
+    columns: Sequence[str],
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None
+) -> List[Row]:
+    """책 목록을 ORM 객체 없이 지정한 열의 행으로 조회합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        columns (Sequence[str]): 조회할 Book 속성 이름
+        skip (int): 건너뛸 항목 수 (기본값: 0)
+        limit (int): 가져올 최대 항목 수 (기본값: 100)
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+
+    Returns:
+        List[Row]: columns 순서의 값으로 이루어진 행 목록
+    """
+    return db.execute(book_rows_query(columns, skip=skip, limit=limit, user_id=user_id)).all()
+
+def search_query(
+    q: str,
+    skip: int = 0,
+    limit: int = 20,
+    user_id: Optional[int] = None
+) -> Optional[Select]:
+    """전문 검색 SELECT 문을 만듭니다.
+
+    Args:
+        q (str): 사용자 검색어 (단어 뒤에 '*'를 붙이면 접두사 검색)
+        skip (int): 건너뛸 항목 수
+        limit (int): 가져올 최대 항목 수
+        user_id (Optional[int]): 특정 사용자의 책만 검색하려면 해당 사용자 ID 지정
+
+    Returns:
+        Optional[Select]: bm25 관련도 순으로 정렬된 쿼리, 검색어에 단어가 없으면 None
+    """
+    match_query = build_match_query(q)
+    if match_query is None:
+        return None
+    query = (
+        select(Book)
+        .join(books_fts, books_fts.c.rowid == Book.id)
+        .where(match(match_query))
+    )
+    if user_id is not None:
+        query = query.where(Book.user_id == user_id)
+    return query.order_by(rank(), Book.id).offset(skip).limit(limit)
+
+def search_books(
+    db: Session,
+    q: str,
+    skip: int = 0,
+    limit: int = 20,
+    user_id: Optional[int] = None,
+    options: Sequence[LoaderOption] = ()
+) -> List[Book]:
+    """제목, 저자, 설명에서 단어로 책을 검색합니다. (SQLite FTS5)
+
+    색인을 사용하므로 전체 목록을 훑지 않으며, 결과는 bm25 관련도 순입니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        q (str): 사용자 검색어 (예: "fast pyth*")
+        skip (int): 건너뛸 항목 수 (기본값: 0)
+        limit (int): 가져올 최대 항목 수 (기본값: 20)
+        user_id (Optional[int]): 특정 사용자의 책만 검색하려면 해당 사용자 ID 지정
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        List[Book]: 검색된 책 목록
+    """
+    query = search_query(q, skip=skip, limit=limit, user_id=user_id)
+    if query is None:
+        return []
+    return db.execute(query.options(*options)).scalars().all()
+
+def encode_cursor(key: Tuple[int, ...]) -> str:
+    """마지막으로 반환한 행의 정렬 키를 불투명한 커서 문자열로 인코딩합니다.
+
+    Args:
+        key (Tuple[int, ...]): 정렬 키 - (id) 또는 (user_id, id)
+
+    Returns:
+        str: URL에 안전한 base64 커서 문자열
+    """
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> Tuple[int, ...]:
+    """커서 문자열을 정렬 키로 디코딩합니다.
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서 문자열
+        size (int): 기대하는 정렬 키의 길이
+
+    Returns:
+        Tuple[int, ...]: 정렬 키
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (
+        not isinstance(key, list)
+        or len(key) != size
+        or not all(isinstance(v, int) and not isinstance(v, bool) for v in key)
+    ):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+def get_books_keyset(
+    db: Session,
+    limit: int = 100,
+    user_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    options: Sequence[LoaderOption] = ()
+) -> Tuple[List[Book], Optional[str]]:
+    """커서(키셋) 방식으로 책 목록을 조회합니다.
+
+    OFFSET처럼 앞쪽 행을 읽고 버리지 않고, 마지막 행의 정렬 키 다음부터
+    인덱스를 탐색하므로 페이지 깊이와 관계없이 일정한 시간에 조회됩니다.
+    전체 조회는 (id), 사용자별 조회는 (user_id, id) 순서로 탐색합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        limit (int): 가져올 최대 항목 수 (기본값: 100)
+        user_id (Optional[int]): 특정 사용자의 책만 조회하려면 해당 사용자 ID 지정
+        cursor (Optional[str]): 이전 페이지 응답의 next_cursor (첫 페이지는 None)
+        options (Sequence[LoaderOption]): 관계 로딩 옵션 (예: WITH_OWNER)
+
+    Returns:
+        Tuple[List[Book], Optional[str]]: 책 목록과 다음 페이지 커서 (마지막 페이지면 None)
+
+    Raises:
+        ValueError: 커서가 올바르지 않거나 다른 조회 범위의 커서인 경우
+    """
+    query = db.query(Book).options(*options)
+
+    if user_id is not None:
+        # (user_id, id) 복합 인덱스를 따라 탐색
+        query = query.filter(Book.user_id == user_id)
+        if cursor is not None:
+            cursor_user_id, last_id = decode_cursor(cursor, 2)
+            if cursor_user_id != user_id:
+                raise ValueError("Invalid cursor")
+            query = query.filter(Book.id > last_id)
+        query = query.order_by(Book.user_id, Book.id)
+    else:
+        # 기본 키 (id) 순서로 탐색
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, 1)
+            query = query.filter(Book.id > last_id)
+        query = query.order_by(Book.id)
+
+    # 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회
+    books = query.limit(limit + 1).all()
+    if len(books) <= limit:
+        return books, None
+    books = books[:limit]
+    last = books[-1]
+    key = (last.user_id, last.id) if user_id is not None else (last.id,)
+    return books, encode_cursor(key)
+
+# 내보내기에 포함할 열 (응답 스키마 Book과 같은 필드)
+EXPORT_COLUMNS = (
+    Book.id, Book.title, Book.author, Book.published_year,
+    Book.isbn, Book.description, Book.user_id,
+)
+
+def export_query(user_id: Optional[int] = None) -> Select:
+    """내보내기용 SELECT 문을 만듭니다.
+
+    ORM 객체 대신 열 값만 조회하며, 사용자별 조회는 (user_id, id) 인덱스 순서로 읽습니다.
+
+    Args:
+        user_id (Optional[int]): 특정 사용자의 책만 내보내려면 해당 사용자 ID 지정
+
+    Returns:
+        Select: 내보내기 쿼리
+    """
+    query = select(*EXPORT_COLUMNS)
+    if user_id is not None:
+        return query.where(Book.user_id == user_id).order_by(Book.user_id, Book.id)
+    return query.order_by(Book.id)
+
+def iter_book_batches(
+    db: Session,
+    user_id: Optional[int] = None,
+    batch_size: int = 1000
+) -> Iterator[List[Row]]:
+    """책 행을 batch_size개씩 서버 측 커서로 읽어 돌려줍니다.
+
+    전체 결과를 메모리에 올리지 않으므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        user_id (Optional[int]): 특정 사용자의 책만 읽으려면 해당 사용자 ID 지정
+        batch_size (int): 한 번에 읽을 행 수
+
+    Returns:
+        Iterator[List[Row]]: 행 묶음
+    """
+    result = db.execute(
+        export_query(user_id).execution_options(stream_results=True, yield_per=batch_size)
+    )
+    for rows in result.partitions(batch_size):
+        yield rows
+
+def invalidate_book_lists(user_id: int) -> None:
+    """책이 바뀐 사용자의 목록 캐시와 관리자 목록 캐시를 무효화합니다.
+
+    Args:
+        user_id (int): 바뀐 책의 소유자 ID
+    """
+    book_list_cache.bump(user_id, ALL_BOOKS_SCOPE)
+
 def create_book(db: Session, book: BookCreate, user_id: int) -> Book:
     """새로운 책을 생성합니다.
     
@@ -66,13 +331,79 @@ def create_book(db: Session, book: BookCreate, user_id: int) -> Book:
     
     # 데이터베이스에 추가
     db.add(db_book)
-    # 변경사항 저장
+    # 변경사항 저장 (id는 INSERT 결과에서, 기본값은 파이썬에서 채워지므로 refresh 불필요)
     db.commit()
-    # 생성된 객체 정보 새로고침
-    db.refresh(db_book)
+    # 목록 캐시 무효화
+    invalidate_book_lists(user_id)
     
     return db_book
 
+def split_import_rows(
+    books: Sequence[Tuple[int, BookCreate]],
+    existing_isbns: Set[str],
+    user_id: int
+) -> Tuple[List[Dict[str, Any]], List[Tuple[int, str]]]:
+    """대량 등록할 행을 저장할 행과 ISBN이 중복되는 행으로 나눕니다.
+
+    Args:
+        books (Sequence[Tuple[int, BookCreate]]): (요청 내 행 위치, 책 정보) 목록
+        existing_isbns (Set[str]): 데이터베이스에 이미 있는 ISBN
+        user_id (int): 책의 소유자 ID
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Tuple[int, str]]]:
+            INSERT에 넘길 행 목록과 (행 위치, ISBN) 중복 목록
+    """
+    rows: List[Dict[str, Any]] = []
+    conflicts: List[Tuple[int, str]] = []
+    seen: Set[str] = set()
+    for index, book in books:
+        # 이미 저장된 ISBN이거나 같은 배치에서 앞서 나온 ISBN이면 건너뜀
+        if book.isbn in existing_isbns or book.isbn in seen:
+            conflicts.append((index, book.isbn))
+            continue
+        seen.add(book.isbn)
+        rows.append({**book.dict(), "user_id": user_id})
+    return rows, conflicts
+
+def create_books_bulk(
+    db: Session,
+    books: Sequence[Tuple[int, BookCreate]],
+    user_id: int
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """여러 권의 책을 한 트랜잭션에서 executemany로 저장합니다.
+
+    ISBN이 이미 있거나 배치 안에서 중복되는 행은 건너뛰고 보고하며,
+    나머지 행은 객체 생성/refresh 없이 한 번의 INSERT 문으로 저장합니다.
+    중복 확인과 저장 사이에 다른 요청이 같은 ISBN을 저장하면 한 번 다시 확인합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        books (Sequence[Tuple[int, BookCreate]]): (요청 내 행 위치, 책 정보) 목록
+        user_id (int): 책의 소유자 ID
+
+    Returns:
+        Tuple[int, List[Tuple[int, str]]]: 저장된 책 수와 (행 위치, ISBN) 중복 목록
+    """
+    isbns = {book.isbn for _, book in books}
+    retried = False
+    while True:
+        existing = {isbn for (isbn,) in db.query(Book.isbn).filter(Book.isbn.in_(isbns))}
+        rows, conflicts = split_import_rows(books, existing, user_id)
+        try:
+            if rows:
+                # 행 목록을 넘기면 executemany로 실행됨
+                db.execute(insert(Book), rows)
+            db.commit()
+            if rows:
+                invalidate_book_lists(user_id)
+            return len(rows), conflicts
+        except IntegrityError:
+            db.rollback()
+            if retried:
+                raise
+            retried = True
+
 def update_book(
     db: Session,
     db_book: Book,
@@ -87,6 +418,9 @@ def update_book(
     
     Returns:
         Book: 업데이트된 책 객체
+
+    Raises:
+        StaleDataError: 조회 후 다른 요청이 같은 책을 변경하거나 삭제한 경우
     """
     # 설정된 값만 추출 (None인 필드 제외)
     update_data = book_in.dict(exclude_unset=True)
@@ -95,11 +429,11 @@ def update_book(
     for field, value in update_data.items():
         setattr(db_book, field, value)
     
-    # 데이터베이스에 변경사항 적용
+    # 데이터베이스에 변경사항 적용 (새 version과 updated_at이 객체에 채워지므로 refresh 불필요)
     db.add(db_book)
     db.commit()
-    # 업데이트된 객체 정보 새로고침
-    db.refresh(db_book)
+    # 목록 캐시 무효화
+    invalidate_book_lists(db_book.user_id)
     
     return db_book
 
@@ -113,12 +447,15 @@ def delete_book(db: Session, book_id: int) -> Book:
     Returns:
         Book: 삭제된 책 객체 (없으면 None)
     """
-    # 삭제할 책 찾기
-    book = db.query(Book).filter(Book.id == book_id).first()
+    # 삭제할 책 찾기 (같은 세션에서 이미 조회했다면 SELECT 없이 identity map에서 가져옴)
+    book = db.get(Book, book_id)
     
     # 책이 존재하면 삭제 진행
     if book:
+        owner_id = book.user_id
         db.delete(book)
         db.commit()
+        # 목록 캐시 무효화
+        invalidate_book_lists(owner_id)
     
     return book
@@ -1,20 +1,74 @@
-from typing import Any, Dict, Optional, Union
-from sqlalchemy.orm import Session
-from app.core.security import get_password_hash, verify_password
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from fastapi import BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.exc import StaleDataError
+from app.core.cache import user_cache
+from app.core.security import (
+    get_password_hash, password_needs_update, verify_password, verify_password_async,
+)
+from app.db.base import SessionLocal
 from app.db.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
-def get_user(db: Session, user_id: int) -> Optional[User]:
-    """사용자 조회"""
-    return db.query(User).filter(User.id == user_id).first()
+# 관계 로딩 옵션
+# User.books는 기본적으로 지연 로딩되어, 사용자 목록에서 각 사용자의 책에 접근하면 사용자마다 SELECT가 실행됨(N+1)
+# 책 목록이 필요한 조회는 options=WITH_BOOKS를 넘겨 조회한 사용자들의 책을 IN 조건의 SELECT 한 번으로 읽음
+# (일대다 관계를 JOIN하면 사용자 행이 책 수만큼 늘어나 LIMIT이 어긋나므로 selectinload 사용)
+WITH_BOOKS: Tuple[LoaderOption, ...] = (selectinload(User.books),)
+
+def get_user(db: Session, user_id: int, options: Sequence[LoaderOption] = ()) -> Optional[User]:
+    """사용자 조회 (options: 관계 로딩 옵션, 예: WITH_BOOKS)"""
+    return db.query(User).options(*options).filter(User.id == user_id).first()
+
+def snapshot_user(user: User) -> User:
+    """세션에 속하지 않는(detached) 사용자 복사본을 만듭니다.
+
+    캐시에 저장된 스냅샷은 여러 요청이 공유하므로 세션에 직접 추가하지 않고
+    session.merge(snapshot, load=False)로 요청별 인스턴스를 만들어 사용합니다.
+    """
+    columns = User.__table__.columns.keys()
+    snapshot = User(**{column: getattr(user, column) for column in columns})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+def get_user_cached(db: Session, user_id: int) -> Optional[User]:
+    """캐시를 거쳐 사용자를 조회합니다.
+
+    캐시에 있으면 SQL 없이 현재 세션에 병합한 인스턴스를 반환하고,
+    없으면 DB에서 조회한 뒤 스냅샷을 캐시에 저장합니다.
+    """
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return db.merge(snapshot, load=False)
+    user = get_user(db, user_id=user_id)
+    if user is not None:
+        user_cache.set(user_id, snapshot_user(user))
+    return user
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """이메일로 사용자 조회"""
     return db.query(User).filter(User.email == email).first()
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
-    """사용자 목록 조회"""
-    return db.query(User).offset(skip).limit(limit).all()
+def get_users(
+    db: Session, skip: int = 0, limit: int = 100, options: Sequence[LoaderOption] = ()
+) -> list[User]:
+    """사용자 목록 조회 (options: 관계 로딩 옵션, 예: WITH_BOOKS)"""
+    return db.query(User).options(*options).offset(skip).limit(limit).all()
+
+def user_rows_query(columns: Sequence[str], skip: int = 0, limit: int = 100) -> Select:
+    """get_users와 같은 사용자 목록에서 지정한 열만 SELECT하는 문"""
+    return select(*(getattr(User, name) for name in columns)).offset(skip).limit(limit)
+
+def get_user_rows(
+    db: Session, columns: Sequence[str], skip: int = 0, limit: int = 100
+) -> List[Row]:
+    """사용자 목록을 ORM 객체 없이 지정한 열의 행으로 조회"""
+    return db.execute(user_rows_query(columns, skip=skip, limit=limit)).all()
 
 def create_user(db: Session, user_in: UserCreate) -> User:
     """사용자 생성"""
@@ -25,33 +79,110 @@ def create_user(db: Session, user_in: UserCreate) -> User:
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
-def update_user(
-    db: Session, db_user: User, user_in: Union[UserUpdate, Dict[str, Any]]
-) -> User:
-    """사용자 정보 업데이트"""
+def changed_values(db_user: User, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    """update_data 중 현재 값과 다른 항목만 반환"""
+    return {
+        field: value
+        for field, value in update_data.items()
+        if getattr(db_user, field) != value
+    }
+
+def split_password(
+    user_in: Union[UserUpdate, Dict[str, Any]]
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """요청에 지정된 필드를 (비밀번호를 뺀 열 값, 비밀번호)로 나눔"""
     if isinstance(user_in, dict):
-        update_data = user_in
+        update_data = dict(user_in)
     else:
         update_data = user_in.dict(exclude_unset=True)
-    if update_data.get("password"):
-        hashed_password = get_password_hash(update_data["password"])
-        del update_data["password"]
-        update_data["hashed_password"] = hashed_password
+    password = update_data.pop("password", None)
+    return update_data, password
+
+def update_user(
+    db: Session, db_user: User, user_in: Union[UserUpdate, Dict[str, Any]]
+) -> User:
+    """사용자 정보 업데이트
+
+    실제로 값이 바뀌는 열만 UPDATE하고, 바뀐 값이 없으면 UPDATE와 커밋을 생략합니다.
+    비밀번호는 요청에 지정된 경우에만 해시합니다.
+    """
+    update_data, password = split_password(user_in)
+    update_data = changed_values(db_user, update_data)
+    if password:
+        update_data["hashed_password"] = get_password_hash(password)
+    # 바뀐 값이 없으면 쓰기 생략 (행 버전과 캐시도 그대로 유지)
+    if not update_data:
+        return db_user
+    user_id = db_user.id
     for field, value in update_data.items():
         setattr(db_user, field, value)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.commit()
+    except StaleDataError:
+        # 캐시된 사용자가 다른 프로세스의 변경보다 오래된 경우 - 다음 요청은 새로 조회하도록 제거
+        db.rollback()
+        user_cache.invalidate(user_id)
+        raise
+    # 변경된 사용자(비활성화 포함)가 캐시에서 계속 사용되지 않도록 제거
+    user_cache.invalidate(user_id)
     return db_user
 
-def authenticate(db: Session, email: str, password: str) -> Optional[User]:
-    """사용자 인증"""
+def authenticate(
+    db: Session,
+    email: str,
+    password: str,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Optional[User]:
+    """사용자 인증
+
+    저장된 해시가 현재 해시 설정과 다르면(예: BCRYPT_ROUNDS 변경)
+    background_tasks에 다시 해시하는 작업을 등록합니다.
+    """
     user = get_user_by_email(db, email=email)
     if not user:
         return None
     if not verify_password(password, user.hashed_password):
         return None
+    if background_tasks is not None and password_needs_update(user.hashed_password):
+        background_tasks.add_task(rehash_password, user.id, user.hashed_password, password)
     return user
+
+async def authenticate_async(
+    db: Session,
+    email: str,
+    password: str,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Optional[User]:
+    """사용자 인증 (동기 세션을 사용하는 async def 엔드포인트용)
+
+    사용자 조회만 스레드풀에서 실행하고, 비밀번호 검증은 해싱 프로세스 풀의 결과를 스레드 없이 기다립니다.
+    로그인이 몰려도 스레드풀이 검증 대기로 가득 차지 않으므로, 대기열 한도(PASSWORD_HASH_MAX_PENDING)를
+    넘는 요청은 바로 503으로 거절되고 다른 동기 엔드포인트는 계속 처리됩니다.
+    """
+    user = await run_in_threadpool(get_user_by_email, db, email=email)
+    if not user:
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    if background_tasks is not None and password_needs_update(user.hashed_password):
+        background_tasks.add_task(rehash_password, user.id, user.hashed_password, password)
+    return user
+
+def rehash_password(user_id: int, old_hash: str, password: str) -> None:
+    """현재 해시 설정으로 비밀번호를 다시 해시하여 저장 (로그인 후 백그라운드 작업)
+
+    그 사이 비밀번호가 변경되었을 수 있으므로 저장된 해시가 old_hash와 같을 때만 교체합니다.
+    """
+    new_hash = get_password_hash(password)
+    db = SessionLocal()
+    try:
+        db.query(User).filter(
+            User.id == user_id, User.hashed_password == old_hash
+        ).update({User.hashed_password: new_hash}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+    user_cache.invalidate(user_id)
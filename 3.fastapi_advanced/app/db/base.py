@@ -1,19 +1,25 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.db.base_class import Base
+from app.db.engine import make_async_engine, make_engine, read_pool_enabled
+from app.core.timing import install_query_timing
 
 # Import all models for SQLAlchemy to detect them
 from app.db.models.user import User
 from app.db.models.book import Book
+# books 테이블 생성 시 전문 검색 인덱스(FTS5)도 함께 만들도록 이벤트 등록
+from app.db import search  # noqa: F401
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# SQLAlchemy 엔진 생성 (풀 크기, SQLite PRAGMA 등은 설정값으로 조정 - app/db/engine.py 참고)
+engine = make_engine(settings.DATABASE_URL)
 
 # 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 커밋 후 객체를 만료시키지 않아 응답 직렬화 시 SELECT를 다시 실행하지 않음
+# (INSERT/UPDATE로 바뀌는 id, version, updated_at은 모두 flush 시점에 객체에 채워짐)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
 
 # Dependency
 def get_db():
@@ -23,3 +29,61 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# 읽기 전용 엔진 - 조회 엔드포인트가 쓰기 연결 풀과 분리된 연결을 사용
+# DB_READ_POOL_SIZE가 0이면 쓰기 엔진을 그대로 사용
+if read_pool_enabled():
+    read_engine = make_engine(settings.DATABASE_READ_URL or settings.DATABASE_URL, read_only=True)
+else:
+    read_engine = engine
+
+# 읽기 전용 세션 팩토리 (커밋하지 않으므로 기본 옵션)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+def get_read_db():
+    """읽기 전용 데이터베이스 세션 의존성 (조회만 하는 엔드포인트에서 사용)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# 비동기 SQLAlchemy 엔진 생성 (ASYNC_DB 모드에서 사용)
+async_engine = make_async_engine(settings.ASYNC_DATABASE_URL)
+
+# 비동기 세션 팩토리 생성
+# 커밋 후 속성 접근 시 암묵적인 I/O가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = sessionmaker(
+    async_engine, class_=AsyncSession, autocommit=False, autoflush=False,
+    expire_on_commit=False,
+)
+
+# Async dependency
+async def get_async_db():
+    """비동기 데이터베이스 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 비동기 읽기 전용 엔진과 세션 팩토리
+if read_pool_enabled():
+    async_read_engine = make_async_engine(
+        settings.ASYNC_DATABASE_READ_URL or settings.ASYNC_DATABASE_URL, read_only=True
+    )
+else:
+    async_read_engine = async_engine
+
+AsyncReadSessionLocal = sessionmaker(
+    async_read_engine, class_=AsyncSession, autocommit=False, autoflush=False,
+    expire_on_commit=False,
+)
+
+async def get_async_read_db():
+    """비동기 읽기 전용 데이터베이스 세션 의존성"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+# 요청별 SQL 실행 시간과 쿼리 수 측정 (Server-Timing의 db 구간)
+# 비동기 엔진의 커서 이벤트는 내부 동기 엔진에서 발생함
+if settings.SERVER_TIMING:
+    for _engine in {engine, read_engine, async_engine.sync_engine, async_read_engine.sync_engine}:
+        install_query_timing(_engine)
@@ -1,4 +1,6 @@
-from typing import Any
+from datetime import datetime
+from typing import Any, Dict
+from sqlalchemy import Column, DateTime, Integer, literal_column
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 
 @as_declarative()
@@ -10,3 +12,24 @@ class Base:
     @declared_attr
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
+
+class VersionedMixin:
+    """행 버전 관리 믹스인 - ETag / Last-Modified 조건부 요청에 사용
+
+    ORM flush와 Core UPDATE 문 모두에서 version이 1씩 증가하고 updated_at이 갱신됩니다.
+    ORM flush에서는 새 version과 updated_at을 파이썬에서 계산해 UPDATE에 넣으므로
+    커밋 후 값을 다시 읽는 SELECT가 필요 없고, WHERE version = 이전 버전 조건으로
+    그 사이 다른 요청이 행을 바꿨다면 StaleDataError가 발생합니다. (낙관적 잠금)
+    """
+    # 행 버전 - ORM은 이전 버전 + 1을 직접 넣고, Core UPDATE 문은 SQL에서 version + 1로 증가
+    version = Column(
+        Integer, nullable=False, default=1, onupdate=literal_column("version + 1")
+    )
+    # 마지막 변경 시각 (UTC)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    @declared_attr
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        return {"version_id_col": cls.version}
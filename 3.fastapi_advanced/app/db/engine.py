@@ -0,0 +1,119 @@
+# 설정(Settings) 기반 데이터베이스 엔진 생성
+# 방언(dialect)별로 엔진 옵션을 정합니다.
+# - SQLite: WAL 저널, synchronous, 페이지 캐시, mmap, busy_timeout PRAGMA를 연결마다 적용하고
+#   연결을 재사용하도록 동기 엔진은 QueuePool, 비동기(aiosqlite) 엔진은 AsyncAdaptedQueuePool 사용
+#   (SQLAlchemy 1.4의 파일 SQLite 기본값은 NullPool이라 요청마다 연결을 열고 PRAGMA를 다시 실행함)
+# - 그 외(PostgreSQL 등): pool_size / max_overflow / pool_recycle / pool_pre_ping
+# 읽기 전용 엔진은 쓰기 엔진과 별도의 연결 풀을 사용하므로 조회가 쓰기 연결을 기다리지 않습니다.
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import Settings, settings as default_settings
+
+def is_sqlite(url: str) -> bool:
+    """SQLite URL인지 확인합니다."""
+    return make_url(url).get_backend_name() == "sqlite"
+
+def is_sqlite_memory(url: str) -> bool:
+    """연결마다 별도의 데이터베이스가 되는 인메모리 SQLite URL인지 확인합니다."""
+    database = make_url(url).database
+    return is_sqlite(url) and database in (None, "", ":memory:")
+
+def sqlite_pragmas(settings: Settings, read_only: bool = False) -> List[str]:
+    """새 SQLite 연결에 실행할 PRAGMA 목록을 만듭니다.
+
+    Args:
+        settings: 애플리케이션 설정
+        read_only: 읽기 전용 연결이면 query_only를 켬
+
+    Returns:
+        List[str]: PRAGMA 문 목록
+    """
+    # 락을 바로 실패시키지 않고 최대 이 시간(밀리초)까지 기다림
+    pragmas = [f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}"]
+    if settings.SQLITE_JOURNAL_MODE:
+        # WAL 모드에서는 읽기와 쓰기가 서로를 막지 않음 (데이터베이스 파일에 기록되는 설정)
+        pragmas.append(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    pragmas += [
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        # 음수는 페이지 수가 아니라 KiB 단위
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    return pragmas
+
+def _install_sqlite_pragmas(engine: Engine, pragmas: List[str]) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+def engine_options(
+    url: str, settings: Settings, *, read_only: bool = False, is_async: bool = False
+) -> Dict[str, Any]:
+    """create_engine / create_async_engine에 넘길 옵션을 만듭니다.
+
+    Args:
+        url: 데이터베이스 URL
+        settings: 애플리케이션 설정
+        read_only: 읽기 전용 풀이면 DB_READ_POOL_SIZE를 풀 크기로 사용
+        is_async: 비동기 엔진용 옵션이면 True
+
+    Returns:
+        Dict[str, Any]: 엔진 옵션
+    """
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO}
+    pool_size = settings.DB_READ_POOL_SIZE if read_only else settings.DB_POOL_SIZE
+    if is_sqlite(url):
+        # 요청 처리 스레드가 바뀌어도 풀의 연결을 재사용할 수 있도록 허용
+        options["connect_args"] = {"check_same_thread": False}
+        if is_sqlite_memory(url):
+            # 인메모리 데이터베이스는 연결마다 별도의 데이터베이스이므로 방언 기본 풀을 그대로 사용
+            return options
+        # aiosqlite 연결은 호출할 때의 이벤트 루프로 결과를 돌려주므로 풀에 보관해 재사용 가능
+        options["poolclass"] = AsyncAdaptedQueuePool if is_async else QueuePool
+    else:
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
+        options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+    options["pool_size"] = pool_size
+    options["max_overflow"] = settings.DB_MAX_OVERFLOW
+    options["pool_timeout"] = settings.DB_POOL_TIMEOUT_SECONDS
+    return options
+
+def make_engine(
+    url: str, settings: Settings = default_settings, *, read_only: bool = False
+) -> Engine:
+    """설정에 맞게 튜닝한 동기 엔진을 만듭니다."""
+    engine = create_engine(url, **engine_options(url, settings, read_only=read_only))
+    if is_sqlite(url):
+        _install_sqlite_pragmas(engine, sqlite_pragmas(settings, read_only=read_only))
+    return engine
+
+def make_async_engine(
+    url: str, settings: Settings = default_settings, *, read_only: bool = False
+) -> AsyncEngine:
+    """설정에 맞게 튜닝한 비동기 엔진을 만듭니다."""
+    engine = create_async_engine(
+        url, **engine_options(url, settings, read_only=read_only, is_async=True)
+    )
+    if is_sqlite(url):
+        # PRAGMA는 드라이버 연결 이벤트에서 실행되므로 내부 동기 엔진에 등록
+        _install_sqlite_pragmas(engine.sync_engine, sqlite_pragmas(settings, read_only=read_only))
+    return engine
+
+def read_pool_enabled(settings: Settings = default_settings) -> bool:
+    """쓰기 엔진과 별도의 읽기 전용 엔진을 만들지 여부"""
+    if settings.DB_READ_POOL_SIZE <= 0:
+        return False
+    # 인메모리 SQLite는 연결마다 다른 데이터베이스이므로 읽기 풀을 나눌 수 없음
+    return not is_sqlite_memory(settings.DATABASE_READ_URL or settings.DATABASE_URL)
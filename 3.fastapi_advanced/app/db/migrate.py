@@ -0,0 +1,59 @@
+# 기존 SQLite 데이터베이스 스키마 보완
+# create_all은 없는 테이블만 만들고 이미 있는 테이블에 새 열이나 인덱스를 추가하지 않습니다.
+# 모델에 열(예: VersionedMixin의 version, updated_at)이나 인덱스가 추가된 뒤에도 이전에 만든
+# 데이터베이스(저장소에 포함된 sql_app.db 등)를 그대로 사용할 수 있도록, 빠진 열과 인덱스만 추가합니다.
+# 열 삭제나 타입 변경처럼 되돌릴 수 없는 변경은 하지 않습니다.
+from typing import List
+
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.engine import Connection
+
+def upgrade_schema(connection: Connection, metadata: MetaData) -> List[str]:
+    """이미 있는 테이블에 모델에는 있지만 데이터베이스에는 없는 열과 인덱스를 추가합니다.
+
+    추가한 열은 모델의 기본값(default)으로 기존 행을 채웁니다. SQLite의 ALTER TABLE ADD COLUMN은
+    상수가 아닌 기본값을 가진 NOT NULL 열을 추가할 수 없으므로, 추가한 열은 데이터베이스에서는
+    NULL을 허용합니다. (새 행은 ORM이 항상 값을 넣음)
+
+    Args:
+        connection: 트랜잭션 안의 데이터베이스 연결
+        metadata: 모델 메타데이터 (Base.metadata)
+
+    Returns:
+        List[str]: 추가한 열 목록 ("테이블.열")
+    """
+    if connection.dialect.name != "sqlite":
+        return []
+    inspector = inspect(connection)
+    added: List[str] = []
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column for column in table.columns if column.name not in existing]
+        for column in missing:
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.exec_driver_sql(
+                f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+            )
+            added.append(f"{table.name}.{column.name}")
+
+        # 기존 행을 기본값으로 채움
+        # table.update()는 onupdate(version + 1 등)까지 적용하므로 드라이버 SQL로 직접 실행
+        values = {}
+        for column in missing:
+            default = column.default
+            if default is None or not (default.is_scalar or default.is_callable):
+                continue
+            value = default.arg(None) if default.is_callable else default.arg
+            processor = column.type.bind_processor(connection.dialect)
+            values[column.name] = processor(value) if processor else value
+        if values:
+            assignments = ", ".join(f'"{name}" = ?' for name in values)
+            connection.exec_driver_sql(
+                f'UPDATE "{table.name}" SET {assignments}', tuple(values.values())
+            )
+
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    return added
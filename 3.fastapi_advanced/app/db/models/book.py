@@ -1,11 +1,11 @@
 # SQLAlchemy의 데이터베이스 테이블 정의를 위한 타입들
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 # SQLAlchemy의 관계 설정을 위한 함수
 from sqlalchemy.orm import relationship
 # 모든 모델의 기본 클래스
-from app.db.base_class import Base
+from app.db.base_class import Base, VersionedMixin
 
-class Book(Base):
+class Book(VersionedMixin, Base):
     """책 모델 - 데이터베이스의 books 테이블을 표현
     
     속성:
@@ -17,10 +17,15 @@ class Book(Base):
         description: 책 설명
         user_id: 소유자 ID (외래 키)
         user: 소유자 객체와의 관계
+        version: 행 버전 (VersionedMixin, 변경될 때마다 증가)
+        updated_at: 마지막 변경 시각 (VersionedMixin)
     """
     # SQLAlchemy에게 이 모델이 매핑될 테이블 이름을 알려줌
     __tablename__ = "books"
 
+    # 사용자별 키셋 페이지네이션을 위한 (user_id, id) 복합 인덱스
+    __table_args__ = (Index("ix_books_user_id_id", "user_id", "id"),)
+
     # 기본 키 - 자동 증가하는 정수형 ID
     # index=True로 설정하여 검색 성능 향상
     id = Column(Integer, primary_key=True, index=True)
@@ -47,4 +52,5 @@ class Book(Base):
     
     # User 모델과의 양방향 관계 설정
     # back_populates로 User 모델의 books 속성과 연결
+    # 기본은 지연 로딩 - 소유자가 필요한 조회는 crud의 WITH_OWNER(joinedload) 옵션으로 함께 로딩
     user = relationship("User", back_populates="books")
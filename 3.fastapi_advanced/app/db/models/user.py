@@ -1,9 +1,9 @@
 from sqlalchemy import Boolean, Column, Integer, String
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, VersionedMixin
 
-class User(Base):
-    """사용자 모델"""
+class User(VersionedMixin, Base):
+    """사용자 모델 (version, updated_at 열은 VersionedMixin이 추가)"""
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -13,4 +13,5 @@ class User(Base):
     is_superuser = Column(Boolean(), default=False)
     
     # 관계 설정
+    # 기본은 지연 로딩 - 책 목록이 필요한 조회는 crud의 WITH_BOOKS(selectinload) 옵션으로 함께 로딩
     books = relationship("Book", back_populates="user")
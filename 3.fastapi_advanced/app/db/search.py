@@ -0,0 +1,107 @@
+# 도서 전문 검색 인덱스 (SQLite FTS5)
+# books 테이블의 title, author, description을 색인하는 외부 콘텐츠(external content) FTS5 테이블과,
+# books가 변경될 때 색인을 함께 갱신하는 트리거를 정의합니다.
+# books 테이블이 생성될 때(create_all) SQLite에서만 자동으로 만들어지고, 이미 있는 데이터베이스에는
+# init_db()(app/initial_data.py)가 실행될 때마다 만들어집니다. (없는 경우에만 생성)
+import re
+from typing import Optional
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, event, func, literal_column
+from sqlalchemy.engine import Connection
+
+from app.db.models.book import Book
+
+# FTS5 가상 테이블 - 책 내용을 복사하지 않고 books 행을 rowid(=books.id)로 참조
+# Base.metadata에 넣지 않으므로 create_all/drop_all 대상이 아님
+books_fts = Table(
+    "books_fts",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("title", Text),
+    Column("author", Text),
+    Column("description", Text),
+)
+
+# MATCH 연산과 bm25 순위 함수에 사용하는 테이블 이름 열
+_fts_column = literal_column("books_fts")
+
+SEARCH_INDEX_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, author, description,
+        content='books', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    # 새 책 색인
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts(rowid, title, author, description)
+        VALUES (new.id, new.title, new.author, new.description);
+    END
+    """,
+    # 삭제된 책 색인 제거 (외부 콘텐츠 테이블은 'delete' 명령으로 이전 값을 넘겨야 함)
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author, description)
+        VALUES ('delete', old.id, old.title, old.author, old.description);
+    END
+    """,
+    # 색인 대상 열이 바뀐 경우에만 다시 색인
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_au AFTER UPDATE OF title, author, description ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author, description)
+        VALUES ('delete', old.id, old.title, old.author, old.description);
+        INSERT INTO books_fts(rowid, title, author, description)
+        VALUES (new.id, new.title, new.author, new.description);
+    END
+    """,
+]
+
+def create_search_index(connection: Connection) -> None:
+    """FTS5 테이블과 동기화 트리거를 만들고 기존 책을 색인합니다. (여러 번 실행해도 안전)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in SEARCH_INDEX_DDL:
+        connection.exec_driver_sql(statement)
+    # 트리거가 생기기 전에 저장된 행까지 색인
+    connection.exec_driver_sql("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+
+@event.listens_for(Book.__table__, "after_create")
+def _create_search_index(target, connection: Connection, **kw) -> None:
+    create_search_index(connection)
+
+@event.listens_for(Book.__table__, "before_drop")
+def _drop_search_index(target, connection: Connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        # 트리거는 books 테이블과 함께 삭제됨
+        connection.exec_driver_sql("DROP TABLE IF EXISTS books_fts")
+
+# 검색어에서 단어를 뽑는 정규식 - 단어 뒤의 '*'는 접두사 검색
+_TERM_RE = re.compile(r"(\w+)(\*?)")
+
+def build_match_query(q: str) -> Optional[str]:
+    """사용자 검색어를 안전한 FTS5 MATCH 식으로 바꿉니다.
+
+    FTS5 문법(AND/OR/NEAR, 따옴표, 열 필터 등)은 사용하지 않고 단어만 뽑아
+    각 단어를 따옴표로 감싼 뒤 AND로 결합합니다. 단어 뒤에 '*'를 붙이면 접두사 검색입니다.
+
+    Args:
+        q: 사용자 검색어 (예: "fast pyth*")
+
+    Returns:
+        Optional[str]: MATCH 식 (예: '"fast" "pyth"*'), 단어가 없으면 None
+    """
+    terms = [f'"{word}"{star}' for word, star in _TERM_RE.findall(q)]
+    return " ".join(terms) if terms else None
+
+def match(query: str):
+    """books_fts MATCH 조건"""
+    return _fts_column.op("MATCH")(query)
+
+# bm25 열 가중치 - 제목, 저자, 설명 순으로 일치했을 때 더 높은 순위
+RANK_WEIGHTS = (10.0, 5.0, 1.0)
+
+def rank():
+    """bm25 관련도 점수 (작을수록 관련도가 높음)"""
+    return func.bm25(_fts_column, *RANK_WEIGHTS)
@@ -1,16 +1,23 @@
 import logging
 
 from app.db.base import SessionLocal, engine, Base
+from app.db.migrate import upgrade_schema
+from app.db.search import create_search_index
 from app.core.config import settings
 from app.schemas.user import UserCreate
 from app.crud.user import get_user_by_email, create_user
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def init_db() -> None:
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블과 전문 검색 인덱스 생성 (이미 있는 테이블에는 빠진 열과 인덱스만 추가)"""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        added = upgrade_schema(connection, Base.metadata)
+        # 이미 있던 books 테이블에는 after_create 이벤트가 발생하지 않으므로 매번 실행 (IF NOT EXISTS + rebuild)
+        create_search_index(connection)
+    if added:
+        logger.info("Added missing columns: %s", ", ".join(added))
     logger.info("Database tables created")
 
 def init() -> None:
@@ -31,10 +38,17 @@ def init() -> None:
         db.close()
 
 def main() -> None:
+    """테이블과 관리자 계정을 만듭니다.
+
+    배포할 때 애플리케이션을 시작하기 전에 한 번 실행합니다: python -m app.initial_data
+    (개발 환경에서는 INIT_DB_ON_STARTUP=True로 애플리케이션 시작 시 실행할 수도 있음)
+    """
     logger.info("Creating initial data")
     init_db()
     init()
     logger.info("Initial data created")
 
 if __name__ == "__main__":
+    # 애플리케이션에서 임포트할 때는 로깅 설정을 바꾸지 않도록 직접 실행할 때만 설정
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -1,19 +1,24 @@
 # FastAPI: 현대적인 웹 프레임워크로, 빠른 API 개발을 위한 다양한 기능 제공
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+# StaleDataError: 낙관적 잠금(행 버전) 충돌 시 SQLAlchemy가 발생시키는 예외
+from sqlalchemy.orm.exc import StaleDataError
 # CORS: 다른 도메인의 리소스 요청을 허용하기 위한 미들웨어
 from starlette.middleware.cors import CORSMiddleware
 
 # 프로젝트 내부 모듈 임포트
-# api_router: API 엔드포인트들을 그룹화한 라우터
-from app.api.v1.router import api_router
+# include_api_routes: API 엔드포인트 라우터들을 애플리케이션에 등록하는 함수
+from app.api.v1.router import include_api_routes
+# metrics_router: 런타임 지표(GET /metrics) 라우터
+from app.api.metrics import router as metrics_router
 # settings: 환경 설정 값들을 담고 있는 객체
 from app.core.config import settings
-# Base: SQLAlchemy 모델의 기본 클래스, engine: 데이터베이스 연결 관리 객체
-from app.db.base import Base, engine
-
-# 애플리케이션 시작 시 데이터베이스 테이블 자동 생성
-# SQLAlchemy의 모든 모델(테이블)을 검사하여 데이터베이스에 없는 테이블을 생성
-Base.metadata.create_all(bind=engine)
+# password_hasher: 비밀번호 해싱 프로세스 풀
+from app.core.hashing import password_hasher
+# ServerTimingMiddleware: 요청별 처리 시간을 Server-Timing 헤더와 로그로 남기는 미들웨어
+from app.core.timing import ServerTimingMiddleware
+# MetricsMiddleware: 라우트별 요청 수와 지연 시간을 기록하는 미들웨어
+from app.core.metrics import MetricsMiddleware
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
@@ -53,6 +58,45 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
-# API 라우터를 애플리케이션에 등록
+# 라우트별 요청 수(상태 코드별)와 지연 시간 기록 (GET /metrics로 조회)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 요청별 처리 시간 측정 (db / auth / serialize / total)
+# 가장 바깥에서 실행되도록 마지막에 등록 - CORS 처리 시간까지 total에 포함됨
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
+# API 엔드포인트를 애플리케이션에 등록
+# 설정(ASYNC_DB)에 따라 동기 또는 비동기 엔드포인트 사용
 # prefix를 사용하여 모든 API 엔드포인트 앞에 버전 정보 추가 (예: /api/v1/...)
-app.include_router(api_router, prefix=settings.API_V1_STR)
+include_api_routes(app, async_db=settings.ASYNC_DB, prefix=settings.API_V1_STR)
+# 런타임 지표는 버전 접두사 없이 /metrics로 제공 (Prometheus 기본 수집 경로)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
+# 행 버전 충돌 처리
+# 조회한 뒤 다른 요청이 같은 행을 먼저 변경(또는 삭제)했다면 덮어쓰지 않고 409 Conflict로 응답
+@app.exception_handler(StaleDataError)
+async def stale_data_handler(request: Request, exc: StaleDataError) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "The resource was modified by another request, please retry"},
+    )
+
+# 애플리케이션 시작 시 데이터베이스 초기화 (INIT_DB_ON_STARTUP=True인 경우에만)
+# 모듈 임포트 시점에는 DB에 접속하지 않으므로 테스트/리로드/워커 시작이 DDL 왕복을 기다리지 않음
+# 운영 환경에서는 배포 단계에서 `python -m app.initial_data`를 한 번 실행
+if settings.INIT_DB_ON_STARTUP:
+    @app.on_event("startup")
+    def initialize_database() -> None:
+        # 시작 시에만 필요한 모듈이므로 여기서 임포트
+        from app.initial_data import init, init_db
+
+        init_db()
+        init()
+
+# 애플리케이션 종료 시 비밀번호 해싱 프로세스 풀 정리
+@app.on_event("shutdown")
+def shutdown_password_hasher() -> None:
+    password_hasher.shutdown()
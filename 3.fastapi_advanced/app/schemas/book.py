@@ -1,7 +1,13 @@
-# 파이썬 타입 힌트 모듈에서 Optional 타입 가져오기
-from typing import Optional
+# 응답 JSON 직렬화를 위한 표준 라이브러리
+import json
+# 파이썬 타입 힌트 모듈에서 List, Optional 타입 가져오기
+from typing import Any, Iterable, List, Optional
+# FastAPI의 JSON 호환 변환 함수
+from fastapi.encoders import jsonable_encoder
 # Pydantic의 기본 모델 클래스 가져오기
 from pydantic import BaseModel
+# 선택한 열에서 바로 JSON을 만드는 스키마별 인코더
+from app.schemas.encoder import SchemaEncoder
 
 class BookBase(BaseModel):
     """책 기본 스키마 - 모든 책 관련 스키마의 기본 클래스
@@ -56,3 +62,64 @@ class Book(BookBase):
         orm_mode = True
         # 임의의 타입 허용 - SQLAlchemy 모델의 모든 타입 허용
         arbitrary_types_allowed = True
+
+class BookOwner(BaseModel):
+    """책 응답에 포함하는 소유자 요약 정보"""
+    # 소유자 ID
+    id: int
+    # 소유자 이메일
+    email: str
+
+    class Config:
+        orm_mode = True
+
+class BookWithOwner(Book):
+    """소유자 정보를 포함한 책 스키마 - 관리자 목록(GET /books/admin) 응답에 사용
+
+    ORM 객체의 user 관계에서 읽으므로, 조회할 때 crud의 WITH_OWNER 옵션으로 소유자를 함께 로딩해야
+    책마다 소유자 SELECT가 추가로 실행되지 않음
+    """
+    # 책 소유자
+    user: BookOwner
+
+# Book 응답 인코더 (FAST_JSON_RESPONSES 모드의 목록 응답에 사용)
+book_encoder = SchemaEncoder(Book)
+
+def dump_books(books: Iterable[Any]) -> bytes:
+    """ORM 책 목록을 response_model=List[Book] 응답과 같은 JSON 바이트로 직렬화합니다.
+
+    직렬화된 응답을 캐시할 때 사용하며, FastAPI의 JSONResponse와 같은 옵션으로 인코딩합니다.
+    """
+    content = jsonable_encoder([Book.from_orm(book) for book in books])
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+class BookPage(BaseModel):
+    """커서 페이지네이션 응답 스키마
+
+    다음 페이지를 요청할 때 next_cursor 값을 cursor 파라미터로 전달
+    """
+    # 현재 페이지의 책 목록
+    items: List[Book]
+    # 다음 페이지 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+
+class BookImportError(BaseModel):
+    """대량 등록에서 저장되지 않은 행의 정보"""
+    # 요청 본문에서의 행 위치 (0부터 시작, NDJSON은 빈 줄 제외)
+    index: int
+    # 행의 ISBN (알 수 없으면 None)
+    isbn: Optional[str] = None
+    # 실패 사유 (검증 오류 또는 ISBN 중복)
+    detail: str
+
+class BookImportResult(BaseModel):
+    """대량 등록 응답 스키마
+
+    일부 행이 실패해도 나머지 행은 저장되며, 실패한 행은 errors로 보고됨
+    """
+    # 저장된 책 수
+    inserted: int = 0
+    # 저장되지 않은 행 목록
+    errors: List[BookImportError] = []
@@ -0,0 +1,82 @@
+# 응답 스키마별 JSON 인코더
+# 목록 응답에서 ORM 객체를 만들고 응답 모델로 다시 검증한 뒤 jsonable_encoder로 변환하는 대신,
+# 스키마 필드에 해당하는 열만 SELECT한 행(튜플)을 바로 JSON 바이트로 인코딩합니다.
+# 스키마를 분석해 키 순서와 값 변환 함수를 한 번만 계산해 둡니다.
+import json
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON
+from pydantic.json import ENCODERS_BY_TYPE
+
+# 값을 그대로 json.dumps에 넘길 수 있는 타입 (EmailStr 등 str 하위 타입 포함)
+_JSON_NATIVE_TYPES = (str, int, float, bool)
+
+def _converter(type_: Any) -> Optional[Callable[[Any], Any]]:
+    """jsonable_encoder와 같은 값 변환 함수를 찾습니다. (변환이 필요 없으면 None)
+
+    jsonable_encoder가 사용하는 pydantic의 타입별 인코더 표(ENCODERS_BY_TYPE)에서
+    필드 타입 또는 가장 가까운 상위 타입의 인코더를 고릅니다.
+    """
+    if isinstance(type_, type):
+        if issubclass(type_, _JSON_NATIVE_TYPES):
+            return None
+        for base in type_.__mro__:
+            encoder = ENCODERS_BY_TYPE.get(base)
+            if encoder is not None:
+                return lambda value: None if value is None else encoder(value)
+    raise TypeError(f"SchemaEncoder does not support field type {type_!r}")
+
+class SchemaEncoder:
+    """응답 스키마 하나에 대해 미리 만들어 둔 JSON 인코더
+
+    response_model=List[schema]이고 모든 필드가 설정된 응답(ORM 객체에서 만든 응답)과
+    바이트 단위로 같은 JSON을 만듭니다. 값은 검증하지 않으므로 열 값이 이미 스키마를
+    만족해야 합니다. (API를 통해 저장된 행)
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        """
+        Args:
+            schema: 단일 값 필드만 있는 Pydantic 응답 스키마
+
+        Raises:
+            TypeError: 지원하지 않는 필드 타입(중첩 모델, 리스트 등)이 있는 경우
+        """
+        self.schema = schema
+        fields = list(schema.__fields__.values())
+        for field in fields:
+            if field.shape != SHAPE_SINGLETON:
+                raise TypeError(f"SchemaEncoder does not support field {field.name!r}")
+        # SELECT할 속성 이름과 JSON 키 (응답은 by_alias=True로 직렬화됨)
+        self.names: Tuple[str, ...] = tuple(field.name for field in fields)
+        self.keys: Tuple[str, ...] = tuple(field.alias for field in fields)
+        # (필드 위치, 변환 함수) - JSON 기본 타입이 아닌 필드만
+        self._converters = tuple(
+            (index, converter)
+            for index, converter in ((i, _converter(field.type_)) for i, field in enumerate(fields))
+            if converter is not None
+        )
+
+    def _convert(self, row: Sequence[Any]) -> List[Any]:
+        values = list(row)
+        for index, converter in self._converters:
+            values[index] = converter(values[index])
+        return values
+
+    def encode(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        """names 순서로 선택한 행 목록을 JSON 배열 바이트로 인코딩합니다.
+
+        Args:
+            rows: 각 행이 names 순서의 값으로 이루어진 행 목록
+
+        Returns:
+            bytes: FastAPI의 JSONResponse와 같은 옵션으로 인코딩한 JSON 바이트
+        """
+        keys = self.keys
+        if self._converters:
+            rows = map(self._convert, rows)
+        content = [dict(zip(keys, row)) for row in rows]
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
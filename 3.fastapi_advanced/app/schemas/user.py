@@ -1,5 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr
+from app.schemas.encoder import SchemaEncoder
 
 class UserBase(BaseModel):
     """사용자 기본 스키마"""
@@ -24,6 +25,9 @@ class User(UserBase):
         orm_mode = True
         arbitrary_types_allowed = True
 
+# User 응답 인코더 (FAST_JSON_RESPONSES 모드의 목록 응답에 사용)
+user_encoder = SchemaEncoder(User)
+
 class Token(BaseModel):
     """토큰 스키마"""
     access_token: str
@@ -0,0 +1,47 @@
+# 다중 워커 실행 명령
+# uvicorn --workers로 여러 프로세스를 띄우면 워커마다 설정을 따로 읽으므로,
+# SECRET_KEY를 지정하지 않은 경우 워커마다 다른 랜덤 키가 생성되어 다른 워커가 발급한 토큰이 401이 됩니다.
+# 이 명령은 부모 프로세스에서 서명 키를 한 번만 결정(SECRET_KEY → SECRET_KEY_FILE → 랜덤 키)하고
+# 환경변수로 워커에게 물려준 뒤 uvicorn을 시작합니다.
+#
+# 실행: python -m app.serve --workers 4 [--host 0.0.0.0] [--port 8000]
+#
+# 워커 간에 공유되지 않는 상태
+# - 사용자/도서 목록 캐시는 워커별로 유지되며, 다른 워커의 변경은 TTL(USER_CACHE_TTL_SECONDS,
+#   BOOK_LIST_CACHE_TTL_SECONDS)이 지나면 반영됨
+# - /metrics 지표도 워커별 값 (요청을 받은 워커의 값만 보임)
+import argparse
+import os
+
+import uvicorn
+
+from app.core.config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="여러 워커 프로세스로 애플리케이션 실행")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    # 모든 워커가 같은 키로 토큰을 서명/검증하도록 결정된 키를 물려줌
+    os.environ["SECRET_KEY"] = settings.SECRET_KEY
+
+    if settings.INIT_DB_ON_STARTUP:
+        # 워커마다 동시에 테이블/관리자 계정을 만들지 않도록 부모에서 한 번만 실행
+        from app.initial_data import init, init_db
+
+        init_db()
+        init()
+        os.environ["INIT_DB_ON_STARTUP"] = "false"
+
+    if args.workers > 1 and settings.PASSWORD_HASH_WORKERS is None:
+        # 워커마다 CPU 코어 수만큼 해싱 프로세스를 만들면 코어보다 훨씬 많은 프로세스가 경쟁하므로 나눠 가짐
+        os.environ["PASSWORD_HASH_WORKERS"] = str(max(1, (os.cpu_count() or 1) // args.workers))
+
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
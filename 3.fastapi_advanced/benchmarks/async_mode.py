@@ -0,0 +1,110 @@
+# 동기/비동기 DB 모드 처리량 비교 벤치마크
+# 같은 SQLite 파일을 사용하는 두 애플리케이션(동기 def 엔드포인트 / async def 엔드포인트)에
+# ASGI로 직접 동시 요청을 보내 동시성 수준별 처리량과 지연 시간을 측정합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.async_mode [--books 10000] [--requests 2000]
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_async_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.router import include_api_routes
+from app.core.config import settings
+from app.db.base import Base, engine
+from app.db.models.book import Book
+from app.initial_data import init
+
+
+def seed(books: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    init()
+    with engine.begin() as conn:
+        conn.execute(
+            Book.__table__.insert(),
+            [
+                {"title": f"Book {i}", "author": f"Author {i % 97}",
+                 "published_year": 2000 + i % 25, "isbn": f"isbn-{i}",
+                 "description": "x" * 200, "user_id": 1}
+                for i in range(1, books + 1)
+            ],
+        )
+
+
+def build_app(async_db: bool) -> FastAPI:
+    app = FastAPI()
+    include_api_routes(app, async_db=async_db, prefix=settings.API_V1_STR)
+    return app
+
+
+async def run_load(
+    client: httpx.AsyncClient, paths: List[str], headers: Dict[str, str], concurrency: int
+) -> Dict[str, float]:
+    """paths를 concurrency개의 워커로 나누어 요청하고 처리량/지연 시간을 반환합니다."""
+    latencies: List[float] = []
+    queue = list(reversed(paths))
+
+    async def worker() -> None:
+        while queue:
+            path = queue.pop()
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def bench(args: argparse.Namespace) -> None:
+    print(f"{'mode':>6} {'endpoint':>10} {'conc':>5} {'req/s':>9} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for mode in ("sync", "async"):
+        app = build_app(async_db=(mode == "async"))
+        async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+            response = await client.post(
+                f"{settings.API_V1_STR}/login/access-token",
+                data={"username": settings.FIRST_SUPERUSER,
+                      "password": settings.FIRST_SUPERUSER_PASSWORD},
+            )
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            endpoints = {
+                "detail": [f"{settings.API_V1_STR}/books/{i % args.books + 1}"
+                           for i in range(args.requests)],
+                "list": [f"{settings.API_V1_STR}/books/?skip={i % args.books}&limit=20"
+                         for i in range(args.requests)],
+            }
+            for name, paths in endpoints.items():
+                for concurrency in args.concurrency:
+                    stats = await run_load(client, paths, headers, concurrency)
+                    print(f"{mode:>6} {name:>10} {concurrency:>5} {stats['rps']:>9.0f} "
+                          f"{stats['p50']:>9.2f} {stats['p99']:>9.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 모드 처리량 비교")
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    args = parser.parse_args()
+    seed(args.books)
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
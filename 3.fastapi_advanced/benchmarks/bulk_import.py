@@ -0,0 +1,82 @@
+# 도서 대량 등록 벤치마크
+# 한 권씩 POST /books/ 를 호출하는 방식과 POST /books/bulk (NDJSON)로 한 번에 보내는 방식의
+# 초당 등록 건수를 비교하고, 배치 크기별 대량 등록 처리량을 측정합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.bulk_import [--rows 100000] [--single 500]
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Dict
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_bulk_import_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+import httpx
+
+from app.core.config import settings
+from app.db.base import Base, engine
+from app.initial_data import init
+from app.main import app
+
+
+def book_row(isbn: str) -> Dict:
+    return {"title": f"Book {isbn}", "author": "Bench", "published_year": 2024,
+            "isbn": isbn, "description": "x" * 200}
+
+
+async def bench(args: argparse.Namespace) -> None:
+    async with httpx.AsyncClient(app=app, base_url="http://bench", timeout=None) as client:
+        response = await client.post(
+            f"{settings.API_V1_STR}/login/access-token",
+            data={"username": settings.FIRST_SUPERUSER,
+                  "password": settings.FIRST_SUPERUSER_PASSWORD},
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        print(f"{'method':>16} {'rows':>9} {'seconds':>9} {'rows/s':>9}")
+
+        # 한 권씩 등록 (요청마다 commit + refresh)
+        start = time.perf_counter()
+        for i in range(args.single):
+            response = await client.post(
+                f"{settings.API_V1_STR}/books/", headers=headers, json=book_row(f"single-{i}")
+            )
+            assert response.status_code == 200, response.text
+        elapsed = time.perf_counter() - start
+        print(f"{'single POST':>16} {args.single:>9} {elapsed:>9.2f} {args.single / elapsed:>9.0f}")
+
+        # NDJSON 대량 등록 (batch_size 행마다 executemany + commit)
+        ndjson_headers = {**headers, "Content-Type": "application/x-ndjson"}
+        for batch_size in args.batch_sizes:
+            body = "\n".join(
+                json.dumps(book_row(f"bulk-{batch_size}-{i}")) for i in range(args.rows)
+            )
+            start = time.perf_counter()
+            response = await client.post(
+                f"{settings.API_V1_STR}/books/bulk?batch_size={batch_size}",
+                headers=ndjson_headers, content=body,
+            )
+            elapsed = time.perf_counter() - start
+            assert response.status_code == 200, response.text
+            assert response.json()["inserted"] == args.rows
+            label = f"bulk/{batch_size}"
+            print(f"{label:>16} {args.rows:>9} {elapsed:>9.2f} {args.rows / elapsed:>9.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="도서 대량 등록 처리량 비교")
+    parser.add_argument("--rows", type=int, default=100_000, help="대량 등록할 행 수")
+    parser.add_argument("--single", type=int, default=500, help="한 권씩 등록할 행 수")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+    Base.metadata.create_all(bind=engine)
+    init()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# 엔진 설정 벤치마크 - 쓰기가 계속되는 동안의 조회 지연 시간
+# 쓰기 스레드 하나가 책을 계속 저장하는 동안 조회 스레드들이 도서 목록을 읽고,
+# 조회 지연 시간(중앙값, p95)과 처리량을 엔진 설정별로 비교합니다.
+# - rollback journal: 튜닝 전 설정 (journal_mode=DELETE, synchronous=FULL, 읽기/쓰기 같은 풀)
+# - WAL + read pool: 기본 설정 (journal_mode=WAL, synchronous=NORMAL, 별도의 읽기 전용 풀)
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.db_engine [--readers 4] [--seconds 5]
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_db_engine_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crud import book as crud_book
+from app.db.base import Base
+from app.db.engine import make_engine
+from app.db.models.book import Book
+from app.db.models.user import User
+
+SEED_BOOKS = 10_000
+
+CONFIGS: Dict[str, Dict[str, object]] = {
+    "rollback journal": {"SQLITE_JOURNAL_MODE": "DELETE", "SQLITE_SYNCHRONOUS": "FULL",
+                         "DB_READ_POOL_SIZE": 0},
+    "WAL + read pool": {},
+}
+
+
+def run(name: str, overrides: Dict[str, object], readers: int, seconds: float) -> None:
+    config = settings.copy(update=overrides)
+    url = f"sqlite:///{_db_dir}/{name.replace(' ', '_').replace('+', '')}.db"
+    engine = make_engine(url, config)
+    read_engine = make_engine(url, config, read_only=True) if config.DB_READ_POOL_SIZE else engine
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{"email": "owner@example.com", "hashed_password": "x",
+                                                "is_active": True, "is_superuser": False}])
+        conn.execute(Book.__table__.insert(), [
+            {"title": f"Book {i}", "author": "Author", "published_year": 2000,
+             "isbn": f"seed-{i}", "user_id": 1}
+            for i in range(SEED_BOOKS)
+        ])
+    WriteSession = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    ReadSession = sessionmaker(bind=read_engine, autoflush=False)
+
+    stop = threading.Event()
+    latencies: List[float] = []
+    writes = 0
+
+    def writer() -> None:
+        nonlocal writes
+        db = WriteSession()
+        try:
+            while not stop.is_set():
+                db.add(Book(title="New", author="Writer", published_year=2024,
+                            isbn=f"new-{writes}", user_id=1))
+                db.commit()
+                writes += 1
+        finally:
+            db.close()
+
+    def reader() -> None:
+        samples = []
+        while not stop.is_set():
+            db = ReadSession()
+            try:
+                start = time.perf_counter()
+                crud_book.get_books(db, skip=0, limit=100, user_id=1)
+                samples.append((time.perf_counter() - start) * 1000)
+            finally:
+                db.close()
+        latencies.extend(samples)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    read_engine.dispose()
+
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(f"{name:>17} {statistics.median(latencies):>9.2f} {p95:>9.2f} "
+          f"{len(latencies) / seconds:>9.0f} {writes / seconds:>9.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="쓰기 중 조회 지연 시간 비교")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'config':>17} {'p50(ms)':>9} {'p95(ms)':>9} {'reads/s':>9} {'writes/s':>9}")
+    for name, overrides in CONFIGS.items():
+        run(name, overrides, args.readers, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
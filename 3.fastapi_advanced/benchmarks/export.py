@@ -0,0 +1,94 @@
+# 도서 내보내기 메모리 벤치마크
+# 도서 수를 늘려가며 스트리밍 내보내기(iter_book_batches + 인코딩)와
+# 전체 목록을 ORM 객체로 한 번에 읽는 방식의 소요 시간과 최대 메모리 사용량을 비교합니다.
+# 스트리밍 방식은 도서 수와 관계없이 최대 메모리가 일정해야 합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.export [--sizes 10000 100000 1000000]
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_export_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+from app.api.dependencies.book_export import ExportFormat, encode_batches
+from app.crud import book as crud_book
+from app.db.base import Base, SessionLocal, engine
+from app.db.models.book import Book
+from app.db.models.user import User
+
+BATCH = 50_000
+
+
+def seed(start: int, end: int) -> None:
+    """id가 start 이상 end 미만인 도서를 저장합니다."""
+    for batch_start in range(start, end, BATCH):
+        with engine.begin() as conn:
+            conn.execute(
+                Book.__table__.insert(),
+                [
+                    {"id": i, "title": f"Book {i}", "author": f"Author {i % 997}",
+                     "published_year": 2000 + i % 25, "isbn": f"isbn-{i}",
+                     "description": "x" * 200, "user_id": 1}
+                    for i in range(batch_start, min(batch_start + BATCH, end))
+                ],
+            )
+
+
+def measure(fn: Callable[[], None]) -> Tuple[float, float]:
+    """fn의 소요 시간(초)과 최대 메모리 사용량(MiB)을 반환합니다."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스트리밍 내보내기 메모리 사용량 비교")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{"email": "owner@example.com", "hashed_password": "x",
+                                                "is_active": True, "is_superuser": False}])
+
+    print(f"{'books':>9} {'method':>12} {'seconds':>9} {'peak(MiB)':>10}")
+    seeded = 0
+    for size in sorted(args.sizes):
+        seed(seeded + 1, size + 1)
+        seeded = size
+
+        def stream(fmt: ExportFormat) -> Callable[[], None]:
+            def run() -> None:
+                db = SessionLocal()
+                try:
+                    for _ in encode_batches(crud_book.iter_book_batches(db, user_id=1), fmt):
+                        pass
+                finally:
+                    db.close()
+            return run
+
+        def load_all() -> None:
+            db = SessionLocal()
+            try:
+                crud_book.get_books(db, limit=size, user_id=1)
+            finally:
+                db.close()
+
+        for name, fn in (("ndjson", stream(ExportFormat.ndjson)),
+                         ("csv", stream(ExportFormat.csv)),
+                         ("list (ORM)", load_all)):
+            elapsed, peak = measure(fn)
+            print(f"{size:>9} {name:>12} {elapsed:>9.2f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
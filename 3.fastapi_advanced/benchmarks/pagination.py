@@ -0,0 +1,99 @@
+# OFFSET 페이지네이션과 커서(키셋) 페이지네이션 비교 벤치마크
+# 임시 SQLite 파일에 대량의 도서를 채운 뒤, 페이지 깊이별로 두 방식의 조회 시간을 측정합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.pagination [--rows 1000000] [--repeat 5]
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_pagination_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+from app.crud import book as crud_book
+from app.db.base import Base, SessionLocal, engine
+from app.db.models.book import Book
+from app.db.models.user import User
+
+USERS = 100
+BATCH = 50_000
+
+
+def seed(rows: int) -> None:
+    """rows권의 도서를 USERS명의 사용자에게 고르게 나누어 저장합니다."""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            User.__table__.insert(),
+            [
+                {"email": f"user{i}@example.com", "hashed_password": "x",
+                 "is_active": True, "is_superuser": False}
+                for i in range(1, USERS + 1)
+            ],
+        )
+    for start in range(1, rows + 1, BATCH):
+        end = min(start + BATCH, rows + 1)
+        with engine.begin() as conn:
+            conn.execute(
+                Book.__table__.insert(),
+                [
+                    {"id": i, "title": f"Book {i}", "author": f"Author {i % 997}",
+                     "published_year": 2000 + i % 25, "isbn": f"isbn-{i}",
+                     "description": None, "user_id": i % USERS + 1}
+                    for i in range(start, end)
+                ],
+            )
+
+
+def timed(fn, repeat: int) -> float:
+    """fn을 repeat번 실행한 중앙값(밀리초)을 반환합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OFFSET vs 커서 페이지네이션 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"seeding {args.rows} books into {_db_dir} ...")
+    seed(args.rows)
+    db = SessionLocal()
+
+    print(f"{'scope':>6} {'depth':>9} {'offset(ms)':>11} {'cursor(ms)':>11}")
+    per_user = args.rows // USERS
+    scopes = [("all", None, args.rows), ("user", 1, per_user)]
+    for scope, user_id, total in scopes:
+        for fraction in (0, 0.01, 0.1, 0.5, 0.99):
+            depth = int(total * fraction)
+            # 해당 깊이의 직전 행으로 커서를 만들어 OFFSET과 같은 페이지를 조회
+            cursor = None
+            if depth:
+                prev = crud_book.get_books(db, skip=depth - 1, limit=1, user_id=user_id)[0]
+                key = (prev.user_id, prev.id) if user_id is not None else (prev.id,)
+                cursor = crud_book.encode_cursor(key)
+            offset_ms = timed(
+                lambda: crud_book.get_books(db, skip=depth, limit=args.limit, user_id=user_id),
+                args.repeat,
+            )
+            cursor_ms = timed(
+                lambda: crud_book.get_books_keyset(
+                    db, limit=args.limit, user_id=user_id, cursor=cursor
+                ),
+                args.repeat,
+            )
+            print(f"{scope:>6} {depth:>9} {offset_ms:>11.2f} {cursor_ms:>11.2f}")
+            db.expunge_all()
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
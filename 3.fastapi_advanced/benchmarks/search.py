@@ -0,0 +1,93 @@
+# 도서 전문 검색 벤치마크
+# 도서 수를 늘려가며 FTS5 검색(search_books)과 LIKE '%단어%' 전체 스캔의 조회 시간을 비교합니다.
+# FTS5 검색은 색인을 사용하므로 도서 수가 늘어도 조회 시간이 거의 늘지 않아야 합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.search [--sizes 10000 100000 1000000] [--repeat 20]
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_search_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+from sqlalchemy import or_
+
+from app.crud import book as crud_book
+from app.db.base import Base, SessionLocal, engine
+from app.db.models.book import Book
+from app.db.models.user import User
+
+BATCH = 50_000
+# 무작위 단어 사전 (단어마다 출현 빈도가 다르도록 지프 분포로 뽑음)
+VOCABULARY = [f"w{i:05d}" for i in range(20_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def seed(start: int, end: int, rng: random.Random) -> None:
+    """id가 start 이상 end 미만인 도서를 저장합니다. (트리거가 색인을 함께 갱신)"""
+    for batch_start in range(start, end, BATCH):
+        rows = []
+        for i in range(batch_start, min(batch_start + BATCH, end)):
+            title, author, description = (
+                " ".join(rng.choices(VOCABULARY, WEIGHTS, k=k)) for k in (4, 2, 20)
+            )
+            rows.append({"id": i, "title": title, "author": author, "published_year": 2000,
+                         "isbn": f"isbn-{i}", "description": description, "user_id": 1})
+        with engine.begin() as conn:
+            conn.execute(Book.__table__.insert(), rows)
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    """fn을 repeat번 실행한 중앙값(밀리초)을 반환합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FTS5 검색 / LIKE 스캔 조회 시간 비교")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{"email": "owner@example.com", "hashed_password": "x",
+                                                "is_active": True, "is_superuser": False}])
+    rng = random.Random(0)
+    # 흔한 단어, 드문 단어, 접두사 검색 (상위 20개 결과)
+    queries = {"common": VOCABULARY[3], "rare": VOCABULARY[15_000], "prefix": "w0001*"}
+
+    print(f"{'books':>9} {'query':>7} {'fts5(ms)':>9} {'like(ms)':>9}")
+    seeded = 0
+    db = SessionLocal()
+    try:
+        for size in sorted(args.sizes):
+            seed(seeded + 1, size + 1, rng)
+            seeded = size
+            for name, q in queries.items():
+                fts = timed(lambda: crud_book.search_books(db, q=q, limit=20, user_id=1), args.repeat)
+                pattern = f"%{q.rstrip('*')}%"
+                like = timed(
+                    lambda: db.query(Book).filter(
+                        Book.user_id == 1,
+                        or_(Book.title.like(pattern), Book.author.like(pattern),
+                            Book.description.like(pattern)),
+                    ).limit(20).all(),
+                    max(1, args.repeat // 4),
+                )
+                print(f"{size:>9} {name:>7} {fts:>9.2f} {like:>9.2f}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# 목록 응답 직렬화 벤치마크
+# 페이지 크기별로 도서 목록 한 페이지를 조회하고 JSON 바이트를 만드는 시간을 비교합니다.
+# - response_model: ORM 객체 → 응답 모델 검증 → jsonable_encoder → JSONResponse (FastAPI 기본 경로)
+# - dump_books: ORM 객체 → Book.from_orm → jsonable_encoder → json.dumps (목록 캐시의 미스 경로)
+# - fast: 응답 스키마의 열만 SELECT → SchemaEncoder (FAST_JSON_RESPONSES=True)
+# 세 방식의 출력이 바이트 단위로 같은지도 함께 확인합니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.serialization [--page-sizes 10 100 1000] [--repeat 200]
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+# 애플리케이션을 임포트하기 전에 벤치마크 전용 데이터베이스를 지정
+_db_dir = tempfile.mkdtemp(prefix="bench_serialization_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.crud import book as crud_book
+from app.db.base import Base, SessionLocal, engine
+from app.db.models.book import Book
+from app.db.models.user import User
+from app.schemas import book as book_schema
+
+BOOKS = 10_000
+
+
+def timed(fn: Callable[[], bytes], repeat: int) -> float:
+    """fn을 repeat번 실행한 중앙값(밀리초)을 반환합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 시간 비교")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{"email": "owner@example.com", "hashed_password": "x",
+                                                "is_active": True, "is_superuser": False}])
+        conn.execute(Book.__table__.insert(), [
+            {"title": f"Book {i}", "author": f"Author {i % 97}", "published_year": 2000 + i % 25,
+             "isbn": f"isbn-{i}", "description": "설명 " * 20 if i % 2 else None, "user_id": 1}
+            for i in range(BOOKS)
+        ])
+
+    # read_books의 response_model과 같은 응답 필드
+    field = create_response_field(name="Response_Read_Books", type_=List[book_schema.Book])
+    encoder = book_schema.book_encoder
+    loop = asyncio.new_event_loop()
+    db = SessionLocal()
+
+    print(f"{'page':>6} {'response_model(ms)':>19} {'dump_books(ms)':>15} {'fast(ms)':>9} {'speedup':>8}")
+    try:
+        for size in args.page_sizes:
+            def response_model() -> bytes:
+                books = crud_book.get_books(db, limit=size, user_id=1)
+                content = loop.run_until_complete(serialize_response(
+                    field=field, response_content=books, exclude_unset=True, is_coroutine=True,
+                ))
+                return JSONResponse(content).body
+
+            def dump_books() -> bytes:
+                return book_schema.dump_books(crud_book.get_books(db, limit=size, user_id=1))
+
+            def fast() -> bytes:
+                return encoder.encode(crud_book.get_book_rows(db, encoder.names, limit=size, user_id=1))
+
+            # 세션 identity map에 남은 객체가 측정에 영향을 주지 않도록 매번 비움
+            paths = {name: (lambda fn=fn: (fn(), db.expunge_all())[0])
+                     for name, fn in (("response_model", response_model),
+                                      ("dump_books", dump_books), ("fast", fast))}
+            outputs = {name: fn() for name, fn in paths.items()}
+            assert len(set(outputs.values())) == 1, "serialized bodies differ"
+
+            times = {name: timed(fn, args.repeat) for name, fn in paths.items()}
+            print(f"{size:>6} {times['response_model']:>19.3f} {times['dump_books']:>15.3f} "
+                  f"{times['fast']:>9.3f} {times['response_model'] / times['fast']:>7.1f}x")
+    finally:
+        db.close()
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
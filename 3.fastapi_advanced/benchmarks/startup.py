@@ -0,0 +1,142 @@
+# 콜드 스타트 벤치마크 - 임포트 시간과 첫 응답까지의 시간
+# 오토스케일링으로 새 워커가 뜰 때 요청을 받기까지 걸리는 시간을 추적하기 위한 벤치마크입니다.
+# - import: `python -X importtime -c "import app.main"`의 app.main 누적 임포트 시간과, 가장 오래 걸린 모듈
+# - first response: uvicorn 프로세스를 띄운 순간부터 첫 HTTP 응답을 받을 때까지의 시간
+#   (인터프리터 시작, 임포트, startup 이벤트, 첫 요청 처리를 모두 포함)
+# 매번 새 프로세스를 띄워 측정하며, 측정값은 실행 간 편차가 크므로 여러 번 실행한 중앙값을 봅니다.
+#
+# 실행 (프로젝트 루트에서): python -m benchmarks.startup [--runs 5] [--top 10] [--output startup.json]
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Tuple
+
+# 첫 응답을 확인할 경로 - 인증 없이 요청하면 DB 조회 없이 401로 응답하는 API
+PROBE_PATH = "/api/v1/books/"
+
+
+def bench_env(db_dir: str, init_db_on_startup: bool) -> Dict[str, str]:
+    """벤치마크 전용 데이터베이스를 사용하는 자식 프로세스 환경변수"""
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{db_dir}/bench.db"
+    env["INIT_DB_ON_STARTUP"] = "true" if init_db_on_startup else "false"
+    env["PYTHONPATH"] = os.getcwd() + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """-X importtime 출력을 {모듈: (자체 시간, 누적 시간)} (마이크로초)로 바꿉니다."""
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_import(env: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_response(env: Dict[str, str], timeout: float = 30.0) -> float:
+    """uvicorn 프로세스를 시작하고 첫 응답을 받을 때까지의 시간(초)"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}{PROBE_PATH}"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                urllib.request.urlopen(url, timeout=1)
+            except urllib.error.HTTPError:
+                # 401 등 HTTP 응답을 받으면 요청을 처리할 준비가 된 것
+                return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                if process.poll() is not None:
+                    raise RuntimeError("uvicorn exited before responding")
+                time.sleep(0.005)
+            else:
+                return time.perf_counter() - start
+        raise RuntimeError(f"no response within {timeout} seconds")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="임포트 시간과 첫 응답까지의 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="자체 임포트 시간이 긴 app 모듈 수")
+    parser.add_argument("--init-db-on-startup", action="store_true",
+                        help="startup 이벤트에서 테이블/관리자 계정 생성 (INIT_DB_ON_STARTUP=true)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    env = bench_env(db_dir, args.init_db_on_startup)
+    # 배포 단계와 같이 먼저 테이블과 관리자 계정을 만들어 둠
+    subprocess.run([sys.executable, "-m", "app.initial_data"], env=env, check=True,
+                   capture_output=True)
+
+    imports = [measure_import(env) for _ in range(args.runs)]
+    import_ms = [modules["app.main"][1] / 1000 for modules in imports]
+    first_response_ms = [measure_first_response(env) * 1000 for _ in range(args.runs)]
+
+    # 자체 임포트 시간의 중앙값이 긴 app 모듈
+    app_modules = {name for modules in imports for name in modules if name.startswith("app")}
+    slowest = sorted(
+        ((statistics.median(modules.get(name, (0, 0))[0] for modules in imports) / 1000, name)
+         for name in app_modules),
+        reverse=True,
+    )[:args.top]
+
+    results = {
+        "runs": args.runs,
+        "init_db_on_startup": args.init_db_on_startup,
+        "import_ms": summarize(import_ms),
+        "first_response_ms": summarize(first_response_ms),
+        "slowest_app_modules_ms": {name: self_ms for self_ms, name in slowest},
+    }
+
+    print(f"{'metric':<20} {'median':>9} {'min':>9} {'max':>9}")
+    for key in ("import_ms", "first_response_ms"):
+        stats = results[key]
+        print(f"{key:<20} {stats['median']:>9.1f} {stats['min']:>9.1f} {stats['max']:>9.1f}")
+    print(f"\n{'app module (self)':<45} {'ms':>7}")
+    for self_ms, name in slowest:
+        print(f"{name:<45} {self_ms:>7.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# pytest 공용 픽스처
+# 실행 중인 서버 없이 TestClient로 애플리케이션을 직접 호출하며,
+# 개발용 sql_app.db 대신 임시 SQLite 파일을 사용합니다.
+import os
+import tempfile
+
+# 애플리케이션을 임포트하기 전에 테스트용 설정을 지정해야 함
+_db_dir = tempfile.mkdtemp(prefix="fastapi_advanced_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ.setdefault("PROJECT_NAME", "Advanced Book Management System")
+os.environ.setdefault("FIRST_SUPERUSER", "admin@example.com")
+os.environ.setdefault("FIRST_SUPERUSER_PASSWORD", "admin123")
+# 테스트 속도를 위해 최소 bcrypt 비용을 사용 (이 값과 다른 해시는 로그인 시 다시 해시됨)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from typing import Dict, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.crud import user as crud_user
+from app.db.base import SessionLocal
+from app.initial_data import init, init_db
+from app.main import app
+from app.schemas.user import UserCreate
+from tests.utils import get_token_headers
+
+
+@pytest.fixture(scope="session")
+def db() -> Generator:
+    """테이블과 관리자 계정이 준비된 데이터베이스 세션"""
+    init_db()
+    init()
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def client(db) -> Generator:
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def superuser_token_headers(client: TestClient) -> Dict[str, str]:
+    return get_token_headers(
+        client, settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD
+    )
+
+
+@pytest.fixture(scope="session")
+def normal_user(db):
+    email, password = "user@example.com", "user1234"
+    user = crud_user.get_user_by_email(db, email=email)
+    if not user:
+        user = crud_user.create_user(db, UserCreate(email=email, password=password))
+    return user
+
+
+@pytest.fixture(scope="session")
+def normal_user_token_headers(client: TestClient, normal_user) -> Dict[str, str]:
+    return get_token_headers(client, "user@example.com", "user1234")
+
+
+@pytest.fixture(scope="session")
+def async_client(db) -> Generator:
+    """비동기 DB 모드(ASYNC_DB=True)의 엔드포인트로 구성한 클라이언트
+
+    같은 데이터베이스 파일을 사용하므로 동기 모드와 나란히 비교할 수 있음
+    """
+    from fastapi import FastAPI
+
+    from app.api.v1.router import include_api_routes
+    from app.core.timing import ServerTimingMiddleware
+
+    async_app = FastAPI()
+    if settings.SERVER_TIMING:
+        async_app.add_middleware(ServerTimingMiddleware)
+    include_api_routes(async_app, async_db=True, prefix=settings.API_V1_STR)
+    with TestClient(async_app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session", params=["sync", "async"])
+def any_client(request, client: TestClient, async_client: TestClient) -> TestClient:
+    """동기/비동기 모드 클라이언트로 같은 테스트를 반복 실행하기 위한 픽스처"""
+    return client if request.param == "sync" else async_client
@@ -0,0 +1,69 @@
+# 동기/비동기 DB 모드 비교 테스트
+# 같은 시나리오를 두 모드에서 실행하여 API 동작이 동일한지 확인합니다.
+import uuid
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from tests.utils import get_token_headers
+
+
+def test_login_and_me(any_client: TestClient) -> None:
+    headers = get_token_headers(
+        any_client, settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD
+    )
+    response = any_client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == settings.FIRST_SUPERUSER
+    assert response.json()["is_superuser"] is True
+
+
+def test_wrong_password_is_rejected(any_client: TestClient) -> None:
+    response = any_client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": settings.FIRST_SUPERUSER, "password": "wrong"},
+    )
+    assert response.status_code == 400
+
+
+def test_book_crud(any_client: TestClient, normal_user_token_headers: Dict[str, str]) -> None:
+    url = f"{settings.API_V1_STR}/books/"
+    response = any_client.post(
+        url,
+        headers=normal_user_token_headers,
+        json={
+            "title": "Mode",
+            "author": "Tester",
+            "published_year": 2024,
+            "isbn": f"mode-{uuid.uuid4().hex[:8]}",
+        },
+    )
+    assert response.status_code == 200, response.text
+    book = response.json()
+
+    response = any_client.get(f"{url}{book['id']}", headers=normal_user_token_headers)
+    assert response.json() == book
+
+    response = any_client.put(
+        f"{url}{book['id']}", headers=normal_user_token_headers, json={"title": "Updated"}
+    )
+    assert response.json()["title"] == "Updated"
+
+    response = any_client.get(url, headers=normal_user_token_headers, params={"limit": 1000})
+    ids = [b["id"] for b in response.json()]
+    assert book["id"] in ids
+
+    response = any_client.delete(f"{url}{book['id']}", headers=normal_user_token_headers)
+    assert response.status_code == 200
+    response = any_client.get(f"{url}{book['id']}", headers=normal_user_token_headers)
+    assert response.status_code == 404
+
+
+def test_regular_user_cannot_list_users(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    response = any_client.get(
+        f"{settings.API_V1_STR}/users/", headers=normal_user_token_headers
+    )
+    assert response.status_code == 400
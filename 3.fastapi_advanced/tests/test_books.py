@@ -0,0 +1,355 @@
+# 도서 API 테스트
+import csv
+import io
+import json
+import uuid
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.core.cache import VersionedResponseCache, book_list_cache
+from app.core.config import settings
+from app.crud import book as crud_book
+
+
+def create_book(client: TestClient, headers: Dict[str, str], isbn: str) -> Dict:
+    response = client.post(
+        f"{settings.API_V1_STR}/books/",
+        headers=headers,
+        json={
+            "title": f"Book {isbn}",
+            "author": "Tester",
+            "published_year": 2024,
+            "isbn": isbn,
+        },
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_cursor_pagination_walks_all_books(
+    client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    created = [
+        create_book(client, normal_user_token_headers, f"page-{i}")["id"]
+        for i in range(5)
+    ]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            f"{settings.API_V1_STR}/books/page",
+            headers=normal_user_token_headers,
+            params=params,
+        )
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(book["id"] for book in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [book_id for book_id in seen if book_id in created] == created
+    assert seen == sorted(seen)
+
+
+def test_cursor_pagination_matches_offset_mode(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    for i in range(3):
+        create_book(client, superuser_token_headers, f"admin-page-{i}")
+
+    offset_ids = [
+        book["id"]
+        for book in client.get(
+            f"{settings.API_V1_STR}/books/",
+            headers=superuser_token_headers,
+            params={"limit": 1000},
+        ).json()
+    ]
+    page = client.get(
+        f"{settings.API_V1_STR}/books/page",
+        headers=superuser_token_headers,
+        params={"limit": 1000},
+    ).json()
+
+    assert [book["id"] for book in page["items"]] == sorted(offset_ids)
+    assert page["next_cursor"] is None
+
+
+def test_cursor_pagination_rejects_foreign_cursor(
+    client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    for cursor in ("not-a-cursor", crud_book.encode_cursor((999999, 1))):
+        response = client.get(
+            f"{settings.API_V1_STR}/books/page",
+            headers=normal_user_token_headers,
+            params={"cursor": cursor},
+        )
+        assert response.status_code == 400
+
+
+def book_row(isbn: str) -> Dict:
+    return {"title": f"Bulk {isbn}", "author": "Importer", "published_year": 2020, "isbn": isbn}
+
+
+def test_bulk_import_reports_conflicts_without_aborting(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    prefix = uuid.uuid4().hex[:8]
+    existing = create_book(any_client, normal_user_token_headers, f"{prefix}-0")
+    rows = [
+        book_row(f"{prefix}-1"),
+        book_row(existing["isbn"]),       # 이미 저장된 ISBN
+        {"title": "No ISBN", "author": "Importer", "published_year": 2020},  # 검증 실패
+        book_row(f"{prefix}-2"),
+        book_row(f"{prefix}-1"),          # 요청 안에서 중복
+        book_row(f"{prefix}-3"),
+    ]
+    response = any_client.post(
+        f"{settings.API_V1_STR}/books/bulk?batch_size=2",
+        headers=normal_user_token_headers,
+        json=rows,
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["inserted"] == 3
+    assert [(e["index"], e["isbn"]) for e in result["errors"]] == [
+        (1, existing["isbn"]),
+        (2, None),
+        (4, f"{prefix}-1"),
+    ]
+    assert result["errors"][0]["detail"] == "ISBN already exists"
+    assert "isbn" in result["errors"][1]["detail"]
+
+    books = any_client.get(
+        f"{settings.API_V1_STR}/books/?limit=1000", headers=normal_user_token_headers
+    ).json()
+    imported = sorted(b["isbn"] for b in books if b["isbn"].startswith(prefix))
+    assert imported == [f"{prefix}-{i}" for i in range(4)]
+
+
+def test_bulk_import_accepts_ndjson(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    prefix = uuid.uuid4().hex[:8]
+    body = "\n".join(
+        [json.dumps(book_row(f"{prefix}-{i}")) for i in range(5)] + ["{not json", ""]
+    )
+    response = any_client.post(
+        f"{settings.API_V1_STR}/books/bulk",
+        headers={**normal_user_token_headers, "Content-Type": "application/x-ndjson"},
+        data=body,
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["inserted"] == 5
+    assert [e["index"] for e in result["errors"]] == [5]
+
+
+def test_bulk_import_rejects_non_array_body(
+    client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/books/bulk",
+        headers=normal_user_token_headers,
+        json=book_row("not-a-list"),
+    )
+    assert response.status_code == 400
+
+
+def test_export_streams_own_books_as_ndjson_and_csv(
+    any_client: TestClient,
+    normal_user_token_headers: Dict[str, str],
+    superuser_token_headers: Dict[str, str],
+) -> None:
+    prefix = uuid.uuid4().hex[:8]
+    own = create_book(any_client, normal_user_token_headers, f"{prefix}-own")
+    other = create_book(any_client, superuser_token_headers, f"{prefix}-admin")
+
+    response = any_client.get(
+        f"{settings.API_V1_STR}/books/export", headers=normal_user_token_headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert all(row["user_id"] == own["user_id"] for row in rows)
+    assert own in rows
+    # 목록 조회와 같은 결과를 같은 순서로 내보냄
+    listed = any_client.get(
+        f"{settings.API_V1_STR}/books/page?limit=1000", headers=normal_user_token_headers
+    ).json()["items"]
+    assert rows == listed
+
+    response = any_client.get(
+        f"{settings.API_V1_STR}/books/export?format=csv", headers=superuser_token_headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    isbns = {record["isbn"] for record in records}
+    assert {own["isbn"], other["isbn"]} <= isbns
+
+
+def test_export_rejects_unknown_format(
+    client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/books/export?format=xml", headers=normal_user_token_headers
+    )
+    assert response.status_code == 422
+
+
+def test_book_conditional_get(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    book = create_book(any_client, normal_user_token_headers, f"{uuid.uuid4().hex[:8]}-etag")
+    url = f"{settings.API_V1_STR}/books/{book['id']}"
+
+    response = any_client.get(url, headers=normal_user_token_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = any_client.get(url, headers={**normal_user_token_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    response = any_client.get(
+        url, headers={**normal_user_token_headers, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # 수정하면 버전이 올라가 새 ETag로 전체 응답을 받음
+    any_client.put(url, headers=normal_user_token_headers, json={"title": "Changed"})
+    response = any_client.get(url, headers={**normal_user_token_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Changed"
+    assert response.headers["etag"] != etag
+
+
+def test_search_ranks_matches_and_respects_visibility(
+    any_client: TestClient,
+    normal_user_token_headers: Dict[str, str],
+    superuser_token_headers: Dict[str, str],
+) -> None:
+    word = f"zq{uuid.uuid4().hex[:8]}"
+    books_url = f"{settings.API_V1_STR}/books"
+
+    def add(headers: Dict[str, str], **fields) -> Dict:
+        row = {"author": "Someone", "published_year": 2024,
+               "isbn": uuid.uuid4().hex[:16], **fields}
+        response = any_client.post(f"{books_url}/", headers=headers, json=row)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    in_description = add(normal_user_token_headers, title="Other", description=f"about {word}")
+    in_title = add(normal_user_token_headers, title=f"{word} handbook")
+    prefixed = add(normal_user_token_headers, title=f"{word}ology")
+    admins = add(superuser_token_headers, title=f"{word} admin copy")
+
+    def search(q: str, headers: Dict[str, str]) -> list:
+        response = any_client.get(f"{books_url}/search", params={"q": q}, headers=headers)
+        assert response.status_code == 200, response.text
+        return [book["id"] for book in response.json()]
+
+    # 제목 일치가 설명 일치보다 앞에 오고, 다른 사용자의 책은 보이지 않음
+    assert search(word, normal_user_token_headers) == [in_title["id"], in_description["id"]]
+    assert search(f"{word}*", normal_user_token_headers)[-1] == in_description["id"]
+    assert prefixed["id"] in search(f"{word}*", normal_user_token_headers)
+    assert admins["id"] in search(word, superuser_token_headers)
+
+    # 수정과 삭제가 색인에 반영됨
+    any_client.put(f"{books_url}/{in_title['id']}", headers=normal_user_token_headers,
+                   json={"title": "Renamed"})
+    any_client.delete(f"{books_url}/{in_description['id']}", headers=normal_user_token_headers)
+    assert search(word, normal_user_token_headers) == []
+
+    # FTS5 문법 문자는 검색어로 취급되지 않음
+    assert search('"unbalanced AND (', normal_user_token_headers) == []
+
+
+def test_book_list_is_cached_until_books_change(
+    any_client: TestClient,
+    normal_user_token_headers: Dict[str, str],
+    superuser_token_headers: Dict[str, str],
+) -> None:
+    url = f"{settings.API_V1_STR}/books/?limit=1000"
+    book_list_cache.clear()
+
+    first = any_client.get(url, headers=normal_user_token_headers)
+    second = any_client.get(url, headers=normal_user_token_headers)
+    assert first.status_code == second.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert second.content == first.content
+    assert book_list_cache.stats()["hits"] == 1
+
+    # 새 책이 생기면 소유자 목록과 관리자 목록 모두 다시 조회됨
+    admin_before = any_client.get(url, headers=superuser_token_headers).json()
+    created = create_book(any_client, normal_user_token_headers, f"{uuid.uuid4().hex[:8]}-cache")
+    assert created in any_client.get(url, headers=normal_user_token_headers).json()
+    assert created in any_client.get(url, headers=superuser_token_headers).json()
+    assert created not in admin_before
+
+    any_client.put(f"{settings.API_V1_STR}/books/{created['id']}",
+                   headers=normal_user_token_headers, json={"title": "Cached?"})
+    titles = {b["id"]: b["title"] for b in any_client.get(url, headers=normal_user_token_headers).json()}
+    assert titles[created["id"]] == "Cached?"
+
+    any_client.delete(f"{settings.API_V1_STR}/books/{created['id']}", headers=normal_user_token_headers)
+    ids = [b["id"] for b in any_client.get(url, headers=normal_user_token_headers).json()]
+    assert created["id"] not in ids
+
+
+def test_versioned_response_cache_evicts_by_memory() -> None:
+    cache = VersionedResponseCache(max_bytes=10, ttl=60)
+    cache.set("a", 1, cache.version("a"), b"12345")
+    cache.set("a", 2, cache.version("a"), b"67890")
+    cache.get("a", 1)  # 1을 최근 사용 항목으로
+    cache.set("b", 1, cache.version("b"), b"abcde")
+    assert cache.get("a", 2) is None
+    assert cache.get("a", 1) == b"12345"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 10
+
+    # 조회 중에 버전이 바뀌면 저장하지 않고, 버전이 바뀐 범위는 다시 조회해야 함
+    version = cache.version("b")
+    cache.bump("b")
+    cache.set("b", 2, version, b"stale")
+    assert cache.get("b", 2) is None
+    assert cache.get("b", 1) is None
+
+
+def test_fast_json_book_list_is_byte_identical(
+    any_client: TestClient,
+    superuser_token_headers: Dict[str, str],
+    normal_user_token_headers: Dict[str, str],
+    monkeypatch,
+) -> None:
+    create_book(any_client, normal_user_token_headers, f"fast-{uuid.uuid4().hex[:8]}")
+    # 비ASCII 문자와 설명이 있는 책
+    response = any_client.post(
+        f"{settings.API_V1_STR}/books/",
+        headers=normal_user_token_headers,
+        json={"title": "빠른 \"직렬화\"", "author": "Tester", "published_year": 2024,
+              "isbn": f"fast-{uuid.uuid4().hex[:8]}", "description": "줄\n바꿈"},
+    )
+    assert response.status_code == 200, response.text
+
+    for headers in (normal_user_token_headers, superuser_token_headers):
+        bodies = []
+        for fast in (False, True):
+            monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+            book_list_cache.clear()
+            response = any_client.get(
+                f"{settings.API_V1_STR}/books/", headers=headers, params={"limit": 50}
+            )
+            assert response.status_code == 200, response.text
+            bodies.append(response.content)
+        assert bodies[0] == bodies[1]
+        assert json.loads(bodies[1])
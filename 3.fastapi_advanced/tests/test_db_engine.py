@@ -0,0 +1,95 @@
+# 데이터베이스 엔진 설정 테스트
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.db.base import async_read_engine, engine, read_engine
+from app.db.engine import engine_options, read_pool_enabled
+
+
+def pragma(bind, name: str):
+    with bind.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_sqlite_pragmas_are_applied(db) -> None:
+    assert pragma(engine, "journal_mode") == "wal"
+    # NORMAL = 1
+    assert pragma(engine, "synchronous") == 1
+    assert pragma(engine, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert pragma(engine, "cache_size") == -settings.SQLITE_CACHE_SIZE_KIB
+    assert pragma(engine, "query_only") == 0
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == settings.DB_POOL_SIZE
+
+
+def test_read_engine_is_separate_and_read_only(db) -> None:
+    assert read_pool_enabled()
+    assert read_engine is not engine
+    assert read_engine.pool.size() == settings.DB_READ_POOL_SIZE
+    assert pragma(read_engine, "query_only") == 1
+    with read_engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT count(*) FROM users").scalar() >= 1
+        with pytest.raises(OperationalError):
+            conn.exec_driver_sql("DELETE FROM users")
+
+
+def test_async_read_engine_is_read_only(db) -> None:
+    async def query_only() -> int:
+        async with async_read_engine.connect() as conn:
+            result = await conn.exec_driver_sql("PRAGMA query_only")
+            return result.scalar()
+
+    # 세션 범위 TestClient가 사용하는 현재 이벤트 루프를 바꾸지 않도록 별도 루프에서 실행
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(query_only()) == 1
+    finally:
+        loop.close()
+
+
+def test_engine_options_per_dialect() -> None:
+    memory = engine_options("sqlite://", settings)
+    assert "poolclass" not in memory and "pool_size" not in memory
+    postgres = engine_options("postgresql://db/app", settings, read_only=True)
+    assert postgres["pool_size"] == settings.DB_READ_POOL_SIZE
+    assert postgres["pool_recycle"] == settings.DB_POOL_RECYCLE_SECONDS
+    assert postgres["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+    assert "connect_args" not in postgres
+    aio = engine_options("sqlite+aiosqlite:///./app.db", settings, is_async=True)
+    assert aio["poolclass"] is AsyncAdaptedQueuePool
+    assert aio["pool_size"] == settings.DB_POOL_SIZE
+    assert "poolclass" not in engine_options("sqlite+aiosqlite://", settings, is_async=True)
+
+
+def test_async_engine_reuses_connections(db) -> None:
+    assert isinstance(async_read_engine.pool, AsyncAdaptedQueuePool)
+    assert async_read_engine.pool.size() == settings.DB_READ_POOL_SIZE
+    connects = []
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        connects.append(dbapi_connection)
+
+    async def driver_connection_ids() -> list:
+        ids = []
+        for _ in range(3):
+            async with async_read_engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                ids.append(id(raw.connection))
+                await conn.exec_driver_sql("SELECT 1")
+        return ids
+
+    event.listen(async_read_engine.sync_engine, "connect", on_connect)
+    loop = asyncio.new_event_loop()
+    try:
+        ids = loop.run_until_complete(driver_connection_ids())
+    finally:
+        loop.close()
+        event.remove(async_read_engine.sync_engine, "connect", on_connect)
+    # 연결을 닫았다 다시 열지 않고 풀의 같은 연결을 재사용 (연결 이벤트/PRAGMA는 최대 한 번)
+    assert len(set(ids)) == 1
+    assert len(connects) <= 1
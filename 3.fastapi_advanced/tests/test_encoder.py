@@ -0,0 +1,51 @@
+# 스키마별 JSON 인코더 테스트
+import enum
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from app.schemas.encoder import SchemaEncoder
+
+
+class Color(enum.Enum):
+    red = "red"
+
+
+class Record(BaseModel):
+    id: int
+    name: str = Field(..., alias="displayName")
+    price: Decimal
+    created_at: datetime
+    due: Optional[date] = None
+    color: Color
+    key: UUID
+    ratio: float
+    active: bool
+
+
+def test_encoder_matches_response_model_serialization() -> None:
+    rows = [
+        (1, "ünïcode \"quoted\"", Decimal("1.50"), datetime(2024, 1, 2, 3, 4, 5, 6),
+         date(2024, 2, 3), Color.red, UUID(int=1), 0.1, True),
+        (2, "plain", Decimal("2"), datetime(2024, 1, 2), None, Color.red, UUID(int=2), 2.0, False),
+    ]
+    encoder = SchemaEncoder(Record)
+    models = [Record.parse_obj(dict(zip(encoder.keys, row))) for row in rows]
+    expected = JSONResponse(jsonable_encoder(models, by_alias=True)).body
+
+    assert encoder.encode(rows) == expected
+    assert encoder.names[1] == "name" and encoder.keys[1] == "displayName"
+
+
+def test_encoder_rejects_nested_fields() -> None:
+    class Nested(BaseModel):
+        tags: List[str]
+
+    with pytest.raises(TypeError):
+        SchemaEncoder(Nested)
@@ -0,0 +1,88 @@
+# 런타임 지표(/metrics) 테스트
+import re
+from threading import Thread
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram, format_labels
+
+_SAMPLE = re.compile(r'^(\w+)(\{.*\})? (\S+)$')
+
+
+def parse_metrics(text: str) -> Dict[str, float]:
+    """Prometheus 텍스트를 {"이름{레이블}": 값} 딕셔너리로 바꿉니다. (주석 줄 제외)"""
+    samples: Dict[str, float] = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, labels, value = _SAMPLE.match(line).groups()
+        samples[name + (labels or "")] = float(value)
+    return samples
+
+
+def test_metrics_endpoint(client: TestClient, superuser_token_headers: Dict[str, str]) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/books/",
+        headers=superuser_token_headers,
+        json={"title": "Metrics", "author": "Tester", "published_year": 2024, "isbn": "metrics-1"},
+    )
+    book_id = response.json()["id"]
+    for _ in range(3):
+        assert client.get(f"{settings.API_V1_STR}/books/{book_id}", headers=superuser_token_headers).status_code == 200
+    client.get("/no-such-path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = parse_metrics(response.text)
+
+    # 경로 매개변수는 값이 아니라 라우트 템플릿으로 집계됨
+    route = f"{settings.API_V1_STR}/books/{{book_id}}"
+    assert samples[f'http_requests_total{{method="GET",route="{route}",status="200"}}'] >= 3
+    assert not any(f"/books/{book_id}\"" in key for key in samples)
+    assert samples['http_requests_total{method="GET",route="<unmatched>",status="404"}'] >= 1
+
+    # 히스토그램의 +Inf 구간 개수 = _count = 해당 라우트의 요청 수 합계
+    labels = f'method="GET",route="{route}"'
+    count = samples[f"http_request_duration_seconds_count{{{labels}}}"]
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == count
+    assert count == sum(v for k, v in samples.items()
+                        if k.startswith(f"http_requests_total{{{labels},"))
+    # /metrics 요청 자신은 아직 처리 중
+    assert samples["http_requests_in_progress"] == 1
+
+    # 로그인(비밀번호 검증) 시간과 조회 시점 지표
+    assert samples["password_hash_duration_seconds_count"] >= 1
+    assert 'db_pool_checked_out{pool="write"}' in samples
+    assert 'cache_hit_ratio{cache="user"}' in samples
+    assert "password_hash_in_flight" in samples
+
+
+def test_sharded_metrics_across_threads() -> None:
+    counter = Counter("test_total", "test", ("kind",))
+    histogram = Histogram("test_seconds", "test", buckets=(0.1, 1.0))
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc(("a",))
+            histogram.observe(0.5)
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 스레드별 조각이 조회 시 합쳐짐
+    assert counter.values() == {("a",): 4000}
+    counts, total = histogram.values()[()]
+    assert counts == [0, 4000, 4000]
+    assert total == 2000.0
+    assert 'test_seconds_bucket{le="1.0"} 4000' in histogram.collect()
+
+
+def test_label_escaping() -> None:
+    assert format_labels(("path",), ('a"b\\c\nd',)) == '{path="a\\"b\\\\c\\nd"}'
+    assert format_labels((), ()) == ""
@@ -0,0 +1,70 @@
+# 기존 데이터베이스 스키마 보완 테스트
+# VersionedMixin(version, updated_at)이 추가되기 전에 만든 데이터베이스에서도
+# upgrade_schema 후에는 ORM 조회와 수정이 동작해야 합니다.
+import os
+import tempfile
+
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.migrate import upgrade_schema
+from app.db.models.book import Book
+from app.db.search import books_fts, create_search_index, match
+
+# 열이 추가되기 전의 스키마 (저장소에 포함된 sql_app.db와 같음)
+OLD_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL, email VARCHAR, hashed_password VARCHAR, "
+    "is_active BOOLEAN, is_superuser BOOLEAN, PRIMARY KEY (id))",
+    "CREATE TABLE books (id INTEGER NOT NULL, title VARCHAR(100), author VARCHAR(100), "
+    "published_year INTEGER, isbn VARCHAR(20), description TEXT, user_id INTEGER, "
+    "PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id))",
+    "INSERT INTO users VALUES (1, 'old@example.com', 'x', 1, 0)",
+    "INSERT INTO books VALUES (1, 'Old', 'Author', 2020, 'old-1', NULL, 1)",
+]
+
+
+def test_upgrade_old_schema() -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="migrate_test_"), "old.db")
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        for statement in OLD_SCHEMA:
+            connection.exec_driver_sql(statement)
+        added = upgrade_schema(connection, Base.metadata)
+    assert set(added) == {"users.version", "users.updated_at", "books.version", "books.updated_at"}
+    assert "ix_books_user_id_id" in {index["name"] for index in inspect(engine).get_indexes("books")}
+
+    # 기존 행은 기본값으로 채워지고 ORM 수정 시 버전이 올라감
+    with Session(engine) as db:
+        book = db.get(Book, 1)
+        assert book.version == 1 and book.updated_at is not None
+        book.title = "Updated"
+        db.commit()
+        assert book.version == 2
+
+    # 다시 실행하면 아무것도 추가하지 않음
+    with engine.begin() as connection:
+        assert upgrade_schema(connection, Base.metadata) == []
+
+
+def test_search_index_on_existing_database() -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="migrate_test_"), "old.db")
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        for statement in OLD_SCHEMA:
+            connection.exec_driver_sql(statement)
+        # init_db()와 같은 순서 - books 테이블이 이미 있으면 after_create 이벤트로는 만들어지지 않음
+        upgrade_schema(connection, Base.metadata)
+        create_search_index(connection)
+        create_search_index(connection)
+
+    # 기존 책도 색인되고, 이후 추가한 책은 트리거로 색인됨
+    with Session(engine) as db:
+        db.add(Book(title="New", author="Writer", published_year=2024, isbn="new-1", user_id=1))
+        db.commit()
+
+        def search(query: str) -> list:
+            return db.execute(select(books_fts.c.rowid).where(match(query))).scalars().all()
+
+        assert search('"old"') == [1]
+        assert search('"writer"') == [2]
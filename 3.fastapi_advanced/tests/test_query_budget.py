@@ -0,0 +1,106 @@
+# 엔드포인트별 쿼리 예산 테스트 (N+1 쿼리 방지)
+# 목록 엔드포인트의 SQL 문 수는 반환하는 행 수와 관계없이 일정해야 합니다.
+# 여러 사용자의 책을 만들어 두고 각 엔드포인트가 선언한 예산 이내인지 확인합니다.
+# 예산에는 인증 사용자 조회(캐시 미스일 때 1회)가 포함됩니다.
+import uuid
+from typing import Dict, List, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.crud import book as crud_book
+from app.crud import user as crud_user
+from app.db.base import SessionLocal
+from app.schemas.book import BookCreate
+from app.schemas.user import UserCreate
+from tests.utils import query_budget
+
+# (경로, 쿼리 예산) - 관리자 토큰으로 호출
+QUERY_BUDGETS: List[Tuple[str, int]] = [
+    ("/books/", 2),
+    ("/books/page?limit=50", 2),
+    ("/books/search?q=budget", 2),
+    ("/books/admin?limit=50", 2),
+    ("/users/", 2),
+]
+
+OWNERS = 4
+BOOKS_PER_OWNER = 3
+
+
+@pytest.fixture(scope="module")
+def books_of_many_owners(db) -> List[int]:
+    """서로 다른 사용자 OWNERS명이 BOOKS_PER_OWNER권씩 가진 책"""
+    book_ids = []
+    session = SessionLocal()
+    try:
+        for _ in range(OWNERS):
+            owner = crud_user.create_user(session, UserCreate(
+                email=f"owner-{uuid.uuid4().hex[:8]}@example.com", password="owner1234",
+            ))
+            for _ in range(BOOKS_PER_OWNER):
+                book = crud_book.create_book(session, BookCreate(
+                    title="Budget", author="Tester", published_year=2024,
+                    isbn=f"budget-{uuid.uuid4().hex[:12]}",
+                ), user_id=owner.id)
+                book_ids.append(book.id)
+    finally:
+        session.close()
+    return book_ids
+
+
+@pytest.mark.parametrize("path,budget", QUERY_BUDGETS)
+def test_endpoint_query_budget(
+    any_client: TestClient,
+    superuser_token_headers: Dict[str, str],
+    books_of_many_owners: List[int],
+    path: str,
+    budget: int,
+) -> None:
+    with query_budget(budget):
+        response = any_client.get(f"{settings.API_V1_STR}{path}", headers=superuser_token_headers)
+    assert response.status_code == 200, response.text
+
+
+def test_admin_listing_embeds_owner(
+    any_client: TestClient, superuser_token_headers: Dict[str, str], books_of_many_owners: List[int]
+) -> None:
+    url = f"{settings.API_V1_STR}/books/admin"
+    response = any_client.get(url, headers=superuser_token_headers, params={"limit": 1000})
+    assert response.status_code == 200, response.text
+    books = {book["id"]: book for book in response.json()}
+    owners = {books[book_id]["user"]["email"] for book_id in books_of_many_owners}
+    assert len(owners) == OWNERS
+    assert all(book["user"]["id"] == book["user_id"] for book in books.values())
+
+
+def test_admin_listing_requires_superuser(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    response = any_client.get(f"{settings.API_V1_STR}/books/admin", headers=normal_user_token_headers)
+    assert response.status_code == 400
+
+
+def test_query_budget_catches_lazy_loading(books_of_many_owners: List[int]) -> None:
+    session = SessionLocal()
+    try:
+        # 지연 로딩: 소유자마다 SELECT가 추가됨
+        with pytest.raises(AssertionError, match="exceeded the budget of 1"):
+            with query_budget(1):
+                for book in crud_book.get_books(session, limit=1000):
+                    book.user.email
+        session.expunge_all()
+
+        # 다대일은 JOIN으로 같은 SELECT에서 로딩
+        with query_budget(1):
+            for book in crud_book.get_books(session, limit=1000, options=crud_book.WITH_OWNER):
+                book.user.email
+        session.expunge_all()
+
+        # 일대다는 IN 조건의 SELECT 한 번 추가
+        with query_budget(2):
+            for user in crud_user.get_users(session, limit=1000, options=crud_user.WITH_BOOKS):
+                len(user.books)
+    finally:
+        session.close()
@@ -0,0 +1,56 @@
+# 서명 키 파일(SECRET_KEY_FILE) 테스트
+# 여러 워커 프로세스가 같은 키 파일을 사용하면 한 워커가 발급한 토큰을 다른 워커가 검증할 수 있어야 합니다.
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+
+from jose import jwt
+
+from app.core.config import Settings, load_or_create_secret_key
+from app.core.security import ALGORITHM
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_secret_key_file_is_created_once() -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="secret_key_test_"), "secret_key")
+    key = load_or_create_secret_key(path)
+    assert load_or_create_secret_key(path) == key
+    # 소유자만 읽을 수 있음
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    # 임시 파일이 남지 않음
+    assert os.listdir(os.path.dirname(path)) == ["secret_key"]
+
+
+def test_settings_secret_key_resolution() -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="secret_key_test_"), "secret_key")
+    # .env의 SECRET_KEY를 읽지 않도록 _env_file=None
+    assert Settings(_env_file=None, SECRET_KEY_FILE=path).SECRET_KEY == load_or_create_secret_key(path)
+    # 직접 지정한 키가 키 파일보다 우선
+    assert Settings(_env_file=None, SECRET_KEY="explicit", SECRET_KEY_FILE=path).SECRET_KEY == "explicit"
+    # 둘 다 없으면 생성할 때마다 다른 랜덤 키 (단일 프로세스 전용)
+    assert Settings(_env_file=None).SECRET_KEY != Settings(_env_file=None).SECRET_KEY
+
+
+def test_token_is_valid_across_processes() -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="secret_key_test_"), "secret_key")
+    # 빈 SECRET_KEY 환경변수가 .env의 값보다 우선하므로 키 파일이 사용됨
+    env = {**os.environ, "SECRET_KEY": "", "SECRET_KEY_FILE": path}
+    # 워커 프로세스들이 동시에 시작하는 상황 - 먼저 키 파일을 만든 프로세스의 키를 모두 사용해야 함
+    code = (
+        "from app.core.security import create_access_token\n"
+        "print(create_access_token(1))"
+    )
+    processes = [
+        subprocess.Popen([sys.executable, "-c", code], cwd=PROJECT_DIR, env=env,
+                         stdout=subprocess.PIPE, text=True)
+        for _ in range(4)
+    ]
+    tokens = [process.communicate()[0].strip() for process in processes]
+    assert all(process.returncode == 0 for process in processes)
+
+    key = load_or_create_secret_key(path)
+    for token in tokens:
+        assert jwt.decode(token, key, algorithms=[ALGORITHM])["sub"] == "1"
\ No newline at end of file
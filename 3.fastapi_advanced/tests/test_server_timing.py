@@ -0,0 +1,71 @@
+# Server-Timing 헤더와 요청 로그 테스트
+import logging
+import re
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.timing import current_timings, timed
+from tests.utils import count_statements
+
+_METRIC = re.compile(r'(\w+);dur=([\d.]+)(?:;desc="(\d+) queries")?')
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """Server-Timing 헤더를 {구간: 밀리초} 딕셔너리로 바꿉니다. (쿼리 수는 "queries" 키)"""
+    metrics: Dict[str, float] = {}
+    for part in header.split(", "):
+        name, duration, queries = _METRIC.fullmatch(part).groups()
+        metrics[name] = float(duration)
+        if queries is not None:
+            metrics["queries"] = int(queries)
+    return metrics
+
+
+def create_book(client: TestClient, headers: Dict[str, str], isbn: str) -> int:
+    response = client.post(
+        f"{settings.API_V1_STR}/books/",
+        headers=headers,
+        json={"title": "Timing", "author": "Tester", "published_year": 2024, "isbn": isbn},
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def test_server_timing_header(any_client: TestClient, superuser_token_headers: Dict[str, str]) -> None:
+    book_id = create_book(any_client, superuser_token_headers, f"timing-{id(any_client)}")
+    with count_statements() as statements:
+        response = any_client.get(f"{settings.API_V1_STR}/books/{book_id}", headers=superuser_token_headers)
+    assert response.status_code == 200
+    metrics = parse_server_timing(response.headers["server-timing"])
+    # 헤더의 쿼리 수는 실제로 실행된 SQL 문 수와 같음
+    assert metrics["queries"] == len(statements)
+    assert {"db", "auth", "serialize", "total"} <= set(metrics)
+    assert metrics["total"] >= metrics["auth"]
+
+
+def test_server_timing_unauthenticated(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/books/")
+    assert response.status_code == 401
+    metrics = parse_server_timing(response.headers["server-timing"])
+    assert metrics["queries"] == 0
+    assert "auth" not in metrics
+
+
+def test_request_log_line(client: TestClient, superuser_token_headers: Dict[str, str], caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="app.timing"):
+        client.get(f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers)
+    record = next(r for r in caplog.records if r.name == "app.timing")
+    message = record.getMessage()
+    assert message.startswith(f"method=GET path={settings.API_V1_STR}/users/me status=200 ")
+    for key in ("total_ms", "db_ms", "queries", "auth_ms", "serialize_ms"):
+        assert f" {key}=" in message
+
+
+def test_timed_outside_request() -> None:
+    # 미들웨어 밖(스크립트, 백그라운드 작업)에서는 아무것도 기록하지 않음
+    assert current_timings() is None
+    with timed("auth"):
+        pass
+    assert current_timings() is None
@@ -0,0 +1,54 @@
+# 애플리케이션 시작 테스트
+# 모듈 임포트만으로는 데이터베이스에 접속하지 않아야 하며, 테이블 생성과 관리자 계정 생성은
+# INIT_DB_ON_STARTUP=True일 때 startup 이벤트에서 실행됩니다.
+# 임포트 시점의 동작을 확인해야 하므로 새 파이썬 프로세스에서 실행합니다.
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, env: Dict[str, str]) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_DIR, env={**os.environ, **env},
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_import_does_not_touch_database() -> None:
+    db_path = os.path.join(tempfile.mkdtemp(prefix="startup_test_"), "app.db")
+    output = run_python(
+        "import json, sys\n"
+        "import app.main\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('app.api.v1.endpoints'))))",
+        {"DATABASE_URL": f"sqlite:///{db_path}", "ASYNC_DB": "false", "INIT_DB_ON_STARTUP": "false"},
+    )
+    # SQLite는 처음 접속할 때 파일을 만듦
+    assert not os.path.exists(db_path)
+    # 사용하지 않는 비동기 엔드포인트 모듈은 임포트하지 않음
+    modules = json.loads(output)
+    assert "app.api.v1.endpoints.book" in modules
+    assert not any(".aio" in module for module in modules)
+
+
+def test_init_db_on_startup() -> None:
+    db_path = os.path.join(tempfile.mkdtemp(prefix="startup_test_"), "app.db")
+    output = run_python(
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "from app.core.config import settings\n"
+        "with TestClient(app) as client:\n"
+        "    response = client.post(f'{settings.API_V1_STR}/login/access-token', data={\n"
+        "        'username': settings.FIRST_SUPERUSER, 'password': settings.FIRST_SUPERUSER_PASSWORD})\n"
+        "    print(response.status_code)",
+        {"DATABASE_URL": f"sqlite:///{db_path}", "INIT_DB_ON_STARTUP": "true",
+         "FIRST_SUPERUSER": "admin@example.com", "FIRST_SUPERUSER_PASSWORD": "admin123",
+         "BCRYPT_ROUNDS": "4", "PASSWORD_HASH_WORKERS": "0"},
+    )
+    # startup 이벤트에서 테이블과 관리자 계정이 만들어져 바로 로그인 가능
+    assert output.strip() == "200"
@@ -0,0 +1,112 @@
+# 엔드포인트별 SQL 문 수 테스트
+# 쓰기 요청은 INSERT/UPDATE 한 번(+ 커밋)으로 끝나야 하며, 커밋 후 refresh나
+# 만료된 속성을 다시 읽는 SELECT가 추가되지 않아야 합니다.
+# 로그인 사용자는 첫 요청에서 캐시되므로 이후 요청은 사용자 조회 SELECT가 없습니다.
+import uuid
+from typing import Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.config import settings
+from app.crud import book as crud_book
+from app.db.base import SessionLocal
+from app.schemas.book import BookUpdate
+from tests.utils import count_statements
+
+
+def verbs(statements: List[str]) -> List[str]:
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+def test_book_write_statement_counts(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/books/"
+    headers = normal_user_token_headers
+    # 사용자 캐시 채우기
+    any_client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+
+    with count_statements() as statements:
+        response = any_client.post(url, headers=headers, json={
+            "title": "Counted", "author": "Tester", "published_year": 2024,
+            "isbn": f"count-{uuid.uuid4().hex[:12]}",
+        })
+    assert response.status_code == 200, response.text
+    assert verbs(statements) == ["INSERT"]
+    book_id = response.json()["id"]
+
+    with count_statements() as statements:
+        response = any_client.get(f"{url}{book_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert verbs(statements) == ["SELECT"]
+
+    with count_statements() as statements:
+        response = any_client.put(f"{url}{book_id}", headers=headers, json={"title": "Recounted"})
+    assert response.status_code == 200, response.text
+    assert response.json()["title"] == "Recounted"
+    # 권한 확인을 위한 조회 + UPDATE
+    assert verbs(statements) == ["SELECT", "UPDATE"]
+    # 새 버전이 저장되었는지 ETag로 확인
+    response = any_client.get(f"{url}{book_id}", headers=headers)
+    assert response.headers["etag"] == f'"{book_id}-2"'
+
+    with count_statements() as statements:
+        response = any_client.delete(f"{url}{book_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert verbs(statements) == ["SELECT", "DELETE"]
+
+
+def test_user_update_statement_count(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/users/me"
+    headers = normal_user_token_headers
+    any_client.get(url, headers=headers)
+
+    with count_statements() as statements:
+        # 비밀번호를 같은 값으로 다시 설정 (새 해시가 저장됨)
+        response = any_client.put(url, headers=headers, json="user1234")
+    assert response.status_code == 200, response.text
+    assert verbs(statements) == ["UPDATE"]
+    # 바뀐 열(비밀번호 해시)과 행 버전만 UPDATE
+    assert statements[0].startswith(
+        "UPDATE users SET version=?, updated_at=?, hashed_password=? WHERE"
+    )
+
+    etag = any_client.get(url, headers=headers).headers["etag"]
+    with count_statements() as statements:
+        response = any_client.put(url, headers=headers)
+    assert response.status_code == 200, response.text
+    # 바뀐 값이 없으면 쓰기를 생략
+    assert statements == []
+    assert any_client.get(url, headers=headers).headers["etag"] == etag
+
+
+def test_stale_update_is_rejected(
+    client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    """조회 후 다른 요청이 먼저 변경한 책은 덮어쓰지 않음 (API에서는 409)"""
+    response = client.post(f"{settings.API_V1_STR}/books/", headers=normal_user_token_headers, json={
+        "title": "Contended", "author": "Tester", "published_year": 2024,
+        "isbn": f"stale-{uuid.uuid4().hex[:12]}",
+    })
+    book_id = response.json()["id"]
+
+    stale = SessionLocal()
+    try:
+        stale_book = crud_book.get_book(stale, book_id)
+        response = client.put(
+            f"{settings.API_V1_STR}/books/{book_id}",
+            headers=normal_user_token_headers,
+            json={"title": "First writer"},
+        )
+        assert response.status_code == 200, response.text
+        with pytest.raises(StaleDataError):
+            crud_book.update_book(stale, stale_book, BookUpdate(title="Second writer"))
+    finally:
+        stale.close()
+
+    response = client.get(f"{settings.API_V1_STR}/books/{book_id}", headers=normal_user_token_headers)
+    assert response.json()["title"] == "First writer"
@@ -0,0 +1,202 @@
+# 사용자 API 테스트
+import asyncio
+import json
+import uuid
+from typing import Dict, List
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy.orm import Session
+
+from app.core.cache import user_cache
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.security import password_needs_update
+from app.db.models.user import User
+from tests.utils import get_token_headers
+
+
+def create_user(client: TestClient, superuser_token_headers: Dict[str, str]) -> Dict:
+    email = f"{uuid.uuid4().hex[:8]}@example.com"
+    response = client.post(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        json={"email": email, "password": "secret123"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_current_user_is_served_from_cache(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str]
+) -> None:
+    user_cache.clear()
+    for _ in range(3):
+        response = any_client.get(
+            f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers
+        )
+        assert response.status_code == 200
+    stats = user_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+def test_deactivated_user_is_rejected_immediately(
+    any_client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    user = create_user(any_client, superuser_token_headers)
+    headers = get_token_headers(any_client, user["email"], "secret123")
+    me_url = f"{settings.API_V1_STR}/users/me"
+    # 첫 요청으로 사용자 스냅샷이 캐시에 저장됨
+    assert any_client.get(me_url, headers=headers).status_code == 200
+
+    response = any_client.put(
+        f"{settings.API_V1_STR}/users/{user['id']}",
+        headers=superuser_token_headers,
+        json={"is_active": False},
+    )
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    response = any_client.get(me_url, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+def test_update_user_requires_superuser(
+    any_client: TestClient, normal_user_token_headers: Dict[str, str], normal_user
+) -> None:
+    response = any_client.put(
+        f"{settings.API_V1_STR}/users/{normal_user.id}",
+        headers=normal_user_token_headers,
+        json={"is_superuser": True},
+    )
+    assert response.status_code == 400
+
+
+def test_login_is_rejected_when_hash_queue_is_full(any_client: TestClient) -> None:
+    max_pending = password_hasher.max_pending
+    password_hasher.max_pending = 0
+    try:
+        response = any_client.post(
+            f"{settings.API_V1_STR}/login/access-token",
+            data={
+                "username": settings.FIRST_SUPERUSER,
+                "password": settings.FIRST_SUPERUSER_PASSWORD,
+            },
+        )
+    finally:
+        password_hasher.max_pending = max_pending
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)
+
+
+def test_concurrent_logins_are_shed_with_503(
+    any_client: TestClient,
+    superuser_token_headers: Dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # 검증에 수백 ms가 걸리는 해시를 저장해 두면 대기열 한도(2)를 넘는 동시 로그인이 생김
+    user = create_user(any_client, superuser_token_headers)
+    slow_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=12).hash("secret123")
+    db.query(User).filter(User.id == user["id"]).update({User.hashed_password: slow_hash})
+    db.commit()
+    # 로그인 후 재해시 작업이 대기열 자리를 차지하지 않도록 끔
+    monkeypatch.setattr("app.crud.user.password_needs_update", lambda hashed_password: False)
+    monkeypatch.setattr("app.crud.aio.user.password_needs_update", lambda hashed_password: False)
+    monkeypatch.setattr(password_hasher, "max_pending", 2)
+
+    async def burst() -> List[httpx.Response]:
+        # 한 이벤트 루프에서 로그인 8개와 도서 목록 조회를 동시에 보냄
+        async with httpx.AsyncClient(app=any_client.app, base_url="http://test") as client:
+            form = {"username": user["email"], "password": "secret123"}
+            logins = [
+                client.post(f"{settings.API_V1_STR}/login/access-token", data=form)
+                for _ in range(8)
+            ]
+            books = client.get(f"{settings.API_V1_STR}/books/", headers=superuser_token_headers)
+            return await asyncio.gather(*logins, books)
+
+    # asyncio.run은 현재 이벤트 루프를 비워 세션 범위 TestClient 종료에 영향을 주므로 별도 루프 사용
+    loop = asyncio.new_event_loop()
+    try:
+        *logins, books = loop.run_until_complete(burst())
+    finally:
+        loop.close()
+    statuses = sorted(response.status_code for response in logins)
+    # 한도 안의 요청만 검증되고 나머지는 기다리지 않고 바로 503 + Retry-After
+    assert statuses.count(200) >= 1
+    assert statuses.count(503) >= 1
+    assert set(statuses) <= {200, 503}
+    for response in logins:
+        if response.status_code == 503:
+            assert response.headers["retry-after"] == str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)
+    # 로그인 대기 중에도 동기 엔드포인트는 처리됨
+    assert books.status_code == 200
+    assert password_hasher.stats()["in_flight"] == 0
+
+
+def test_hash_stats_are_recorded(any_client: TestClient) -> None:
+    count = password_hasher.stats()["count"]
+    get_token_headers(
+        any_client, settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD
+    )
+    stats = password_hasher.stats()
+    assert stats["count"] == count + 1
+    assert stats["in_flight"] == 0
+    assert stats["max_seconds"] > 0
+
+
+def test_outdated_hash_is_rehashed_on_login(
+    any_client: TestClient, db: Session, superuser_token_headers: Dict[str, str]
+) -> None:
+    created = create_user(any_client, superuser_token_headers)
+    # 현재 설정(BCRYPT_ROUNDS=4)과 다른 비용으로 저장된 해시를 만든다
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secret123")
+    db.query(User).filter(User.id == created["id"]).update({User.hashed_password: old_hash})
+    db.commit()
+    assert password_needs_update(old_hash)
+
+    get_token_headers(any_client, created["email"], "secret123")
+
+    db.expire_all()
+    new_hash = db.query(User.hashed_password).filter(User.id == created["id"]).scalar()
+    assert new_hash != old_hash
+    assert not password_needs_update(new_hash)
+    # 다시 해시된 비밀번호로도 로그인할 수 있어야 한다
+    get_token_headers(any_client, created["email"], "secret123")
+
+
+def test_current_user_conditional_get(
+    any_client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    created = create_user(any_client, superuser_token_headers)
+    headers = get_token_headers(any_client, created["email"], "secret123")
+    url = f"{settings.API_V1_STR}/users/me"
+
+    etag = any_client.get(url, headers=headers).headers["etag"]
+    response = any_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    any_client.put(url, headers=headers, json="newsecret123")
+    response = any_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_fast_json_user_list_is_byte_identical(
+    any_client: TestClient, superuser_token_headers: Dict[str, str], monkeypatch
+) -> None:
+    create_user(any_client, superuser_token_headers)
+    bodies = []
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+        response = any_client.get(f"{settings.API_V1_STR}/users/", headers=superuser_token_headers)
+        assert response.status_code == 200, response.text
+        bodies.append(response.content)
+    assert bodies[0] == bodies[1]
+    assert len(json.loads(bodies[1])) >= 2
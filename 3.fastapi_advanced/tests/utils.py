@@ -0,0 +1,51 @@
+# 테스트 공용 유틸리티
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.db.base import async_engine, async_read_engine, engine, read_engine
+
+
+def get_token_headers(client: TestClient, email: str, password: str) -> Dict[str, str]:
+    """로그인하여 Authorization 헤더를 만듭니다."""
+    response = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": email, "password": password},
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """블록 안에서 데이터베이스에 보낸 SQL 문을 모읍니다. (동기/비동기 엔진 모두)"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # 읽기 전용 풀이 꺼져 있으면 읽기 엔진은 쓰기 엔진과 같은 객체
+    engines = {engine, read_engine, async_engine.sync_engine, async_read_engine.sync_engine}
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def query_budget(budget: int) -> Iterator[List[str]]:
+    """블록 안에서 실행된 SQL 문이 budget개를 넘으면 실패합니다. (N+1 쿼리 방지)
+
+    실패 메시지에 실행된 SQL 문을 모두 보여 주므로 어떤 관계가 지연 로딩되었는지 바로 알 수 있습니다.
+    """
+    with count_statements() as statements:
+        yield statements
+    assert len(statements) <= budget, (
+        f"{len(statements)} queries exceeded the budget of {budget}:\n" + "\n".join(statements)
+    )
@@ -8,3 +8,8 @@ class Item(BaseModel):
 class ItemCreate(BaseModel):
     name: str
     description: str | None = None
+
+class ItemPage(BaseModel):
+    """커서 페이지네이션 응답 (다음 페이지는 next_cursor를 cursor 파라미터로 전달)"""
+    items: list[Item]
+    next_cursor: int | None = None
@@ -1,23 +1,42 @@
-from fastapi import APIRouter, HTTPException
-from app.models.item import Item, ItemCreate
+import os
+from typing import Any, Callable
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from app.models.item import Item, ItemCreate, ItemPage
 from app.services.item_service import ItemService
+from app.services.sqlite_item_service import SQLiteItemService
 
 router = APIRouter(
     prefix="/items",
     tags=["items"]
 )
 
-item_service = ItemService()
+# ITEM_DB_PATH를 지정하면 여러 워커 프로세스가 공유하는 SQLite 파일 저장소를 사용
+# 예) ITEM_DB_PATH=items.db uvicorn app.main:app --workers 4
+item_service = (
+    SQLiteItemService(os.environ["ITEM_DB_PATH"]) if os.environ.get("ITEM_DB_PATH") else ItemService()
+)
+
+async def run_service(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """서비스 메서드 호출 (SQLite 서비스는 쓰기 잠금을 기다릴 수 있으므로 스레드풀에서 실행)"""
+    if isinstance(getattr(method, "__self__", None), SQLiteItemService):
+        return await run_in_threadpool(method, *args, **kwargs)
+    return method(*args, **kwargs)
 
-@router.get("/", response_model=list[Item])
-async def get_items():
-    """모든 아이템 조회"""
-    return item_service.get_items()
+@router.get("/", response_model=ItemPage)
+async def get_items(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: int | None = None,
+):
+    """아이템 목록 조회 (id 순, 이전 응답의 next_cursor를 cursor로 넘기면 다음 페이지)"""
+    items, next_cursor = await run_service(item_service.list_items, limit=limit, cursor=cursor)
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.get("/{item_id}", response_model=Item)
 async def get_item(item_id: int):
     """특정 아이템 조회"""
-    item = item_service.get_item(item_id)
+    item = await run_service(item_service.get_item, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
@@ -25,12 +44,12 @@ async def get_item(item_id: int):
 @router.post("/", response_model=Item)
 async def create_item(item: ItemCreate):
     """새 아이템 생성"""
-    return item_service.create_item(item)
+    return await run_service(item_service.create_item, item)
 
 @router.put("/{item_id}", response_model=Item)
 async def update_item(item_id: int, item: ItemCreate):
     """아이템 수정"""
-    updated_item = item_service.update_item(item_id, item)
+    updated_item = await run_service(item_service.update_item, item_id, item)
     if not updated_item:
         raise HTTPException(status_code=404, detail="Item not found")
     return updated_item
@@ -38,6 +57,6 @@ async def update_item(item_id: int, item: ItemCreate):
 @router.delete("/{item_id}")
 async def delete_item(item_id: int):
     """아이템 삭제"""
-    if not item_service.delete_item(item_id):
+    if not await run_service(item_service.delete_item, item_id):
         raise HTTPException(status_code=404, detail="Item not found")
     return {"message": "Item deleted successfully"}
@@ -1,15 +1,74 @@
+from bisect import bisect_left, bisect_right
+
 from app.models.item import Item, ItemCreate
 
+class _SortedIds:
+    """오름차순 id 목록을 최대 BLOCK_SIZE개씩 나눠 담은 블록 리스트
+
+    삭제된 id를 바로 제거하므로 목록 조회가 삭제된 id를 건너뛰지 않습니다.
+    - 추가: 마지막 블록에 append (id는 항상 증가)
+    - 삭제: 블록별 최댓값에서 이진 탐색 후 블록 하나(최대 BLOCK_SIZE개) 안에서만 제거
+    - 커서 다음 위치 찾기: 이진 탐색 두 번
+    """
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self):
+        self._blocks: list[list[int]] = []
+        # 블록별 마지막(최대) id - 블록을 이진 탐색으로 찾기 위한 인덱스
+        self._maxes: list[int] = []
+
+    def append(self, item_id: int) -> None:
+        if self._blocks and len(self._blocks[-1]) < self.BLOCK_SIZE:
+            self._blocks[-1].append(item_id)
+        else:
+            self._blocks.append([item_id])
+            self._maxes.append(item_id)
+            return
+        self._maxes[-1] = item_id
+
+    def remove(self, item_id: int) -> None:
+        block_index = bisect_left(self._maxes, item_id)
+        block = self._blocks[block_index]
+        del block[bisect_left(block, item_id)]
+        if not block:
+            del self._blocks[block_index]
+            del self._maxes[block_index]
+        else:
+            self._maxes[block_index] = block[-1]
+
+    def after(self, cursor: int | None, count: int) -> list[int]:
+        """cursor보다 큰 id를 최대 count개 반환 (cursor가 None이면 처음부터)"""
+        block_index = 0 if cursor is None else bisect_right(self._maxes, cursor)
+        ids: list[int] = []
+        while block_index < len(self._blocks) and len(ids) < count:
+            block = self._blocks[block_index]
+            start = 0 if cursor is None or ids else bisect_right(block, cursor)
+            ids.extend(block[start:start + count - len(ids)])
+            block_index += 1
+        return ids
+
 class ItemService:
     def __init__(self):
-        self.items = []
+        # id → Item 해시 인덱스 (조회/수정 O(1))
+        self.items: dict[int, Item] = {}
         self.counter = 0
+        # 목록 조회용 정렬 인덱스 - 커서 위치를 이진 탐색으로 찾고 한 페이지만 읽음
+        self._ids = _SortedIds()
+
+    def list_items(self, limit: int = 100, cursor: int | None = None) -> tuple[list[Item], int | None]:
+        """cursor(이전 페이지 마지막 id) 다음부터 최대 limit개를 id 순으로 반환
 
-    def get_items(self) -> list[Item]:
-        return self.items
+        Returns:
+            (아이템 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        # 다음 페이지가 있는지 알기 위해 하나 더 가져옴
+        ids = self._ids.after(cursor, limit + 1)
+        page = [self.items[item_id] for item_id in ids[:limit]]
+        return page, (ids[limit - 1] if len(ids) > limit else None)
 
     def get_item(self, item_id: int) -> Item | None:
-        return next((item for item in self.items if item.id == item_id), None)
+        return self.items.get(item_id)
 
     def create_item(self, item: ItemCreate) -> Item:
         self.counter += 1
@@ -18,11 +77,12 @@ class ItemService:
             name=item.name,
             description=item.description
         )
-        self.items.append(new_item)
+        self.items[new_item.id] = new_item
+        self._ids.append(new_item.id)
         return new_item
 
     def update_item(self, item_id: int, item: ItemCreate) -> Item | None:
-        existing_item = self.get_item(item_id)
+        existing_item = self.items.get(item_id)
         if existing_item:
             existing_item.name = item.name
             existing_item.description = item.description
@@ -30,8 +90,7 @@ class ItemService:
         return None
 
     def delete_item(self, item_id: int) -> bool:
-        item = self.get_item(item_id)
-        if item:
-            self.items.remove(item)
-            return True
-        return False
+        if self.items.pop(item_id, None) is None:
+            return False
+        self._ids.remove(item_id)
+        return True
@@ -0,0 +1,67 @@
+import sqlite3
+from threading import Lock
+
+from app.models.item import Item, ItemCreate
+
+class SQLiteItemService:
+    """SQLite 파일에 아이템을 저장하는 ItemService
+
+    여러 워커 프로세스가 같은 파일을 사용하므로 모든 워커가 같은 아이템을 보고,
+    id는 AUTOINCREMENT로 워커 간에 겹치지 않게 발급됩니다.
+    다른 프로세스의 쓰기 잠금을 기다릴 수 있으므로 라우터에서는 스레드풀에서 호출합니다.
+    """
+
+    def __init__(self, path: str):
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL: 쓰기 중에도 다른 프로세스가 읽을 수 있음
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, description TEXT)"
+        )
+
+    @staticmethod
+    def _to_item(row: tuple) -> Item:
+        return Item.construct(id=row[0], name=row[1], description=row[2])
+
+    def list_items(self, limit: int = 100, cursor: int | None = None) -> tuple[list[Item], int | None]:
+        # 기본 키 인덱스에서 cursor 다음 위치부터 읽음 (다음 페이지 확인용으로 하나 더)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, name, description FROM items WHERE id > ? ORDER BY id LIMIT ?",
+                (0 if cursor is None else cursor, limit + 1),
+            ).fetchall()
+        items = [self._to_item(row) for row in rows[:limit]]
+        return items, (items[-1].id if len(rows) > limit else None)
+
+    def get_item(self, item_id: int) -> Item | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, name, description FROM items WHERE id = ?", (item_id,)
+            ).fetchone()
+        return self._to_item(row) if row else None
+
+    # RETURNING 문은 fetchall로 끝까지 실행해야 자동 커밋되어 쓰기 잠금이 풀림
+    def create_item(self, item: ItemCreate) -> Item:
+        with self._lock:
+            rows = self._conn.execute(
+                "INSERT INTO items (name, description) VALUES (?, ?) RETURNING id, name, description",
+                (item.name, item.description),
+            ).fetchall()
+        return self._to_item(rows[0])
+
+    def update_item(self, item_id: int, item: ItemCreate) -> Item | None:
+        with self._lock:
+            rows = self._conn.execute(
+                "UPDATE items SET name = ?, description = ? WHERE id = ? "
+                "RETURNING id, name, description",
+                (item.name, item.description, item_id),
+            ).fetchall()
+        return self._to_item(rows[0]) if rows else None
+
+    def delete_item(self, item_id: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        return cursor.rowcount > 0
@@ -0,0 +1,96 @@
+# 아이템 저장소 벤치마크
+# 저장된 아이템 수(1천 ~ 1백만)를 늘려가며 각 핸들러의 지연 시간과 목록 응답 크기를 측정합니다.
+# - read/update/delete: id 해시 인덱스로 처리되므로 아이템 수와 관계없이 일정해야 함
+# - list/list_deep: 첫 페이지와 임의 위치(cursor)의 페이지 조회 + 응답 JSON 인코딩
+#   한 페이지는 최대 limit개이므로 지연 시간과 응답 크기가 아이템 수와 관계없이 일정해야 함
+# - list_after_delete: 앞쪽 절반을 삭제한 뒤의 첫 페이지 조회
+#   삭제된 id는 정렬 인덱스에서 바로 제거되므로 삭제된 아이템 수와 관계없이 일정해야 함
+#
+# 실행 (프로젝트 루트에서): python benchmark.py [--sizes 1000 10000 100000 1000000] [--ops 2000] [--limit 100]
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from app.models.item import ItemCreate, ItemPage
+from app.routers import item_router
+from app.services.item_service import ItemService
+
+
+def build_service(size: int) -> ItemService:
+    """size개의 아이템이 저장된 서비스를 만듭니다."""
+    service = ItemService()
+    for i in range(1, size + 1):
+        service.create_item(ItemCreate.construct(name=f"Item {i}", description="benchmark seed"))
+    return service
+
+
+def measure(loop: asyncio.AbstractEventLoop, make_call: Callable, ops: int) -> Dict[str, float]:
+    """핸들러 호출을 ops번 실행하고 지연 시간 통계(마이크로초)를 반환합니다."""
+    samples: List[float] = []
+    for i in range(ops):
+        coro = make_call(i)
+        start = time.perf_counter()
+        loop.run_until_complete(coro)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p99": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def run(size: int, ops: int, limit: int, loop: asyncio.AbstractEventLoop) -> Dict[str, Dict[str, float]]:
+    item_router.item_service = build_service(size)
+    rng = random.Random(size)
+    existing = [rng.randint(1, size) for _ in range(ops)]
+    cursors = [rng.randint(1, size) for _ in range(ops)]
+    new_ids = list(range(size + 1, size + ops + 1))
+    update = ItemCreate(name="Benchmark", description="updated")
+    body_sizes: List[int] = []
+
+    async def list_page(cursor):
+        # 응답 모델 검증과 JSON 인코딩까지 포함 (응답 크기도 기록)
+        body = ItemPage(**await item_router.get_items(limit=limit, cursor=cursor)).json()
+        body_sizes.append(len(body))
+
+    results = {}
+    results["read"] = measure(loop, lambda i: item_router.get_item(existing[i]), ops)
+    results["create"] = measure(loop, lambda i: item_router.create_item(update), ops)
+    results["update"] = measure(loop, lambda i: item_router.update_item(new_ids[i], update), ops)
+    results["delete"] = measure(loop, lambda i: item_router.delete_item(new_ids[i]), ops)
+    results["list"] = measure(loop, lambda i: list_page(None), ops)
+    results["list_deep"] = measure(loop, lambda i: list_page(cursors[i]), ops)
+    results["list"]["bytes"] = max(body_sizes)
+
+    # 커서 앞쪽(가장 오래된 아이템 절반)을 대량 삭제
+    service = item_router.item_service
+    for item_id in range(1, size // 2 + 1):
+        service.delete_item(item_id)
+    results["list_after_delete"] = measure(loop, lambda i: list_page(None), ops)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="아이템 저장소 핸들러 지연 시간 벤치마크")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--ops", type=int, default=2000, help="크기별 작업당 반복 횟수")
+    parser.add_argument("--limit", type=int, default=100, help="목록 조회 페이지 크기")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    print(f"{'items':>10} {'op':>17} {'p50(us)':>9} {'p99(us)':>9}")
+    for size in args.sizes:
+        results = run(size, args.ops, args.limit, loop)
+        for op, stats in results.items():
+            print(f"{size:>10} {op:>17} {stats['p50']:>9.1f} {stats['p99']:>9.1f}")
+        print(f"{size:>10} {'max list response':>17}: {results['list']['bytes']} bytes")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
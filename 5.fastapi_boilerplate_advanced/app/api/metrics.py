@@ -0,0 +1,129 @@
+"""
+GET /metrics. Request and hashing metrics are recorded as they happen (see
+app/core/metrics.py); pool, cache and threadpool state is read per scrape.
+"""
+import asyncio
+from typing import Iterator, List, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.cache import user_cache
+from app.core.hashing import password_hasher
+from app.core.metrics import REGISTRY, metric_family
+from app.db.session import engine, read_engine
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+def _pools() -> Iterator[Tuple[str, object]]:
+    seen = set()
+    for name, pool in (("write", engine.pool), ("read", read_engine.pool)):
+        # read_engine is engine when no read pool is configured; StaticPool
+        # and NullPool have no size to report.
+        if id(pool) in seen or not hasattr(pool, "checkedout"):
+            continue
+        seen.add(id(pool))
+        yield name, pool
+
+
+def collect_pools() -> List[str]:
+    pools = list(_pools())
+    labels = ("pool",)
+    return (
+        metric_family(
+            "db_pool_size", "gauge", "Configured size of the connection pool.",
+            labels, [((name,), pool.size()) for name, pool in pools],
+        )
+        + metric_family(
+            "db_pool_checked_out", "gauge", "Connections currently checked out.",
+            labels, [((name,), pool.checkedout()) for name, pool in pools],
+        )
+        + metric_family(
+            "db_pool_checked_in", "gauge", "Idle connections held by the pool.",
+            labels, [((name,), pool.checkedin()) for name, pool in pools],
+        )
+        # QueuePool.overflow() is negative until the base pool is filled
+        + metric_family(
+            "db_pool_overflow", "gauge", "Connections open beyond the pool size.",
+            labels, [((name,), max(pool.overflow(), 0)) for name, pool in pools],
+        )
+    )
+
+
+def collect_cache() -> List[str]:
+    stats = user_cache.stats()
+    labels, name = ("cache",), ("user",)
+    return (
+        metric_family(
+            "cache_hits_total", "counter", "Cache lookups that found an entry.",
+            labels, [(name, stats["hits"])],
+        )
+        + metric_family(
+            "cache_misses_total", "counter", "Cache lookups that found no entry.",
+            labels, [(name, stats["misses"])],
+        )
+        + metric_family(
+            "cache_hit_ratio", "gauge", "Hits divided by lookups since start.",
+            labels, [(name, stats["hit_ratio"])],
+        )
+        + metric_family(
+            "cache_entries", "gauge", "Entries currently cached.",
+            labels, [(name, stats["size"])],
+        )
+    )
+
+
+def collect_password_hasher() -> List[str]:
+    stats = password_hasher.stats()
+    return (
+        metric_family(
+            "password_hash_workers", "gauge", "Password hashing worker processes.",
+            (), [((), stats["workers"])],
+        )
+        + metric_family(
+            "password_hash_in_flight", "gauge", "Password hash jobs running or queued.",
+            (), [((), stats["in_flight"])],
+        )
+        + metric_family(
+            "password_hash_rejected_total", "counter",
+            "Password hash jobs rejected with 503 because the queue was full.",
+            (), [((), stats["rejected"])],
+        )
+    )
+
+
+def collect_threadpool() -> List[str]:
+    """
+    The event loop's default executor, which runs sync endpoints and
+    dependencies. Reads private asyncio attributes, so it reports nothing if
+    the executor doesn't exist yet or looks different.
+    """
+    try:
+        executor = asyncio.get_running_loop()._default_executor
+        samples = [
+            ("threadpool_max_workers", "Maximum threads in the default executor.",
+             executor._max_workers),
+            ("threadpool_threads", "Threads started by the default executor.",
+             len(executor._threads)),
+            ("threadpool_queued_tasks", "Tasks waiting for a free thread.",
+             executor._work_queue.qsize()),
+        ]
+    except (AttributeError, RuntimeError):
+        return []
+    lines: List[str] = []
+    for name, help_text, value in samples:
+        lines += metric_family(name, "gauge", help_text, (), [((), value)])
+    return lines
+
+
+for _collector in (collect_pools, collect_cache, collect_password_hasher, collect_threadpool):
+    REGISTRY.add_collector(_collector)
+
+
+# async so collect_threadpool runs on the event loop
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
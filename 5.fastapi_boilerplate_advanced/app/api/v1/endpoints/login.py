@@ -1,7 +1,7 @@
 from datetime import timedelta
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -10,23 +10,30 @@ from app.api import deps
 from app.core import security
 from app.core.config import settings
 from app.core.security import get_password_hash
+from app.core.timing import TimedRoute
 from app.utils import (
     generate_password_reset_token,
     verify_password_reset_token,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
+# async so waiting on the hashing pool holds no threadpool thread
 @router.post("/login/access-token", response_model=schemas.Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(deps.get_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = crud.user.authenticate(
-        db, email=form_data.username, password=form_data.password
+    user = await crud.user.authenticate_async(
+        db,
+        email=form_data.username,
+        password=form_data.password,
+        background_tasks=background_tasks,
     )
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
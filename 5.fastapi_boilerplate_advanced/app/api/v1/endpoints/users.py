@@ -1,20 +1,42 @@
-from typing import Any, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
 
-from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from pydantic import EmailStr
+from pydantic.error_wrappers import ErrorWrapper
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
 from app.core.config import settings
+from app.core.timing import TimedRoute
+from app.crud.base import ColumnValueError
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+
+
+@contextmanager
+def _column_errors_as_422() -> Iterator[None]:
+    """Report values the CRUD layer rejects like request validation errors (422)."""
+    try:
+        yield
+    except ColumnValueError as exc:
+        raise RequestValidationError([ErrorWrapper(exc, loc=("body", exc.field))])
+
+
+def _check_bulk_size(count: int) -> None:
+    if count > settings.USERS_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.USERS_BULK_MAX_ITEMS} users per bulk request",
+        )
 
 
 @router.get("/", response_model=List[schemas.User])
 def read_users(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: models.User = Depends(deps.get_current_active_superuser),
@@ -46,6 +68,80 @@ def create_user(
     return user
 
 
+# The bulk create/update endpoints are async so that waiting on the hashing
+# pool holds no threadpool thread; the queries run in the threadpool.
+@router.post("/bulk", response_model=List[schemas.User])
+async def create_users_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    users_in: List[schemas.UserCreate],
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Create many users in one transaction. Users are returned in request order.
+    """
+    _check_bulk_size(len(users_in))
+    emails = [user_in.email for user_in in users_in]
+    if len(set(emails)) != len(emails):
+        raise HTTPException(status_code=400, detail="Duplicate emails in request")
+    existing = await run_in_threadpool(crud.user.get_multi_by_email, db, emails=emails)
+    if existing:
+        raise HTTPException(
+            status_code=400,
+            detail="Users with these emails already exist: "
+            + ", ".join(sorted(user.email for user in existing)),
+        )
+    await crud.user.create_multi_async(db, objs_in=users_in)
+    users = await run_in_threadpool(crud.user.get_multi_by_email, db, emails=emails)
+    by_email = {user.email: user for user in users}
+    return [by_email[email] for email in emails]
+
+
+@router.put("/bulk", response_model=List[schemas.User])
+async def update_users_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    users_in: List[schemas.UserBulkUpdate],
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Update many users (e.g. deactivate them) in one transaction. Users are
+    returned in request order.
+    """
+    _check_bulk_size(len(users_in))
+    ids = [user_in.id for user_in in users_in]
+    found = {user.id for user in await run_in_threadpool(crud.user.get_multi_by_id, db, ids=ids)}
+    missing = sorted(set(ids) - found)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Users not found: {', '.join(map(str, missing))}",
+        )
+    with _column_errors_as_422():
+        await crud.user.update_multi_async(
+            db, objs_in={user_in.id: user_in for user_in in users_in}
+        )
+    users = await run_in_threadpool(crud.user.get_multi_by_id, db, ids=ids)
+    by_id = {user.id: user for user in users}
+    return [by_id[id] for id in ids]
+
+
+@router.delete("/bulk", response_model=Dict[str, int])
+def delete_users_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    ids: List[int] = Query(...),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Delete many users in one transaction.
+    """
+    _check_bulk_size(len(ids))
+    if current_user.id in ids:
+        raise HTTPException(status_code=400, detail="Users can't delete themselves")
+    return {"deleted": crud.user.remove_multi(db, ids=ids)}
+
+
 @router.put("/me", response_model=schemas.User)
 def update_user_me(
     *,
@@ -56,17 +152,17 @@ def update_user_me(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Update own user.
+    Update own user. Only the supplied fields are compared and written.
     """
-    current_user_data = jsonable_encoder(current_user)
-    user_in = schemas.UserUpdate(**current_user_data)
+    user_in: Dict[str, Any] = {}
     if password is not None:
-        user_in.password = password
+        user_in["password"] = password
     if full_name is not None:
-        user_in.full_name = full_name
+        user_in["full_name"] = full_name
     if email is not None:
-        user_in.email = email
-    user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
+        user_in["email"] = email
+    with _column_errors_as_422():
+        user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
     return user
 
 
@@ -98,3 +194,25 @@ def read_user_by_id(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return user
+
+
+@router.put("/{user_id}", response_model=schemas.User)
+def update_user(
+    *,
+    db: Session = Depends(deps.get_db),
+    user_id: int,
+    user_in: schemas.UserUpdate,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Update a user (e.g. deactivate it).
+    """
+    user = crud.user.get(db, id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail="The user with this username does not exist in the system",
+        )
+    with _column_errors_as_422():
+        user = crud.user.update(db, db_obj=user, obj_in=user_in)
+    return user
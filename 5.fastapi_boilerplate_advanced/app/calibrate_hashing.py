@@ -0,0 +1,63 @@
+"""
+Measure bcrypt hashing time on this host and suggest a BCRYPT_ROUNDS value.
+
+    python -m app.calibrate_hashing --target-ms 250
+
+Each extra round doubles the hashing time, so rounds are measured from
+--min-rounds upwards until one exceeds the target. The highest value within
+the target is printed as BCRYPT_ROUNDS=N, ready to be added to .env.
+"""
+import argparse
+import statistics
+import time
+from typing import Dict
+
+from passlib.hash import bcrypt
+
+# Never suggest less than the OWASP minimum.
+MIN_ROUNDS = 10
+MAX_ROUNDS = 31
+
+
+def measure(rounds: int, samples: int) -> float:
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int, min_rounds: int = MIN_ROUNDS) -> Dict[int, float]:
+    results: Dict[int, float] = {}
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        results[rounds] = measure(rounds, samples)
+        if results[rounds] > target_ms:
+            break
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pick BCRYPT_ROUNDS for this host")
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--min-rounds", type=int, default=MIN_ROUNDS)
+    args = parser.parse_args()
+
+    results = calibrate(args.target_ms, args.samples, args.min_rounds)
+    print(f"{'rounds':>6} {'median(ms)':>11}")
+    for rounds, elapsed in results.items():
+        print(f"{rounds:>6} {elapsed:>11.1f}")
+
+    within = [rounds for rounds, elapsed in results.items() if elapsed <= args.target_ms]
+    if within:
+        chosen = max(within)
+    else:
+        chosen = args.min_rounds
+        print(f"# warning: rounds={chosen} already exceeds {args.target_ms:.0f}ms")
+    print(f"BCRYPT_ROUNDS={chosen}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,81 @@
+import os
 import secrets
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, BaseSettings, EmailStr, HttpUrl, validator
 
 
+def load_or_create_secret_key(path: str) -> str:
+    """
+    Read the signing key from path, creating it if missing. A new key is
+    written to a temp file and published with os.link, so when several workers
+    start at once the first one to link wins and the rest read its key.
+    """
+    if not os.path.exists(path):
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(secrets.token_urlsafe(32))
+            os.link(temp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(temp_path)
+    with open(path) as f:
+        key = f.read().strip()
+    if not key:
+        raise ValueError(f"Secret key file {path} is empty")
+    return key
+
+
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
-    SECRET_KEY: str = secrets.token_urlsafe(32)
+    # Signing key: SECRET_KEY if set, else the key stored in SECRET_KEY_FILE
+    # (created on first use), else a random key per process. The random key
+    # only works with a single process: tokens issued by one worker would be
+    # rejected by the others. See app/serve.py for running several workers.
+    SECRET_KEY_FILE: Optional[str] = None
+    SECRET_KEY: str = ""
+
+    @validator("SECRET_KEY", pre=True, always=True)
+    def resolve_secret_key(cls, v: Optional[str], values: Dict[str, Any]) -> str:
+        if v:
+            return v
+        if values.get("SECRET_KEY_FILE"):
+            return load_or_create_secret_key(values["SECRET_KEY_FILE"])
+        return secrets.token_urlsafe(32)
+
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     ENVIRONMENT: str
 
+    # Authenticated user cache (0 disables it). The TTL bounds how long a change
+    # made by another process can go unnoticed.
+    USER_CACHE_MAXSIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # bcrypt cost. None keeps the passlib default and never rehashes; when set,
+    # hashes with a different cost are rehashed after a successful login.
+    # Use `python -m app.calibrate_hashing` to pick a value for the host.
+    BCRYPT_ROUNDS: Optional[int] = None
+
+    # Password hashing process pool: None = one worker per core, 0 = inline.
+    # Requests beyond MAX_PENDING in-flight hashes get 503 + Retry-After.
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # Largest list accepted by the /users/bulk endpoints (413 beyond it).
+    USERS_BULK_MAX_ITEMS: int = 50
+
+    # Server-Timing header (db time + query count, auth, serialize, total) and
+    # one INFO line per request on the "app.timing" logger.
+    SERVER_TIMING: bool = True
+
+    # Per-route request counts/latency plus pool, cache and hashing stats,
+    # served in the Prometheus text format at GET /metrics.
+    METRICS_ENABLED: bool = True
+
     # BACKEND_CORS_ORIGINS is a JSON-formatted list of origins
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
@@ -25,6 +91,26 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+
+    # Connection pools. Read-only endpoints use a separate pool of
+    # DB_READ_POOL_SIZE connections (0 shares the write pool), optionally
+    # pointed at a replica through DATABASE_READ_URL.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_READ_POOL_SIZE: int = 5
+    DATABASE_READ_URL: Optional[str] = None
+
+    # SQLite pragmas applied to every new connection. WAL lets readers run
+    # while a write is in progress; synchronous=NORMAL skips the fsync per
+    # commit (only a power loss can drop the last commits).
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     
     # Admin user
     FIRST_SUPERUSER: EmailStr
@@ -0,0 +1,216 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.metrics import password_hash_duration_seconds
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    **({"bcrypt__rounds": settings.BCRYPT_ROUNDS} if settings.BCRYPT_ROUNDS else {}),
+)
+
+
+# Executed in the worker processes, so they must be importable top-level functions.
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashBusy(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=503,
+            detail="Too many password hashing requests, try again later",
+            headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+        )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a process pool so CPU-bound hashing does not hold the GIL
+    or the request threadpool, and rejects work beyond `max_pending`
+    in-flight jobs with `PasswordHashBusy` (503 + Retry-After).
+
+    `workers=None` uses one process per core; `workers=0` hashes inline.
+    """
+
+    def __init__(self, workers: Optional[int], max_pending: int):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.rejected = 0
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork the multi-threaded server process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _try_admit(self, count_rejection: bool) -> Optional[float]:
+        with self._lock:
+            if self.in_flight >= self.max_pending:
+                if count_rejection:
+                    self.rejected += 1
+                return None
+            self.in_flight += 1
+        return time.perf_counter()
+
+    def _admit(self) -> float:
+        started = self._try_admit(count_rejection=True)
+        if started is None:
+            raise PasswordHashBusy()
+        return started
+
+    def _release(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        password_hash_duration_seconds.observe(elapsed)
+        with self._lock:
+            self.in_flight -= 1
+            self.count += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def _submit(self, fn: Callable, *args: Any) -> "Future[Any]":
+        return self._submit_admitted(self._admit(), fn, *args)
+
+    def _submit_admitted(self, started: float, fn: Callable, *args: Any) -> "Future[Any]":
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release(started)
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def _run(self, fn: Callable, *args: Any) -> Any:
+        if self.workers == 0:
+            started = self._admit()
+            try:
+                return fn(*args)
+            finally:
+                self._release(started)
+        return self._submit(fn, *args).result()
+
+    async def _run_async(self, fn: Callable, *args: Any) -> Any:
+        if self.workers == 0:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._run, fn, *args)
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    def _submit_batch(
+        self, passwords: Sequence[str], next_index: int, pending: Dict[Any, int], wrap: Callable
+    ) -> int:
+        """
+        Submit the next jobs of a batch while it has fewer than `workers` in
+        flight and the queue has room. Returns the index of the first job not
+        submitted. Raises `PasswordHashBusy` only when none of the batch's
+        jobs could be admitted.
+        """
+        while next_index < len(passwords) and len(pending) < self.workers:
+            started = self._try_admit(count_rejection=not pending)
+            if started is None:
+                if not pending:
+                    raise PasswordHashBusy()
+                break
+            future = self._submit_admitted(started, _hash, passwords[next_index])
+            pending[wrap(future)] = next_index
+            next_index += 1
+        return next_index
+
+    def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """
+        Hash a batch concurrently, keeping at most `workers` of its jobs in
+        flight so a large batch leaves queue room for logins. When the queue
+        is full the batch waits for its own jobs instead of failing.
+        """
+        if self.workers == 0:
+            return [self._run(_hash, password) for password in passwords]
+        hashes: List[str] = [""] * len(passwords)
+        pending: Dict[Any, int] = {}
+        next_index = 0
+        try:
+            while next_index < len(passwords) or pending:
+                next_index = self._submit_batch(passwords, next_index, pending, lambda f: f)
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    hashes[pending.pop(future)] = future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+        return hashes
+
+    async def hash_many_async(self, passwords: Sequence[str]) -> List[str]:
+        """Like `hash_many`, for async endpoints: waits without holding a thread."""
+        if self.workers == 0:
+            return [await self._run_async(_hash, password) for password in passwords]
+        hashes: List[str] = [""] * len(passwords)
+        pending: Dict[Any, int] = {}
+        next_index = 0
+        try:
+            while next_index < len(passwords) or pending:
+                next_index = self._submit_batch(passwords, next_index, pending, asyncio.wrap_future)
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    hashes[pending.pop(future)] = future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+        return hashes
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run_async(_verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "rejected": self.rejected,
+                "count": self.count,
+                "total_seconds": self.total_seconds,
+                "avg_seconds": self.total_seconds / self.count if self.count else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,268 @@
+"""
+Runtime metrics in the Prometheus text format, served by GET /metrics.
+
+Counters and histograms are recorded into per-thread shards, so the hot path
+takes no lock; /metrics merges the shards. The lock is only taken the first
+time a thread records. Values that can simply be read (pool state, cache hit
+ratio) are computed by collectors when /metrics is scraped.
+"""
+from bisect import bisect_left
+from threading import Lock, local
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Labels = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+        + "}"
+    )
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def metric_family(
+    name: str,
+    metric_type: str,
+    help_text: str,
+    label_names: Sequence[str],
+    samples: Iterable[Tuple[Sequence[str], float]],
+) -> List[str]:
+    """Lines for a gauge or counter whose values are computed at scrape time."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines += [
+        f"{name}{format_labels(label_names, labels)} {_format_value(value)}"
+        for labels, value in samples
+    ]
+    return lines
+
+
+class _ShardedMetric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._local = local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._lock = Lock()
+
+    def _shard(self) -> Dict[Labels, Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[Labels, Any] = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _snapshot(self) -> List[Tuple[Labels, Any]]:
+        with self._lock:
+            shards = list(self._shards)
+        return [item for shard in shards for item in list(shard.items())]
+
+    def collect(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+
+class Counter(_ShardedMetric):
+    type_name = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Labels, float]:
+        totals: Dict[Labels, float] = {}
+        for labels, value in self._snapshot():
+            totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def collect(self) -> List[str]:
+        return super().collect() + [
+            f"{self.name}{format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """Shards hold deltas; their sum is the current value."""
+
+    type_name = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_ShardedMetric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # [per-bucket counts (last one is +Inf), sum]
+            state = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def values(self) -> Dict[Labels, Tuple[List[int], float]]:
+        """(cumulative bucket counts, sum) per label set."""
+        merged: Dict[Labels, Tuple[List[int], float]] = {}
+        for labels, (counts, total) in self._snapshot():
+            current = merged.get(labels)
+            if current is None:
+                merged[labels] = (list(counts), total)
+            else:
+                merged[labels] = (
+                    [a + b for a, b in zip(current[0], counts)],
+                    current[1] + total,
+                )
+        for labels, (counts, total) in merged.items():
+            running = 0
+            for index, count in enumerate(counts):
+                running += count
+                counts[index] = running
+        return merged
+
+    def collect(self) -> List[str]:
+        lines = super().collect()
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        names = self.label_names + ("le",)
+        for labels, (counts, total) in sorted(self.values().items()):
+            lines += [
+                f"{self.name}_bucket{format_labels(names, labels + (bound,))} {count}"
+                for bound, count in zip(bounds, counts)
+            ]
+            label_text = format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {total!r}")
+            lines.append(f"{self.name}_count{label_text} {counts[-1]}")
+        return lines
+
+
+M = TypeVar("M", bound=_ShardedMetric)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: List[_ShardedMetric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines += metric.collect()
+        for collector in self._collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+http_requests_total = REGISTRY.register(
+    Counter(
+        "http_requests_total",
+        "Total HTTP requests by method, route and status.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration_seconds = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency in seconds by method and route.",
+        ("method", "route"),
+    )
+)
+http_requests_in_progress = REGISTRY.register(
+    Gauge("http_requests_in_progress", "HTTP requests currently being processed.")
+)
+password_hash_duration_seconds = REGISTRY.register(
+    Histogram(
+        "password_hash_duration_seconds",
+        "Password hash/verify duration in seconds, including time queued for the pool.",
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+
+# Route label for requests no route matched, so 404s can't grow the label set.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_label(scope: Scope) -> str:
+    """
+    The route template (e.g. /api/v1/users/{user_id}) rather than the path.
+    TimedRoute stores it as scope["route_path"]; other routes have no path
+    parameters, so their path is used as is.
+    """
+    route = scope.get("route_path")
+    if route is not None:
+        return route
+    return scope["path"] if "endpoint" in scope else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec()
+            route = route_label(scope)
+            http_request_duration_seconds.observe(
+                perf_counter() - start, (scope["method"], route)
+            )
+            http_requests_total.inc((scope["method"], route, str(status)))
@@ -1,11 +1,9 @@
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, List, Sequence, Union
 
 from jose import jwt
-from passlib.context import CryptContext
 from app.core.config import settings
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.hashing import password_hasher, pwd_context
 
 ALGORITHM = "HS256"
 
@@ -23,7 +21,19 @@ def create_access_token(
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify_async(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+def get_password_hashes(passwords: Sequence[str]) -> List[str]:
+    return password_hasher.hash_many(passwords)
+
+async def get_password_hashes_async(passwords: Sequence[str]) -> List[str]:
+    return await password_hasher.hash_many_async(passwords)
+
+def password_needs_update(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
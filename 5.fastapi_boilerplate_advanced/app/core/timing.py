@@ -0,0 +1,190 @@
+"""
+Per-request timing, reported in a Server-Timing header and one log line.
+
+Each request gets a RequestTimings object in a context variable. SQL time and
+query count come from cursor events on the engines, `auth` from
+get_current_user and `serialize` from TimedRoute. The object is mutable, so
+time recorded in threadpool copies of the context lands in the same place.
+"""
+import asyncio
+import functools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.timing")
+
+
+class RequestTimings:
+    __slots__ = ("start", "durations", "queries", "endpoint_done")
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.queries = 0
+        self.endpoint_done: Optional[float] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def header(self, total: float) -> str:
+        metrics = [
+            f'db;dur={self.durations.get("db", 0.0) * 1000:.2f};desc="{self.queries} queries"'
+        ]
+        metrics += [
+            f"{name};dur={seconds * 1000:.2f}"
+            for name, seconds in self.durations.items()
+            if name != "db"
+        ]
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the block's duration to the current request's `name` metric."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, perf_counter() - start)
+
+
+def install_query_timing(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if _current.get() is not None:
+            conn.info.setdefault("query_start", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        timings = _current.get()
+        starts = conn.info.get("query_start")
+        if timings is None or not starts:
+            return
+        timings.add("db", perf_counter() - starts.pop())
+        timings.queries += 1
+
+
+def _mark_endpoint_done() -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.endpoint_done = perf_counter()
+
+
+class TimedRoute(APIRoute):
+    """
+    Records the time between the endpoint returning and the response being
+    built (response_model validation + JSON encoding) as `serialize`, and
+    leaves the route template in scope["route_path"] for the metrics labels.
+    """
+
+    def matches(self, scope: Any) -> Any:
+        match, child_scope = super().matches(scope)
+        if match != Match.NONE:
+            child_scope["route_path"] = self.path_format
+        return match, child_scope
+
+    def get_route_handler(self) -> Callable:
+        call = self.dependant.call
+        if asyncio.iscoroutinefunction(call):
+
+            @functools.wraps(call)
+            async def endpoint(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await call(*args, **kwargs)
+                finally:
+                    _mark_endpoint_done()
+
+        else:
+
+            @functools.wraps(call)
+            def endpoint(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return call(*args, **kwargs)
+                finally:
+                    _mark_endpoint_done()
+
+        self.dependant.call = endpoint
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Any) -> Any:
+            response = await handler(request)
+            timings = _current.get()
+            if timings is not None and timings.endpoint_done is not None:
+                timings.add("serialize", perf_counter() - timings.endpoint_done)
+            return response
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    The header's `total` stops when the response headers are sent; the log
+    line's `total_ms` stops when the body is done.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = timings.header(perf_counter() - timings.start)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if logger.isEnabledFor(logging.INFO):
+                durations = timings.durations
+                logger.info(
+                    "method=%s path=%s status=%d total_ms=%.2f db_ms=%.2f queries=%d "
+                    "auth_ms=%.2f serialize_ms=%.2f",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    (perf_counter() - timings.start) * 1000,
+                    durations.get("db", 0.0) * 1000,
+                    timings.queries,
+                    durations.get("auth", 0.0) * 1000,
+                    durations.get("serialize", 0.0) * 1000,
+                )
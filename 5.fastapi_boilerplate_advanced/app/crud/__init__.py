@@ -0,0 +1 @@
+from .crud_user import user
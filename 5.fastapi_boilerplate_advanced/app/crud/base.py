@@ -1,16 +1,75 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, inspect, insert, update
 from sqlalchemy.orm import Session
 
 from app.db.base_class import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
+T = TypeVar("T")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+class ColumnValueError(ValueError):
+    """A value rejected by `UpdatableColumn.validate`; `field` names the column."""
+
+    def __init__(self, field: str, message: str):
+        super().__init__(message)
+        self.field = field
+
+
+class UpdatableColumn(NamedTuple):
+    python_type: Optional[type]  # None when the column type has no Python equivalent
+    nullable: bool
+
+    def validate(self, field: str, value: Any) -> None:
+        if value is None:
+            if not self.nullable:
+                raise ColumnValueError(field, f"{field} cannot be null")
+        elif self.python_type is not None and not isinstance(value, self.python_type):
+            raise ColumnValueError(
+                field,
+                f"{field} expects {self.python_type.__name__}, got {type(value).__name__}",
+            )
+
+
+@lru_cache(maxsize=None)
+def updatable_columns(model: Type[Base]) -> Mapping[str, UpdatableColumn]:
+    """
+    Attribute name -> column info for every non-primary-key column of
+    `model`, built once per model class.
+    """
+    columns: Dict[str, UpdatableColumn] = {}
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        if column.primary_key:
+            continue
+        try:
+            python_type: Optional[type] = column.type.python_type
+        except NotImplementedError:
+            python_type = None
+        columns[attr.key] = UpdatableColumn(python_type, bool(column.nullable))
+    return columns
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
@@ -31,9 +90,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    def _changed_values(
+        self, db_obj: ModelType, update_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Entries of `update_data` that differ from the object's current values.
+        Keys that are not updatable columns are ignored; values are checked
+        against the column's type and nullability.
+        """
+        columns = updatable_columns(self.model)
+        changes = {}
+        for field, value in update_data.items():
+            column = columns.get(field)
+            if column is None:
+                continue
+            column.validate(field, value)
+            if getattr(db_obj, field) != value:
+                changes[field] = value
+        return changes
+
     def update(
         self,
         db: Session,
@@ -41,21 +118,124 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
+        """
+        Write only the columns whose value actually changes; when nothing
+        changes the UPDATE and the commit are skipped.
+        """
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        return self._apply_changes(db, db_obj, self._changed_values(db_obj, update_data))
+
+    def _apply_changes(
+        self, db: Session, db_obj: ModelType, changes: Dict[str, Any]
+    ) -> ModelType:
+        """Write `changes` from `_changed_values`; no UPDATE or commit when empty."""
+        if not changes:
+            return db_obj
+        for field, value in changes.items():
+            setattr(db_obj, field, value)
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> ModelType:
-        obj = db.query(self.model).get(id)
+        obj = db.get(self.model, id)
         db.delete(obj)
         db.commit()
         return obj
+
+    # Bulk operations: one transaction per call and one statement per batch,
+    # without loading or refreshing ORM objects. Subclasses customise the
+    # column values through `_create_values` / `_update_values`.
+
+    bulk_batch_size = 1000
+
+    def _create_values(self, obj_in: CreateSchemaType) -> Dict[str, Any]:
+        """Column values for one row of `create_multi`."""
+        return jsonable_encoder(obj_in)
+
+    def _update_values(
+        self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Column values for one row of `update_multi`. Unknown keys are dropped;
+        values are checked against the column's type and nullability.
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.dict(exclude_unset=True)
+        columns = updatable_columns(self.model)
+        values = {}
+        for field, value in update_data.items():
+            column = columns.get(field)
+            if column is None:
+                continue
+            column.validate(field, value)
+            values[field] = value
+        return values
+
+    @staticmethod
+    def _batches(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+        for start in range(0, len(items), size):
+            yield items[start : start + size]
+
+    def create_multi(
+        self, db: Session, *, objs_in: Sequence[CreateSchemaType]
+    ) -> int:
+        """
+        Insert many rows with one executemany INSERT per batch and a single
+        commit. Returns the number of inserted rows.
+        """
+        return self._insert_multi(db, [self._create_values(obj_in) for obj_in in objs_in])
+
+    def _insert_multi(self, db: Session, rows: Sequence[Dict[str, Any]]) -> int:
+        for batch in self._batches(rows, self.bulk_batch_size):
+            db.execute(insert(self.model), batch)
+        db.commit()
+        return len(rows)
+
+    def update_multi(
+        self,
+        db: Session,
+        *,
+        objs_in: Mapping[Any, Union[UpdateSchemaType, Dict[str, Any]]],
+    ) -> int:
+        """
+        Apply per-row updates keyed by id in a single transaction. Rows that
+        change the same set of columns share one executemany UPDATE per batch.
+        Returns the number of matched rows.
+        """
+        groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+        for id, obj_in in objs_in.items():
+            values = self._update_values(obj_in)
+            if values:
+                row = {f"v_{field}": value for field, value in values.items()}
+                groups.setdefault(frozenset(values), []).append({"v_id": id, **row})
+        table = self.model.__table__
+        updated = 0
+        for fields, rows in groups.items():
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("v_id"))
+                .values({field: bindparam(f"v_{field}") for field in fields})
+            )
+            for batch in self._batches(rows, self.bulk_batch_size):
+                updated += db.execute(stmt, batch).rowcount
+        db.commit()
+        return updated
+
+    def remove_multi(self, db: Session, *, ids: Sequence[Any]) -> int:
+        """
+        Delete many rows with one `DELETE ... WHERE id IN (...)` per batch and
+        a single commit. Returns the number of deleted rows.
+        """
+        ids = list(ids)
+        deleted = 0
+        for batch in self._batches(ids, self.bulk_batch_size):
+            stmt = delete(self.model).where(self.model.id.in_(batch))
+            deleted += db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+        db.commit()
+        return deleted
@@ -1,14 +1,46 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy.orm import Session
+from fastapi import BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import user_cache
+from app.core.security import (
+    get_password_hash,
+    get_password_hashes,
+    get_password_hashes_async,
+    password_needs_update,
+    verify_password,
+    verify_password_async,
+)
 from app.crud.base import CRUDBase
+from app.db.session import SessionLocal
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+    def get_cached(self, db: Session, id: Any) -> Optional[User]:
+        """
+        Like `get`, but serves repeated lookups from `user_cache`. Cached
+        snapshots are detached and shared, so they are merged into `db`
+        with load=False (no SELECT) instead of being attached directly.
+        """
+        snapshot = user_cache.get(id)
+        if snapshot is not None:
+            return db.merge(snapshot, load=False)
+        db_obj = self.get(db, id=id)
+        if db_obj is not None:
+            user_cache.set(id, self._snapshot(db_obj))
+        return db_obj
+
+    @staticmethod
+    def _snapshot(db_obj: User) -> User:
+        columns = User.__table__.columns.keys()
+        snapshot = User(**{column: getattr(db_obj, column) for column in columns})
+        make_transient_to_detached(snapshot)
+        return snapshot
+
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
         return db.query(User).filter(User.email == email).first()
 
@@ -21,30 +53,186 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         )
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    # populate_existing: the bulk writes bypass the ORM, so users already
+    # loaded in the session (e.g. current_user) are overwritten with the rows read
+    def get_multi_by_email(self, db: Session, *, emails: Sequence[str]) -> List[User]:
+        return db.query(User).filter(User.email.in_(emails)).populate_existing().all()
+
+    def get_multi_by_id(self, db: Session, *, ids: Sequence[Any]) -> List[User]:
+        return db.query(User).filter(User.id.in_(ids)).populate_existing().all()
+
+    def _create_values(
+        self, obj_in: UserCreate, hashed_password: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return {
+            "email": obj_in.email,
+            "hashed_password": hashed_password or get_password_hash(obj_in.password),
+            "full_name": obj_in.full_name,
+            "is_active": obj_in.is_active,
+            "is_superuser": obj_in.is_superuser,
+        }
+
+    def _update_values(self, obj_in: Union[UserUpdate, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.dict(exclude_unset=True)
+        password = update_data.pop("password", None)
+        if password:
+            update_data["hashed_password"] = get_password_hash(password)
+        return super()._update_values(update_data)
+
+    def create_multi(self, db: Session, *, objs_in: Sequence[UserCreate]) -> int:
+        # Hash all passwords on the pool together instead of one row at a time
+        hashes = get_password_hashes([obj_in.password for obj_in in objs_in])
+        return self._insert_users(db, objs_in, hashes)
+
+    async def create_multi_async(self, db: Session, *, objs_in: Sequence[UserCreate]) -> int:
+        """
+        Like `create_multi`, for async endpoints: the hashes are awaited
+        without holding a thread, then the INSERTs run in the threadpool.
+        """
+        hashes = await get_password_hashes_async([obj_in.password for obj_in in objs_in])
+        return await run_in_threadpool(self._insert_users, db, objs_in, hashes)
+
+    def _insert_users(
+        self, db: Session, objs_in: Sequence[UserCreate], hashes: Sequence[str]
+    ) -> int:
+        rows = [
+            self._create_values(obj_in, hashed)
+            for obj_in, hashed in zip(objs_in, hashes)
+        ]
+        return self._insert_multi(db, rows)
+
+    @staticmethod
+    def _split_passwords(
+        objs_in: Mapping[Any, Union[UserUpdate, Dict[str, Any]]]
+    ) -> Tuple[Dict[Any, Dict[str, Any]], List[Any], List[str]]:
+        """
+        Update data per id with the new passwords taken out so they can be
+        hashed as one batch: (update data, ids with a password, passwords).
+        """
+        update_data = {
+            id: dict(obj_in) if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+            for id, obj_in in objs_in.items()
+        }
+        ids = [id for id, data in update_data.items() if data.get("password")]
+        return update_data, ids, [update_data[id].pop("password") for id in ids]
+
+    def update_multi(
+        self, db: Session, *, objs_in: Mapping[Any, Union[UserUpdate, Dict[str, Any]]]
+    ) -> int:
+        update_data, ids, passwords = self._split_passwords(objs_in)
+        hashes = get_password_hashes(passwords)
+        return self._update_users(db, update_data, dict(zip(ids, hashes)))
+
+    async def update_multi_async(
+        self, db: Session, *, objs_in: Mapping[Any, Union[UserUpdate, Dict[str, Any]]]
+    ) -> int:
+        """Like `update_multi`, for async endpoints (see `create_multi_async`)."""
+        update_data, ids, passwords = self._split_passwords(objs_in)
+        hashes = await get_password_hashes_async(passwords)
+        return await run_in_threadpool(
+            self._update_users, db, update_data, dict(zip(ids, hashes))
+        )
+
+    def _update_users(
+        self, db: Session, update_data: Dict[Any, Dict[str, Any]], hashes: Dict[Any, str]
+    ) -> int:
+        for id, hashed in hashes.items():
+            update_data[id]["hashed_password"] = hashed
+        updated = super().update_multi(db, objs_in=update_data)
+        for id in update_data:
+            user_cache.invalidate(id)
+        return updated
+
+    def remove_multi(self, db: Session, *, ids: Sequence[Any]) -> int:
+        deleted = super().remove_multi(db, ids=ids)
+        for id in ids:
+            user_cache.invalidate(id)
+        return deleted
+
     def update(
         self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
     ) -> User:
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        if update_data.get("password"):
-            hashed_password = get_password_hash(update_data["password"])
-            del update_data["password"]
-            update_data["hashed_password"] = hashed_password
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        password = update_data.pop("password", None)
+        changes = self._changed_values(db_obj, update_data)
+        # Only hash when a new password was actually supplied
+        if password:
+            changes["hashed_password"] = get_password_hash(password)
+        if not changes:
+            return db_obj
+        db_obj = self._apply_changes(db, db_obj, changes)
+        user_cache.invalidate(db_obj.id)
+        return db_obj
 
-    def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
+    def authenticate(
+        self,
+        db: Session,
+        *,
+        email: str,
+        password: str,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Optional[User]:
         user = self.get_by_email(db, email=email)
         if not user:
             return None
         if not verify_password(password, user.hashed_password):
             return None
+        if background_tasks is not None and password_needs_update(user.hashed_password):
+            background_tasks.add_task(
+                self.rehash_password, user.id, user.hashed_password, password
+            )
         return user
 
+    async def authenticate_async(
+        self,
+        db: Session,
+        *,
+        email: str,
+        password: str,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Optional[User]:
+        """
+        Like `authenticate`, for async endpoints: only the lookup runs in the
+        threadpool and the bcrypt check is awaited without holding a thread,
+        so a login burst is shed with 503 by the hasher instead of filling
+        the threadpool and stalling the sync endpoints.
+        """
+        user = await run_in_threadpool(self.get_by_email, db, email=email)
+        if not user:
+            return None
+        if not await verify_password_async(password, user.hashed_password):
+            return None
+        if background_tasks is not None and password_needs_update(user.hashed_password):
+            background_tasks.add_task(
+                self.rehash_password, user.id, user.hashed_password, password
+            )
+        return user
+
+    def rehash_password(self, user_id: Any, old_hash: str, password: str) -> None:
+        """
+        Re-hash with the current settings after login. Runs as a background
+        task in its own session; the hash is only replaced if it has not
+        changed in the meantime.
+        """
+        new_hash = get_password_hash(password)
+        db = SessionLocal()
+        try:
+            db.query(User).filter(
+                User.id == user_id, User.hashed_password == old_hash
+            ).update({User.hashed_password: new_hash}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        user_cache.invalidate(user_id)
+
     def is_active(self, user: User) -> bool:
         return user.is_active
 
@@ -0,0 +1,79 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings, settings as default_settings
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def is_sqlite_memory(url: str) -> bool:
+    return is_sqlite(url) and make_url(url).database in (None, "", ":memory:")
+
+
+def sqlite_pragmas(settings: Settings, read_only: bool = False) -> List[str]:
+    pragmas = [f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}"]
+    if settings.SQLITE_JOURNAL_MODE:
+        pragmas.append(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    pragmas += [
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        # A negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    return pragmas
+
+
+def engine_options(
+    url: str, settings: Settings, *, read_only: bool = False
+) -> Dict[str, Any]:
+    """
+    Per-dialect create_engine() arguments. File-backed SQLite gets a
+    QueuePool (SQLAlchemy 1.4 defaults to NullPool, reconnecting and
+    re-running the pragmas on every checkout); in-memory SQLite keeps the
+    dialect default.
+    """
+    options: Dict[str, Any] = {}
+    if is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+        if is_sqlite_memory(url):
+            return options
+        options["poolclass"] = QueuePool
+    else:
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
+        options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+    options["pool_size"] = settings.DB_READ_POOL_SIZE if read_only else settings.DB_POOL_SIZE
+    options["max_overflow"] = settings.DB_MAX_OVERFLOW
+    options["pool_timeout"] = settings.DB_POOL_TIMEOUT_SECONDS
+    return options
+
+
+def make_engine(
+    url: str, settings: Settings = default_settings, *, read_only: bool = False
+) -> Engine:
+    engine = create_engine(url, **engine_options(url, settings, read_only=read_only))
+    if is_sqlite(url):
+        pragmas = sqlite_pragmas(settings, read_only=read_only)
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+    return engine
+
+
+def read_pool_enabled(settings: Settings = default_settings) -> bool:
+    # Each connection to an in-memory SQLite database is a separate database
+    url = settings.DATABASE_READ_URL or settings.DATABASE_URL
+    return settings.DB_READ_POOL_SIZE > 0 and not is_sqlite_memory(url)
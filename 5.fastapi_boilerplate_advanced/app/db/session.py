@@ -1,10 +1,29 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.timing import install_query_timing
+from app.db.engine import make_engine, read_pool_enabled
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = make_engine(settings.DATABASE_URL)
+# Objects stay loaded after commit: primary keys and column defaults are
+# filled in during flush, so returning a created/updated object to the
+# client needs no extra SELECT.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
+
+# Read-only endpoints use their own pool so they don't queue behind writers
+if read_pool_enabled():
+    read_engine = make_engine(
+        settings.DATABASE_READ_URL or settings.DATABASE_URL, read_only=True
+    )
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+if settings.SERVER_TIMING:
+    for _engine in {engine, read_engine}:
+        install_query_timing(_engine)
 
 def get_db():
     db = SessionLocal()
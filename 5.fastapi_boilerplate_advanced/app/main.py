@@ -1,8 +1,12 @@
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.api.metrics import router as metrics_router
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.metrics import MetricsMiddleware
+from app.core.timing import ServerTimingMiddleware
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -19,7 +23,17 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Added last so it wraps everything else, CORS included
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
+# Unversioned, at Prometheus' default scrape path
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 @app.get("/")
 def root():
@@ -28,3 +42,8 @@ def root():
         "documentation": "/docs",
         "redoc": "/redoc"
     }
+
+
+@app.on_event("shutdown")
+def shutdown_password_hasher() -> None:
+    password_hasher.shutdown()
@@ -0,0 +1 @@
+from .user import User
@@ -0,0 +1,2 @@
+from .token import Token, TokenPayload
+from .user import User, UserBulkUpdate, UserCreate, UserInDB, UserUpdate
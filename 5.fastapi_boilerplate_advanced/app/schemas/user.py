@@ -19,6 +19,10 @@ class UserUpdate(UserBase):
     password: Optional[str] = None
 
 
+class UserBulkUpdate(UserUpdate):
+    id: int
+
+
 class UserInDBBase(UserBase):
     id: Optional[int] = None
 
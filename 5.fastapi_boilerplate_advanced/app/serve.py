@@ -0,0 +1,39 @@
+"""
+Run the app with several uvicorn workers:
+
+    python -m app.serve --workers 4 [--host 0.0.0.0] [--port 8000]
+
+Each worker loads its own Settings, so without a configured key every worker
+would sign tokens with a different random key. The signing key is resolved
+once here (SECRET_KEY, then SECRET_KEY_FILE, then random) and passed to the
+workers through the environment.
+
+The user cache and /metrics stay per worker; a change made through another
+worker shows up once USER_CACHE_TTL_SECONDS has passed.
+"""
+import argparse
+import os
+
+import uvicorn
+
+from app.core.config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the app with several workers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    os.environ["SECRET_KEY"] = settings.SECRET_KEY
+    # Split the cores between the workers' hashing pools instead of giving
+    # each worker one process per core.
+    if args.workers > 1 and settings.PASSWORD_HASH_WORKERS is None:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(max(1, (os.cpu_count() or 1) // args.workers))
+
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,6 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import emails
-from emails.template import JinjaTemplate
 from jose import jwt
 
 from app.core.config import settings
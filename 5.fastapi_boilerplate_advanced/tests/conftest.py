@@ -0,0 +1,47 @@
+# Shared pytest fixtures. The app is called through TestClient without a
+# running server, against a temporary SQLite file instead of sql_app.db.
+import os
+import tempfile
+
+# Test settings must be in place before the app is imported
+_db_dir = tempfile.mkdtemp(prefix="fastapi_boilerplate_advanced_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ.setdefault("PROJECT_NAME", "FastAPI Advanced Boilerplate")
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("FIRST_SUPERUSER", "admin@example.com")
+os.environ.setdefault("FIRST_SUPERUSER_PASSWORD", "admin123")
+# Cheapest bcrypt cost to keep the suite fast
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from typing import Dict, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.initial_data import init
+from app.main import app
+from tests.utils import get_token_headers
+
+
+@pytest.fixture(scope="session")
+def db() -> Generator:
+    init()
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def client(db: Session) -> Generator:
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def superuser_token_headers(client: TestClient) -> Dict[str, str]:
+    return get_token_headers(
+        client, settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD
+    )
@@ -0,0 +1,218 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.hashing import PasswordHashBusy, password_hasher
+from app.db.session import engine
+from app.schemas.user import UserCreate
+from tests.utils import create_user, get_token_headers, random_email
+
+USERS = f"{settings.API_V1_STR}/users"
+
+
+@pytest.fixture
+def commits() -> List[int]:
+    commits: List[int] = []
+
+    def on_commit(conn) -> None:
+        commits.append(1)
+
+    event.listen(engine, "commit", on_commit)
+    yield commits
+    event.remove(engine, "commit", on_commit)
+
+
+def test_create_users_bulk(
+    client: TestClient, superuser_token_headers: Dict[str, str], commits: List[int]
+) -> None:
+    payload = [{"email": random_email(), "password": f"secret{i}"} for i in range(5)]
+    response = client.post(f"{USERS}/bulk", headers=superuser_token_headers, json=payload)
+    assert response.status_code == 200
+    # Returned in request order, written with one commit
+    assert [user["email"] for user in response.json()] == [row["email"] for row in payload]
+    assert len(commits) == 1
+    get_token_headers(client, payload[3]["email"], "secret3")
+
+
+def test_create_users_bulk_is_one_transaction(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # One INSERT per row; the second row fails on the unique email index
+    monkeypatch.setattr(crud.user, "bulk_batch_size", 1)
+    first = random_email()
+    users_in = [
+        UserCreate(email=first, password="secret"),
+        UserCreate(email=settings.FIRST_SUPERUSER, password="secret"),
+    ]
+    with pytest.raises(IntegrityError):
+        crud.user.create_multi(db, objs_in=users_in)
+    db.rollback()
+    assert crud.user.get_by_email(db, email=first) is None
+
+
+def test_create_users_bulk_rejects_duplicate_emails(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    email = random_email()
+    response = client.post(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"email": email, "password": "a"}, {"email": email, "password": "b"}],
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Duplicate emails in request"
+
+
+def test_create_users_bulk_rejects_existing_emails(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    new = random_email()
+    response = client.post(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"email": new, "password": "a"}, {"email": settings.FIRST_SUPERUSER, "password": "b"}],
+    )
+    assert response.status_code == 400
+    assert settings.FIRST_SUPERUSER in response.json()["detail"]
+    assert crud.user.get_by_email(db, email=new) is None
+
+
+def test_bulk_endpoints_cap_request_size(
+    client: TestClient, superuser_token_headers: Dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "USERS_BULK_MAX_ITEMS", 2)
+    payload = [{"email": random_email(), "password": "a"} for _ in range(3)]
+    response = client.post(f"{USERS}/bulk", headers=superuser_token_headers, json=payload)
+    assert response.status_code == 413
+    response = client.put(
+        f"{USERS}/bulk", headers=superuser_token_headers, json=[{"id": i} for i in (1, 2, 3)]
+    )
+    assert response.status_code == 413
+    response = client.delete(
+        f"{USERS}/bulk", headers=superuser_token_headers, params={"ids": [1, 2, 3]}
+    )
+    assert response.status_code == 413
+
+
+def test_update_users_bulk(
+    client: TestClient, superuser_token_headers: Dict[str, str], commits: List[int]
+) -> None:
+    users = [create_user(client, superuser_token_headers) for _ in range(3)]
+    commits.clear()
+    payload = [
+        {"id": users[2]["id"], "full_name": "Third"},
+        {"id": users[0]["id"], "is_active": False},
+        {"id": users[1]["id"], "password": "changed"},
+    ]
+    response = client.put(f"{USERS}/bulk", headers=superuser_token_headers, json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert [user["id"] for user in body] == [row["id"] for row in payload]
+    assert body[0]["full_name"] == "Third"
+    assert body[1]["is_active"] is False
+    assert len(commits) == 1
+    get_token_headers(client, users[1]["email"], "changed")
+
+
+def test_update_users_bulk_missing_ids_is_404(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    response = client.put(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"id": user["id"], "full_name": "Changed"}, {"id": 999999}],
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Users not found: 999999"
+    db.expire_all()
+    assert crud.user.get(db, id=user["id"]).full_name is None
+
+
+def test_delete_users_bulk(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    users = [create_user(client, superuser_token_headers) for _ in range(2)]
+    ids = [user["id"] for user in users]
+    response = client.delete(f"{USERS}/bulk", headers=superuser_token_headers, params={"ids": ids})
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 2}
+    assert crud.user.get_multi_by_id(db, ids=ids) == []
+
+
+def test_delete_users_bulk_rejects_self_delete(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    superuser = crud.user.get_by_email(db, email=settings.FIRST_SUPERUSER)
+    other = create_user(client, superuser_token_headers)
+    response = client.delete(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        params={"ids": [other["id"], superuser.id]},
+    )
+    assert response.status_code == 400
+    assert crud.user.get(db, id=other["id"]) is not None
+
+
+def test_bulk_changes_invalidate_user_cache(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    headers = get_token_headers(client, user["email"], "secret123")
+    # Caches the authenticated user
+    assert client.get(f"{USERS}/me", headers=headers).json()["full_name"] is None
+
+    client.put(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"id": user["id"], "full_name": "Bulk"}],
+    )
+    assert client.get(f"{USERS}/me", headers=headers).json()["full_name"] == "Bulk"
+
+    client.delete(f"{USERS}/bulk", headers=superuser_token_headers, params={"ids": [user["id"]]})
+    assert client.get(f"{USERS}/me", headers=headers).status_code == 404
+
+
+def test_hash_many_keeps_room_for_other_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A batch larger than the queue limit still completes: it never holds
+    # more than `workers` slots and waits for its own jobs when the queue is full
+    monkeypatch.setattr(password_hasher, "max_pending", password_hasher.workers + 1)
+    passwords = [f"secret{i}" for i in range(password_hasher.workers * 3 + 2)]
+    hashes = password_hasher.hash_many(passwords)
+    assert all(password_hasher.verify(p, h) for p, h in zip(passwords, hashes))
+
+    loop = asyncio.new_event_loop()
+    try:
+        hashes = loop.run_until_complete(password_hasher.hash_many_async(passwords))
+    finally:
+        loop.close()
+    assert all(password_hasher.verify(p, h) for p, h in zip(passwords, hashes))
+    assert password_hasher.stats()["in_flight"] == 0
+
+
+def test_hash_many_is_rejected_when_queue_is_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    with pytest.raises(PasswordHashBusy):
+        password_hasher.hash_many(["secret"] * 3)
+    assert password_hasher.stats()["in_flight"] == 0
+
+
+def test_update_users_bulk_returns_fresh_rows_for_loaded_users(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    # The superuser is already loaded in the request's session (current_user)
+    superuser = crud.user.get_by_email(db, email=settings.FIRST_SUPERUSER)
+    response = client.put(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"id": superuser.id, "full_name": "Admin"}],
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["full_name"] == "Admin"
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.models.user import User
+from tests.utils import create_user, get_token_headers
+
+
+def test_login(client: TestClient) -> None:
+    headers = get_token_headers(
+        client, settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD
+    )
+    response = client.post(f"{settings.API_V1_STR}/login/test-token", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == settings.FIRST_SUPERUSER
+
+
+def test_login_wrong_password(client: TestClient) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": settings.FIRST_SUPERUSER, "password": "wrong"},
+    )
+    assert response.status_code == 400
+    assert password_hasher.stats()["in_flight"] == 0
+
+
+def _slow_login_user(client: TestClient, headers: Dict[str, str], db: Session) -> Dict:
+    # A hash that takes a few hundred ms to check keeps logins in flight
+    user = create_user(client, headers)
+    slow_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=12).hash("secret123")
+    db.query(User).filter(User.id == user["id"]).update({User.hashed_password: slow_hash})
+    db.commit()
+    return user
+
+
+def test_concurrent_logins_are_shed_with_503(
+    client: TestClient,
+    superuser_token_headers: Dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user = _slow_login_user(client, superuser_token_headers, db)
+    # Keep the post-login rehash from taking queue slots
+    monkeypatch.setattr("app.crud.crud_user.password_needs_update", lambda hashed_password: False)
+    monkeypatch.setattr(password_hasher, "max_pending", 2)
+
+    async def burst() -> List[httpx.Response]:
+        # 8 logins and a sync endpoint, concurrently on one event loop
+        async with httpx.AsyncClient(app=client.app, base_url="http://test") as c:
+            form = {"username": user["email"], "password": "secret123"}
+            logins = [
+                c.post(f"{settings.API_V1_STR}/login/access-token", data=form)
+                for _ in range(8)
+            ]
+            me = c.get(f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers)
+            return await asyncio.gather(*logins, me)
+
+    # asyncio.run would clear the current loop the session TestClient relies on
+    loop = asyncio.new_event_loop()
+    try:
+        *logins, me = loop.run_until_complete(burst())
+    finally:
+        loop.close()
+    statuses = sorted(response.status_code for response in logins)
+    # Logins over the limit are rejected right away with 503 + Retry-After
+    assert statuses.count(200) >= 1
+    assert statuses.count(503) >= 1
+    assert set(statuses) <= {200, 503}
+    for response in logins:
+        if response.status_code == 503:
+            assert response.headers["retry-after"] == str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)
+    # Sync endpoints keep being served while logins wait on the pool
+    assert me.status_code == 200
+    assert password_hasher.stats()["in_flight"] == 0
+
+
+def test_pending_logins_hold_no_threads(
+    client: TestClient,
+    superuser_token_headers: Dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # More logins than threads, all admitted (max_pending stays at its default)
+    user = _slow_login_user(client, superuser_token_headers, db)
+    monkeypatch.setattr("app.crud.crud_user.password_needs_update", lambda hashed_password: False)
+    finished: Dict[str, float] = {}
+
+    async def timed(name: str, request) -> httpx.Response:
+        response = await request
+        finished[name] = time.perf_counter()
+        return response
+
+    async def burst() -> List[httpx.Response]:
+        async with httpx.AsyncClient(app=client.app, base_url="http://test") as c:
+            form = {"username": user["email"], "password": "secret123"}
+            logins = [
+                timed(f"login{i}", c.post(f"{settings.API_V1_STR}/login/access-token", data=form))
+                for i in range(8)
+            ]
+            me = timed("me", c.get(f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers))
+            return await asyncio.gather(*logins, me)
+
+    loop = asyncio.new_event_loop()
+    # Sync endpoints and dependencies run on the loop's default executor
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+    try:
+        responses = loop.run_until_complete(burst())
+    finally:
+        loop.close()
+    assert all(response.status_code == 200 for response in responses)
+    # /users/me does not wait for a thread held by a pending login
+    assert finished["me"] < min(t for name, t in finished.items() if name != "me")
+    assert password_hasher.stats()["in_flight"] == 0
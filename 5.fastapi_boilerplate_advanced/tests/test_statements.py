@@ -0,0 +1,75 @@
+# Writes should be one INSERT/UPDATE (+ commit): no refresh after the commit
+# and no SELECT re-reading expired attributes. The authenticated user is
+# cached by the first request, so later requests don't look it up.
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from tests.utils import count_statements, create_user, get_token_headers, random_email
+
+USERS = f"{settings.API_V1_STR}/users"
+
+
+def verbs(statements: List[str]) -> List[str]:
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+def test_create_user_statement_count(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    client.get(f"{USERS}/me", headers=superuser_token_headers)
+    with count_statements() as statements:
+        response = client.post(
+            f"{USERS}/",
+            headers=superuser_token_headers,
+            json={"email": random_email(), "password": "secret123"},
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["id"]
+    # Duplicate email check + INSERT
+    assert verbs(statements) == ["SELECT", "INSERT"]
+
+
+def test_update_user_statement_count(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    with count_statements() as statements:
+        response = client.put(
+            f"{USERS}/{user['id']}", headers=superuser_token_headers, json={"full_name": "Counted"}
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["full_name"] == "Counted"
+    # Lookup + UPDATE of the changed column only
+    assert verbs(statements) == ["SELECT", "UPDATE"]
+    assert statements[1].startswith("UPDATE user SET full_name=? WHERE")
+
+    with count_statements() as statements:
+        response = client.put(
+            f"{USERS}/{user['id']}", headers=superuser_token_headers, json={"full_name": "Counted"}
+        )
+    assert response.status_code == 200, response.text
+    # Nothing changed: no UPDATE
+    assert verbs(statements) == ["SELECT"]
+
+
+def test_update_user_me_statement_count(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    headers = get_token_headers(client, user["email"], "secret123")
+    client.get(f"{USERS}/me", headers=headers)
+
+    with count_statements() as statements:
+        response = client.put(f"{USERS}/me", headers=headers, json={"full_name": "Me"})
+    assert response.status_code == 200, response.text
+    assert response.json()["full_name"] == "Me"
+    assert verbs(statements) == ["UPDATE"]
+
+    # The update invalidated the cached user; warm it again
+    client.get(f"{USERS}/me", headers=headers)
+    with count_statements() as statements:
+        response = client.put(f"{USERS}/me", headers=headers, json={"full_name": "Me"})
+    assert response.status_code == 200, response.text
+    assert verbs(statements) == []
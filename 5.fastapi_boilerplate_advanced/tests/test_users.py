@@ -0,0 +1,55 @@
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from tests.utils import create_user
+
+USERS = f"{settings.API_V1_STR}/users"
+
+
+def test_update_user(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    response = client.put(
+        f"{USERS}/{user['id']}", headers=superuser_token_headers, json={"full_name": "Renamed"}
+    )
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed"
+    db.expire_all()
+    assert crud.user.get(db, id=user["id"]).full_name == "Renamed"
+
+
+def test_update_user_null_for_not_null_column_is_422(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    user = create_user(client, superuser_token_headers)
+    response = client.put(
+        f"{USERS}/{user['id']}", headers=superuser_token_headers, json={"email": None}
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "email"]
+    assert error["msg"] == "email cannot be null"
+    db.expire_all()
+    assert crud.user.get(db, id=user["id"]).email == user["email"]
+
+
+def test_bulk_update_null_for_not_null_column_is_422(
+    client: TestClient, superuser_token_headers: Dict[str, str], db: Session
+) -> None:
+    first = create_user(client, superuser_token_headers)
+    second = create_user(client, superuser_token_headers)
+    response = client.put(
+        f"{USERS}/bulk",
+        headers=superuser_token_headers,
+        json=[{"id": first["id"], "full_name": "Valid"}, {"id": second["id"], "email": None}],
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "email"]
+    # Every row is checked before any UPDATE runs
+    db.expire_all()
+    assert crud.user.get(db, id=first["id"]).full_name is None
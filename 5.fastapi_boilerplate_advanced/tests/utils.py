@@ -0,0 +1,53 @@
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.db.session import engine, read_engine
+
+
+def random_email() -> str:
+    return f"{uuid.uuid4().hex[:12]}@example.com"
+
+
+def get_token_headers(client: TestClient, email: str, password: str) -> Dict[str, str]:
+    response = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": email, "password": password},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def create_user(
+    client: TestClient, headers: Dict[str, str], password: str = "secret123", **fields: Any
+) -> Dict[str, Any]:
+    response = client.post(
+        f"{settings.API_V1_STR}/users/",
+        headers=headers,
+        json={"email": random_email(), "password": password, **fields},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """Collect the SQL statements sent to the database inside the block."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # read_engine is engine itself when the read pool is disabled
+    engines = {engine, read_engine}
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,158 @@
+# 예제 애플리케이션(0 ~ 5) 벤치마크 스위트
+# 각 애플리케이션을 별도 프로세스에서 서버 없이 ASGI로 직접 호출하며 (미리 채운 로컬 데이터 사용)
+# 엔드포인트별 처리량과 p50/p95/p99 지연 시간을 측정하고 JSON 기준값(baseline)과 비교합니다.
+# 처리량이 기준값보다 threshold 비율 이상 낮아지거나 p95가 threshold 비율 이상 높아지면
+# 회귀로 보고하고 종료 코드 1로 끝납니다.
+#
+# 실행 (저장소 루트에서):
+#   python -m asgi_benchmarks                     # 모든 애플리케이션 측정 후 기준값과 비교
+#   python -m asgi_benchmarks 1 3 --threshold 0.2 # 일부 애플리케이션만, 20% 회귀 기준
+#   python -m asgi_benchmarks --update-baseline   # 측정 결과를 새 기준값으로 저장
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from asgi_benchmarks.scenarios import SCENARIOS
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def run_app(key: str, config: Dict[str, int]) -> Dict[str, Any]:
+    """애플리케이션 하나를 작업 프로세스에서 측정합니다.
+
+    Raises:
+        RuntimeError: 애플리케이션을 불러오지 못했거나 요청이 실패한 경우
+    """
+    scenario = SCENARIOS[key]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    with tempfile.TemporaryDirectory(prefix="asgi_benchmarks_") as tmp:
+        output = Path(tmp) / "result.json"
+        command = [sys.executable, "-m", "asgi_benchmarks.worker", key, "--output", str(output)]
+        for option, value in config.items():
+            command += [f"--{option}", str(value)]
+        process = subprocess.run(
+            command, cwd=ROOT / scenario.directory, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip().splitlines()[-1] if process.stderr.strip()
+                               else f"worker exited with {process.returncode}")
+        endpoints = json.loads(output.read_text(encoding="utf-8"))
+    return {"app": scenario.directory, "config": config, "endpoints": endpoints}
+
+
+def compare(baseline: Dict[str, Any], result: Dict[str, Any], threshold: float) -> List[str]:
+    """기준값 대비 threshold 비율을 넘는 회귀를 찾습니다.
+
+    Args:
+        baseline: 저장된 기준값
+        result: 이번 측정 결과
+        threshold: 허용 비율 (0.25 = 처리량 25% 감소 / p95 25% 증가까지 허용)
+
+    Returns:
+        List[str]: 회귀 설명 목록 (없으면 빈 리스트)
+    """
+    regressions = []
+    for name, current in result["endpoints"].items():
+        base = baseline["endpoints"].get(name)
+        if base is None:
+            continue
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            regressions.append(f"{name}: throughput {base['throughput_rps']} -> "
+                               f"{current['throughput_rps']} req/s")
+        if current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {base['p95_ms']} -> {current['p95_ms']} ms")
+    return regressions
+
+
+def load_baseline(directory: str) -> Optional[Dict[str, Any]]:
+    path = BASELINE_DIR / f"{directory}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(result: Dict[str, Any]) -> Path:
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{result['app']}.json"
+    path.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"\n{result['app']}")
+    print(f"  {'endpoint':<24} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'vs baseline':>22}")
+    for name, stats in result["endpoints"].items():
+        change = ""
+        base = baseline["endpoints"].get(name) if baseline else None
+        if base:
+            change = (f"{stats['throughput_rps'] / base['throughput_rps'] - 1:+.0%} req/s "
+                      f"{stats['p95_ms'] / base['p95_ms'] - 1:+.0%} p95")
+        print(f"  {name:<24} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.3f} "
+              f"{stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f} {change:>22}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="예제 애플리케이션 ASGI 벤치마크 스위트")
+    parser.add_argument("apps", nargs="*", metavar="app",
+                        help=f"측정할 애플리케이션 번호 ({', '.join(sorted(SCENARIOS))}, 생략하면 전체)")
+    parser.add_argument("--requests", type=int, default=300, help="엔드포인트별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=30, help="엔드포인트별 준비 요청 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 요청 수")
+    parser.add_argument("--rows", type=int, default=2000, help="미리 채울 데이터 수")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="회귀로 판단할 비율 (기본 0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="비교하지 않고 측정 결과를 기준값으로 저장")
+    parser.add_argument("--output", help="전체 측정 결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+    unknown = sorted(set(args.apps) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown app(s): {', '.join(unknown)}")
+    if args.threshold < 0:
+        parser.error("--threshold must not be negative")
+
+    config = {"requests": args.requests, "warmup": args.warmup,
+              "concurrency": args.concurrency, "rows": args.rows}
+    results, failures = [], []
+    for key in args.apps or sorted(SCENARIOS):
+        directory = SCENARIOS[key].directory
+        try:
+            result = run_app(key, config)
+        except RuntimeError as exc:
+            print(f"\n{directory}\n  FAILED: {exc}")
+            failures.append(f"{directory}: {exc}")
+            continue
+        results.append(result)
+        if args.update_baseline:
+            print_result(result, None)
+            print(f"  baseline saved to {save_baseline(result).relative_to(ROOT)}")
+            continue
+        baseline = load_baseline(directory)
+        if baseline is not None and baseline["config"] != config:
+            print(f"\n{directory}: baseline was recorded with {baseline['config']}, not comparing")
+            baseline = None
+        print_result(result, baseline)
+        if baseline is None:
+            continue
+        for regression in compare(baseline, result, args.threshold):
+            print(f"  REGRESSION {regression}")
+            failures.append(f"{directory}: {regression}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n",
+                                     encoding="utf-8")
+    if failures:
+        print(f"\n{len(failures)} failure(s) (threshold {args.threshold:.0%})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
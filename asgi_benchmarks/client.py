@@ -0,0 +1,145 @@
+# 프로세스 내 ASGI 클라이언트
+# 네트워크 소켓과 서버 없이 ASGI 애플리케이션을 직접 호출합니다.
+# 측정값에 HTTP 클라이언트/서버의 오버헤드가 섞이지 않으므로 애플리케이션 자체의 비용만 비교할 수 있습니다.
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+ASGIApp = Callable[[Dict[str, Any], Callable[[], Awaitable[Dict[str, Any]]],
+                    Callable[[Dict[str, Any]], Awaitable[None]]], Awaitable[None]]
+
+
+class Response:
+    """ASGI 호출 결과 (상태 코드, 헤더, 본문)"""
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        self.status = status
+        self.headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in headers}
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ASGIClient:
+    """ASGI 애플리케이션을 같은 이벤트 루프에서 직접 호출하는 클라이언트
+
+    async with 블록에 들어갈 때 lifespan startup을, 나올 때 shutdown을 실행합니다.
+    (lifespan을 지원하지 않는 애플리케이션이면 건너뜀)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._lifespan_task: Optional[asyncio.Task] = None
+        self._lifespan_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._lifespan_events: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    async def __aenter__(self) -> "ASGIClient":
+        await self._lifespan("startup")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._lifespan("shutdown")
+        if self._lifespan_task is not None:
+            await self._lifespan_task
+
+    async def _lifespan(self, event: str) -> None:
+        if self._lifespan_task is None:
+            if event != "startup":
+                return
+
+            async def run() -> None:
+                try:
+                    await self.app({"type": "lifespan", "asgi": {"version": "3.0"}},
+                                   self._lifespan_queue.get, self._lifespan_events.put)
+                except Exception:
+                    # lifespan을 지원하지 않는 애플리케이션
+                    await self._lifespan_events.put({"type": "lifespan.unsupported"})
+
+            self._lifespan_task = asyncio.ensure_future(run())
+        await self._lifespan_queue.put({"type": f"lifespan.{event}"})
+        message = await self._lifespan_events.get()
+        if message["type"] == "lifespan.unsupported":
+            self._lifespan_task = None
+        elif message["type"] != f"lifespan.{event}.complete":
+            raise RuntimeError(f"lifespan {event} failed: {message.get('message', message)}")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        form: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """요청 하나를 보내고 응답이 끝날 때까지 기다립니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 경로와 쿼리 문자열 (예: "/books/?limit=10")
+            json_body: JSON으로 보낼 본문
+            form: application/x-www-form-urlencoded로 보낼 본문
+            headers: 추가 요청 헤더
+
+        Returns:
+            Response: 상태 코드, 헤더, 본문
+        """
+        parts = urlsplit(url)
+        request_headers = [(b"host", b"testserver")]
+        body = b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            request_headers.append((b"content-type", b"application/json"))
+        elif form is not None:
+            body = urlencode(form).encode("utf-8")
+            request_headers.append((b"content-type", b"application/x-www-form-urlencoded"))
+        request_headers.append((b"content-length", str(len(body)).encode()))
+        for key, value in (headers or {}).items():
+            request_headers.append((key.lower().encode("latin-1"), value.encode("latin-1")))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "root_path": "",
+            "headers": request_headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        request_sent = False
+        response_done = asyncio.Event()
+        status = 0
+        response_headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # StreamingResponse 등은 연결 종료를 기다리므로 응답이 끝난 뒤에 끊김을 알림
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_done.set()
+        return Response(status, response_headers, b"".join(chunks))
@@ -0,0 +1,283 @@
+# 예제 애플리케이션별 벤치마크 시나리오
+# 각 시나리오는 애플리케이션을 임포트해 rows개의 데이터를 미리 채우고(load),
+# 미리 채운 데이터의 id 범위로 측정할 엔드포인트 목록을 만듭니다(endpoints).
+# 시나리오는 해당 프로젝트 디렉터리를 작업 디렉터리로 하는 별도 프로세스에서 실행되므로
+# 여러 프로젝트의 `app` 패키지가 서로 섞이지 않습니다.
+#
+# 요청 i(0부터)가 사용하는 id
+# - 조회/수정: 미리 채운 데이터의 앞쪽 절반을 순환
+# - 삭제: 미리 채운 데이터의 뒤쪽부터 하나씩 (rows >= 2 * 요청 수이므로 조회 대상과 겹치지 않음)
+# - 생성: 미리 채운 데이터 다음 id부터
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from asgi_benchmarks.client import ASGIApp, ASGIClient
+
+
+@dataclass
+class Endpoint:
+    """측정할 엔드포인트 하나
+
+    url과 json_body는 요청 번호 i를 받아 매 요청의 경로와 본문을 만듭니다.
+    """
+
+    name: str
+    method: str
+    url: Callable[[int], str]
+    json_body: Optional[Callable[[int], Any]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    status: int = 200
+
+
+class Ids:
+    """미리 채운 데이터 first ~ first + rows - 1에서 요청별 id를 고릅니다."""
+
+    def __init__(self, first: int, rows: int):
+        self.first = first
+        self.rows = rows
+
+    def read(self, i: int) -> int:
+        return self.first + i % (self.rows // 2)
+
+    def delete(self, i: int) -> int:
+        return self.first + self.rows - 1 - i
+
+    def new(self, i: int) -> int:
+        return self.first + self.rows + i
+
+
+@dataclass
+class Scenario:
+    directory: str
+    load: Callable[[int], Tuple[ASGIApp, Ids]]
+    endpoints: Callable[[ASGIClient, Ids], Awaitable[List[Endpoint]]]
+
+
+def _use_temp_database(prefix: str, **env: str) -> str:
+    """임시 SQLite 데이터베이스와 설정을 환경 변수로 지정합니다. (애플리케이션 임포트 전에 호출)"""
+    db_dir = tempfile.mkdtemp(prefix=prefix)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_dir}/bench.db"
+    for key, value in env.items():
+        os.environ.setdefault(key, value)
+    return db_dir
+
+
+async def _login(client: ASGIClient, url: str, username: str, password: str) -> Dict[str, str]:
+    response = await client.request("POST", url, form={"username": username, "password": password})
+    if response.status != 200:
+        raise RuntimeError(f"login failed: {response.status} {response.body[:200]!r}")
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+# 0. FastAPI 기초 ---------------------------------------------------------------
+
+def load_basic(rows: int) -> Tuple[ASGIApp, Ids]:
+    from basic.app import app
+    return app, Ids(1, rows)
+
+
+async def basic_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    return [Endpoint("GET /", "GET", lambda i: "/")]
+
+
+# 1. 기본 CRUD (인메모리 BookStore) ------------------------------------------------
+
+def load_basic_crud(rows: int) -> Tuple[ASGIApp, Ids]:
+    import main
+    from main import Book, BookStore
+
+    main.books = BookStore()
+    for i in range(1, rows + 1):
+        main.books.add(Book.construct(id=i, title=f"Book {i}", author=f"Author {i % 97}",
+                                      published_year=2000 + i % 25, isbn=f"isbn-{i}",
+                                      description=None))
+    return main.app, Ids(1, rows)
+
+
+def _book(book_id: int, isbn: str, **extra: Any) -> Dict[str, Any]:
+    return {"id": book_id, "title": f"Book {book_id}", "author": f"Author {book_id % 97}",
+            "published_year": 2024, "isbn": isbn, **extra}
+
+
+async def basic_crud_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    return [
+        Endpoint("GET /books/", "GET", lambda i: "/books/"),
+        Endpoint("GET /books/{id}", "GET", lambda i: f"/books/{ids.read(i)}"),
+        Endpoint("POST /books/", "POST", lambda i: "/books/",
+                 lambda i: _book(ids.new(i), f"bench-{ids.new(i)}")),
+        Endpoint("PUT /books/{id}", "PUT", lambda i: f"/books/{ids.read(i)}",
+                 lambda i: _book(ids.read(i), f"isbn-{ids.read(i)}", description=f"updated {i}")),
+        Endpoint("DELETE /books/{id}", "DELETE", lambda i: f"/books/{ids.delete(i)}"),
+    ]
+
+
+# 2. 구조화된 프로젝트 (BookService) -----------------------------------------------
+
+def load_structured(rows: int) -> Tuple[ASGIApp, Ids]:
+    from app.main import app
+    from app.models.book import Book
+    from app.routers.book_router import get_book_service
+
+    service = get_book_service()
+    first = max(book.id for book in service.get_all_books()) + 1
+    for book_id in range(first, first + rows):
+        service.create_book(Book(**_book(book_id, f"isbn-{book_id}")))
+    return app, Ids(first, rows)
+
+
+async def structured_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    return [
+        Endpoint("GET /books/", "GET", lambda i: "/books/"),
+        Endpoint("GET /books/?author=", "GET", lambda i: f"/books/?author=Author%20{i % 97}"),
+        Endpoint("GET /books/{id}", "GET", lambda i: f"/books/{ids.read(i)}"),
+        Endpoint("POST /books/", "POST", lambda i: "/books/",
+                 lambda i: _book(ids.new(i), f"bench-{ids.new(i)}")),
+        Endpoint("PUT /books/{id}", "PUT", lambda i: f"/books/{ids.read(i)}",
+                 lambda i: _book(ids.read(i), f"isbn-{ids.read(i)}", description=f"updated {i}")),
+        Endpoint("DELETE /books/{id}", "DELETE", lambda i: f"/books/{ids.delete(i)}"),
+    ]
+
+
+# 3. 고급 기능 (SQLite + JWT) -----------------------------------------------------
+
+def load_advanced(rows: int) -> Tuple[ASGIApp, Ids]:
+    _use_temp_database("bench_fastapi_advanced_", PROJECT_NAME="Advanced Book Management System",
+                       FIRST_SUPERUSER="admin@example.com", FIRST_SUPERUSER_PASSWORD="admin123",
+                       BCRYPT_ROUNDS="4")
+    from sqlalchemy import func, select
+
+    from app.core.config import settings
+    from app.crud.user import get_user_by_email
+    from app.db.base import SessionLocal, engine
+    from app.db.models.book import Book
+    from app.initial_data import init, init_db
+    from app.main import app
+
+    init_db()
+    init()
+    db = SessionLocal()
+    try:
+        owner_id = get_user_by_email(db, email=settings.FIRST_SUPERUSER).id
+    finally:
+        db.close()
+    with engine.begin() as conn:
+        first = (conn.execute(select(func.max(Book.id))).scalar() or 0) + 1
+        conn.execute(Book.__table__.insert(), [
+            {"id": book_id, "title": f"Book {book_id}", "author": f"Author {book_id % 97}",
+             "published_year": 2000 + book_id % 25, "isbn": f"isbn-{book_id}",
+             "description": "benchmark seed", "user_id": owner_id}
+            for book_id in range(first, first + rows)
+        ])
+    return app, Ids(first, rows)
+
+
+async def advanced_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    from app.core.config import settings
+
+    headers = await _login(client, f"{settings.API_V1_STR}/login/access-token",
+                           settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD)
+    books = f"{settings.API_V1_STR}/books"
+
+    def new_book(i: int) -> Dict[str, Any]:
+        book = _book(ids.new(i), f"bench-{ids.new(i)}")
+        del book["id"]
+        return book
+
+    return [
+        Endpoint("GET /books/", "GET", lambda i: f"{books}/?limit=100", headers=headers),
+        Endpoint("GET /books/page", "GET", lambda i: f"{books}/page?limit=100", headers=headers),
+        Endpoint("GET /books/search", "GET", lambda i: f"{books}/search?q=author", headers=headers),
+        Endpoint("GET /books/{id}", "GET", lambda i: f"{books}/{ids.read(i)}", headers=headers),
+        Endpoint("POST /books/", "POST", lambda i: f"{books}/", new_book, headers=headers),
+        Endpoint("PUT /books/{id}", "PUT", lambda i: f"{books}/{ids.read(i)}",
+                 lambda i: {"description": f"updated {i}"}, headers=headers),
+        Endpoint("DELETE /books/{id}", "DELETE", lambda i: f"{books}/{ids.delete(i)}",
+                 headers=headers),
+        Endpoint("GET /users/me", "GET", lambda i: f"{settings.API_V1_STR}/users/me",
+                 headers=headers),
+    ]
+
+
+# 4. 구조화된 보일러플레이트 (ItemService) ------------------------------------------
+
+def load_boilerplate_structured(rows: int) -> Tuple[ASGIApp, Ids]:
+    from app.main import app
+    from app.models.item import ItemCreate
+    from app.routers.item_router import item_service
+
+    for i in range(1, rows + 1):
+        item_service.create_item(ItemCreate(name=f"Item {i}", description="benchmark seed"))
+    return app, Ids(1, rows)
+
+
+async def boilerplate_structured_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    def item(i: int) -> Dict[str, Any]:
+        return {"name": f"Item {i}", "description": f"updated {i}"}
+
+    return [
+        Endpoint("GET /items/", "GET", lambda i: "/items/"),
+        Endpoint("GET /items/?cursor", "GET", lambda i: f"/items/?cursor={ids.read(i)}"),
+        Endpoint("GET /items/{id}", "GET", lambda i: f"/items/{ids.read(i)}"),
+        Endpoint("POST /items/", "POST", lambda i: "/items/", item),
+        Endpoint("PUT /items/{id}", "PUT", lambda i: f"/items/{ids.read(i)}", item),
+        Endpoint("DELETE /items/{id}", "DELETE", lambda i: f"/items/{ids.delete(i)}"),
+    ]
+
+
+# 5. 고급 보일러플레이트 (SQLite + JWT + CRUDBase) -----------------------------------
+
+def load_boilerplate_advanced(rows: int) -> Tuple[ASGIApp, Ids]:
+    _use_temp_database("bench_fastapi_boilerplate_advanced_", PROJECT_NAME="FastAPI Advanced Boilerplate",
+                       ENVIRONMENT="benchmark", FIRST_SUPERUSER="admin@example.com",
+                       FIRST_SUPERUSER_PASSWORD="admin123", BCRYPT_ROUNDS="4",
+                       PASSWORD_HASH_WORKERS="0")
+    from sqlalchemy import func, select
+
+    from app.core.security import get_password_hash
+    from app.db.session import engine
+    from app.initial_data import init
+    from app.main import app
+    from app.models.user import User
+
+    init()
+    hashed_password = get_password_hash("user1234")
+    with engine.begin() as conn:
+        first = (conn.execute(select(func.max(User.id))).scalar() or 0) + 1
+        conn.execute(User.__table__.insert(), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "hashed_password": hashed_password,
+             "full_name": f"User {user_id}", "is_active": True, "is_superuser": False}
+            for user_id in range(first, first + rows)
+        ])
+    return app, Ids(first, rows)
+
+
+async def boilerplate_advanced_endpoints(client: ASGIClient, ids: Ids) -> List[Endpoint]:
+    from app.core.config import settings
+
+    headers = await _login(client, f"{settings.API_V1_STR}/login/access-token",
+                           settings.FIRST_SUPERUSER, settings.FIRST_SUPERUSER_PASSWORD)
+    users = f"{settings.API_V1_STR}/users"
+    return [
+        Endpoint("GET /users/", "GET", lambda i: f"{users}/?limit=100", headers=headers),
+        Endpoint("GET /users/me", "GET", lambda i: f"{users}/me", headers=headers),
+        Endpoint("GET /users/{id}", "GET", lambda i: f"{users}/{ids.read(i)}", headers=headers),
+        Endpoint("POST /users/", "POST", lambda i: f"{users}/",
+                 lambda i: {"email": f"bench{i}@example.com", "password": "bench1234"},
+                 headers=headers),
+        Endpoint("PUT /users/{id}", "PUT", lambda i: f"{users}/{ids.read(i)}",
+                 lambda i: {"full_name": f"Updated {i}"}, headers=headers),
+    ]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "0": Scenario("0.fastapi_basic", load_basic, basic_endpoints),
+    "1": Scenario("1.fastapi_basic_crud", load_basic_crud, basic_crud_endpoints),
+    "2": Scenario("2.fastapi_structured", load_structured, structured_endpoints),
+    "3": Scenario("3.fastapi_advanced", load_advanced, advanced_endpoints),
+    "4": Scenario("4.fastapi_boilerplate_structured", load_boilerplate_structured,
+                  boilerplate_structured_endpoints),
+    "5": Scenario("5.fastapi_boilerplate_advanced", load_boilerplate_advanced,
+                  boilerplate_advanced_endpoints),
+}
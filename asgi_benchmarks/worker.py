@@ -0,0 +1,96 @@
+# 애플리케이션 하나를 측정하는 작업 프로세스
+# 프로젝트 디렉터리를 작업 디렉터리로 하여 실행되며 (python -m asgi_benchmarks 가 실행함)
+# 결과를 JSON 파일로 저장합니다.
+#
+# 직접 실행 (프로젝트 디렉터리에서, 저장소 루트를 PYTHONPATH에 추가):
+#   PYTHONPATH=.. python -m asgi_benchmarks.worker 3 --output result.json
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from asgi_benchmarks.client import ASGIClient
+from asgi_benchmarks.scenarios import SCENARIOS, Endpoint
+
+
+async def call(client: ASGIClient, endpoint: Endpoint, i: int) -> None:
+    """엔드포인트에 i번째 요청을 보내고 상태 코드를 확인합니다."""
+    response = await client.request(
+        endpoint.method,
+        endpoint.url(i),
+        json_body=endpoint.json_body(i) if endpoint.json_body else None,
+        headers=endpoint.headers,
+    )
+    if response.status != endpoint.status:
+        raise RuntimeError(
+            f"{endpoint.name} (request {i}): expected {endpoint.status}, "
+            f"got {response.status} {response.body[:200]!r}"
+        )
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """지연 시간(밀리초) 목록과 전체 소요 시간(초)으로 처리량과 백분위수를 계산합니다."""
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+    }
+
+
+async def measure(
+    client: ASGIClient, endpoint: Endpoint, warmup: int, requests: int, concurrency: int
+) -> Dict[str, float]:
+    """warmup번 요청한 뒤, concurrency개의 동시 요청으로 requests번 요청하며 측정합니다."""
+    for i in range(warmup):
+        await call(client, endpoint, i)
+    # 동시 요청들이 공유하는 요청 번호 (각 번호는 한 번만 사용됨)
+    indexes = iter(range(warmup, warmup + requests))
+    latencies: List[float] = []
+
+    async def run() -> None:
+        for i in indexes:
+            start = time.perf_counter()
+            await call(client, endpoint, i)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start)
+
+
+async def run_scenario(key: str, rows: int, warmup: int, requests: int, concurrency: int) -> Dict[str, Any]:
+    scenario = SCENARIOS[key]
+    app, ids = scenario.load(rows)
+    results = {}
+    async with ASGIClient(app) as client:
+        for endpoint in await scenario.endpoints(client, ids):
+            results[endpoint.name] = await measure(client, endpoint, warmup, requests, concurrency)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="애플리케이션 하나의 엔드포인트별 성능 측정")
+    parser.add_argument("app", choices=sorted(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    # 조회 대상과 삭제 대상이 겹치지 않도록 요청 수의 두 배 이상을 미리 채움
+    rows = max(args.rows, 2 * (args.warmup + args.requests))
+    endpoints = asyncio.run(
+        run_scenario(args.app, rows, args.warmup, args.requests, args.concurrency)
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(endpoints, f)
+
+
+if __name__ == "__main__":
+    main()